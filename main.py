@@ -1,6 +1,18 @@
 import argparse
-from work.config import TOKEN
+import json
+import logging
+import os
+import sys
+import tempfile
+from artifactsmmo_wrapper import logger as wrapper_logger
+from work.config import API_BASE_URL, CLIENT, TOKEN
 from work.worker import main_loop
+from work import runner
+from work.metrics import start_metrics_server
+from work.character import set_client
+from work.journal import ActionJournal
+from work.log import parse_sample_rates, setup_logging
+from work.session import install_wrapper_session, set_api_base_url, share_rate_limits
 
 if __name__ == "__main__":
     # Set up argument parsing
@@ -8,21 +20,133 @@ if __name__ == "__main__":
     parser.add_argument(
         "--character",
         type=str,
-        required=True,
         help="The name of the character to run the program for."
     )
     parser.add_argument(
         "--role",
         type=str,
-        required=True,
         help="The role of the character to run the program for."
     )
+    parser.add_argument(
+        "--characters",
+        type=str,
+        help="Run several characters in this process, e.g. baz:fighter,baz1:crafter. Entries without a role use --role."
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve per-action latency and cooldown metrics for Prometheus on this local port."
+    )
+    parser.add_argument(
+        "--journal",
+        type=str,
+        help="Record every request and response to a journal in this directory."
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        help="Replay a recorded journal (file or directory) for --character through --replay-target, without the network."
+    )
+    parser.add_argument(
+        "--replay-target",
+        type=str,
+        default="fill_orders",
+        help="fill_orders, gear_up or craft_item."
+    )
+    parser.add_argument(
+        "--replay-code",
+        type=str,
+        help="The monster for gear_up, the item for craft_item."
+    )
+    parser.add_argument(
+        "--replay-quantity",
+        type=int,
+        default=1,
+        help="How many to craft for craft_item."
+    )
+    parser.add_argument(
+        "--replay-since",
+        type=float,
+        help="Epoch seconds, replay only the requests recorded from then on."
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        help="DEBUG, INFO, WARNING or ERROR; records below it are never formatted."
+    )
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        help="Also write the log to this file, from a background thread."
+    )
+    parser.add_argument(
+        "--log-sample",
+        type=str,
+        default="",
+        help="Keep one in N info records per category, e.g. gear=10,requirements=5,route=20. Rate 1 keeps all."
+    )
+    parser.add_argument(
+        "--rate-limit-dir",
+        type=str,
+        default=os.path.join(tempfile.gettempdir(), "artifacts_rate_limits"),
+        help="Directory of the account's rate limit buckets, shared by every process using it. Empty keeps them per process."
+    )
+    parser.add_argument(
+        "--supervise",
+        action="store_true",
+        help="Restart a character inside this process whenever it stops, with backoff, in place of baz.py."
+    )
+    parser.add_argument(
+        "--failure-dir",
+        type=str,
+        default=".",
+        help="Where --supervise appends each failure and the last log lines, to <character>.txt."
+    )
     args = parser.parse_args()
+    share_rate_limits(args.rate_limit_dir or None)
+
+    setup_logging(getattr(logging, args.log_level.upper()), args.log_file, parse_sample_rates(args.log_sample),
+                  [wrapper_logger.logger])
+
+    if API_BASE_URL:
+        print(f"Using the API at {API_BASE_URL}")
+        set_api_base_url(API_BASE_URL)
+    set_client(CLIENT)
+
+    if args.replay:
+        if not args.character or not args.role:
+            parser.error("--character and --role are required with --replay")
+        from work.replay import replay
+        result = replay(args.replay, args.character, args.role, args.replay_target,
+                        args.replay_code, args.replay_quantity, args.replay_since)
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    # Every character, --character included as baz.py runs it, sends through the pooled, rate limited session
+    install_wrapper_session(ActionJournal(args.journal) if args.journal else None)
+
+    if args.metrics_port is not None:
+        server = start_metrics_server(args.metrics_port)
+        print(f"Metrics at http://127.0.0.1:{server.server_address[1]}/metrics")
+
+    if args.characters:
+        characters = runner.parse_characters(args.characters, args.role)
+        print(f"Starting program for characters: {', '.join(f'{name} ({role})' for name, role in characters)}")
+        runner.main_loop(TOKEN, characters, args.supervise, args.failure_dir)
+    else:
+        if not args.character or not args.role:
+            parser.error("--character and --role are required unless --characters is given")
+
+        if args.supervise:
+            print(f"Supervising character: {args.character}, role {args.role}")
+            runner.main_loop(TOKEN, [(args.character, args.role)], True, args.failure_dir)
+            sys.exit(0)
 
-    # Use the provided character name
-    character_name = args.character
-    role = args.role
-    print(f"Starting program for character: {character_name}, role {role}")
+        # Use the provided character name
+        character_name = args.character
+        role = args.role
+        print(f"Starting program for character: {character_name}, role {role}")
 
-    # Pass the token and character name to the main loop
-    main_loop(TOKEN, character_name, role)
\ No newline at end of file
+        # Pass the token and character name to the main loop
+        main_loop(TOKEN, character_name, role)
@@ -6,11 +6,26 @@ import requests
 import logging
 from typing import Optional, Dict, List, Tuple
 import re
-from artifactsmmo_wrapper import wrapper, logger, ArtifactsAPI
+from artifactsmmo_wrapper import logger, ArtifactsAPI
 from artifactsmmo_wrapper.subclasses import Item, Monster, Resource
+from work.catalog import GameCatalog, get_catalog
+from work.maps import MapIndex, get_map_index
+from work.routes import route
+from work.bank import BankMirror, get_bank_mirror
+from work.scheduler import CooldownScheduler, get_scheduler, parse_timestamp
+from work.gear import SLOTS, GearScorer, get_gear_scorer
+from work.combat import CombatStats, FightPrediction, predict, simulate
+from work.planner import CraftPlanner, get_planner
+from work.metrics import COOLDOWN, GAP, LATENCY, ActionMetrics, get_metrics, timed_action
+from work.character import open_character
+from work.checkpoint import Checkpoint
+from work.food import FoodPlanner, get_food_planner
+from work.journal import seed_entry
+from work.session import current_journal
+from work.log import GEAR, ROUTE, Lazy, log_action, skill_levels
 
 class CharacterAPI:
-    def __init__(self, my_logger: logging.Logger, token: str, character_name: str, role: str):
+    def __init__(self, my_logger: logging.Logger, token: str, character_name: str, role: str, seed: Optional[int] = None):
         """
         Initializes the CharacterAPI with the provided logger, token, and character name.
 
@@ -18,59 +33,91 @@ class CharacterAPI:
             logger (logging.Logger): The logger instance.
             token (str): The bearer token for authorization.
             character_name (str): The name of the character.
+            seed (int): Seeds the character's random choices, a fresh one is drawn and journalled if not given.
         """
         self.logger = my_logger
-        wrapper.token = token
         self.current_character = character_name
         self.role = role
 
-        self.api: ArtifactsAPI = wrapper.character(character_name)
+        # The wrapper's ArtifactsAPI, or the generated client behind the same .char/.actions/.account
+        self.api: ArtifactsAPI = open_character(token, character_name)
+        self.catalog: GameCatalog = get_catalog()
+        self.maps: MapIndex = get_map_index()
+        self.bank: BankMirror = get_bank_mirror()
+        self.scheduler: CooldownScheduler = get_scheduler()
+        self.gear: GearScorer = get_gear_scorer()
+        self.planner: CraftPlanner = get_planner()
+        self.food: FoodPlanner = get_food_planner()
+        self.metrics: ActionMetrics = get_metrics()
+        # Replaced by the character's file-backed one in setup_tasks
+        self.checkpoint: Checkpoint = Checkpoint()
+        self.action_label: Optional[str] = None
+        # The decisions draw from the character's own generator, so a replay can repeat them
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        journal = current_journal()
+        if journal is not None:
+            journal.record(seed_entry(character_name, self.seed))
+        if self.api.char.cooldown_expiration:
+            self.scheduler.set_ready_at(character_name, self.scheduler.to_local(parse_timestamp(self.api.char.cooldown_expiration)))
         logger.setLevel("DEBUG")
 
-    def get_item(self, item_code) -> Item: 
-        item = self.api.items.get(item_code)
-        item_level = 1
+    def act(self, action, *args):
+        """
+        Performs an action once the character is off cooldown and records the new cooldown.
+
+        Args:
+            action: The wrapper action to call, e.g. self.api.actions.move.
+            *args: Arguments for the action.
+        """
+        ready_at = self.scheduler.ready_at(self.current_character)
+        self.scheduler.wait_until_ready(self.current_character)
+        sent = time.time()
         try:
-            if item.level > 0:
-                item_level = item.level
+            response = action(*args)
         except Exception as e:
-            if item.craft is not None:
-                item_level = item.craft.get('level',1)
-            elif item.code == 'old_boots': # not set
-                item_level = 20
-            elif item.code == 'wooden_club': # not set
-                item_level = 25
-        item.level = item_level
-        return item
-    
-    def all_items(self) -> List[Item]:
-        return self.parse_json_fields(self.api.items.get(code=None))
+            if not self.handle_error(e):
+                raise
+            # Cooldown we did not know about, now recorded, so try once more
+            ready_at = self.scheduler.ready_at(self.current_character)
+            self.scheduler.wait_until_ready(self.current_character)
+            sent = time.time()
+            response = action(*args)
+        received = time.time()
+        self.record_action(action, sent, ready_at, response)
+        self.scheduler.update_from_response(self.current_character, response, sent, received)
+        return response
 
-    def parse_json_fields(self, items: List[Item]):
-        for item in items:
-            # Parse `craft` if it's a JSON string
-            if item.craft and isinstance(item.craft, str):
-                try:
-                    item.craft = json.loads(item.craft)
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse 'craft' for item {item.name}: {item.craft}")
-                    item.craft = None  # Set to None if parsing fails
+    def record_action(self, action, sent: float, ready_at: float, response):
+        """
+        Feeds the latency, cooldown and scheduling gap of one request to the metrics.
 
-            # Parse `effects` if it's a JSON string
-            if item.effects and isinstance(item.effects, str):
-                try:
-                    item.effects = json.loads(item.effects)
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse 'effects' for item {item.name}: {item.effects}")
-                    item.effects = None  # Set to None if parsing fails
+        ready_at is the previous cooldown's server expiration on the local clock,
+        corrected for clock offset only, so the gap is our own time and nothing else.
+        """
+        name = self.action_label or getattr(action, '__name__', 'unknown')
+        def observe(metric, value):
+            self.metrics.observe(metric, self.current_character, self.role, name, value)
+        observe(LATENCY, time.time() - sent)
+        # Nothing to measure the gap from until the first cooldown is known
+        if ready_at:
+            observe(GAP, sent - ready_at)
+        if isinstance(response, dict):
+            cooldown = (response.get("data") or {}).get("cooldown") or {}
+            if "total_seconds" in cooldown:
+                observe(COOLDOWN, cooldown["total_seconds"])
 
-        return items
+    def get_item(self, item_code) -> Item: 
+        return self.catalog.item(item_code)
+    
+    def all_items(self) -> List[Item]:
+        return list(self.catalog.items.values())
 
     def all_monsters(self) -> List[Monster]:
-        return self.api.monsters.all_monsters
+        return list(self.catalog.monsters.values())
     
     def all_resources(self) -> List[Resource]:
-        return self.api.resources.all_resources
+        return list(self.catalog.resources.values())
     
     def deposit_all_inventory_to_bank(self):
         """
@@ -91,15 +138,16 @@ class CharacterAPI:
                 continue
 
             try:
-                self.api.actions.bank_deposit_item(code, quantity)
+                response = self.act(self.api.actions.bank_deposit_item, code, quantity)
             except:
                 x,y = self.find_closest_content('bank','bank')
                 self.move_character(x,y)
-                self.api.actions.bank_deposit_item(code, quantity)
+                response = self.act(self.api.actions.bank_deposit_item, code, quantity)
+            self.update_bank(code, quantity, response)
 
             if self.api.char.gold > 0:
                 self.logger.info(f"deposit {self.api.char.gold} gold")
-                self.api.actions.bank_deposit_gold(self.api.char.gold)
+                self.act(self.api.actions.bank_deposit_gold, self.api.char.gold)
 
         self.logger.info(f"{self.current_character}: All items deposited into the bank.")
 
@@ -129,39 +177,77 @@ class CharacterAPI:
         contents = self.get_bank_contents()
         self.logger.info(f"gear_up for {monster}, got bank contents")
 
-        slots = {
-            'weapon': ['weapon_slot'],
-            'rune': ['rune_slot'],
-            'shield': ['shield_slot'],
-            'helmet': ['helmet_slot'],
-            'body_armor': ['body_armor_slot'],
-            'leg_armor': ['leg_armor_slot'],
-            'boots': ['boots_slot'],
-            'ring': ['ring1_slot','ring2_slot'],
-            'amulet': ['amulet_slot'],
-            'bag': ['bag_slot'],
-            'artifact': ['artifact1_slot','artifact2_slot','artifact3_slot']
-        }
-
-        weapon_chosen = False
-        weapon_attack_elements = []
-        for slot in slots.keys():
-            self.gear_up_slot(slot, slots[slot], contents, attack_elements, defense_elements, [], weapon_attack_elements)
-            if not weapon_chosen:
-                # weapon first, choose the rest based on the attack
-                weapon_chosen = True
-                weapon_code = self.api.char.weapon_slot
-                weapon = self.get_item(weapon_code)
-                for effect in weapon.effects:
-                    if effect.code.startswith('attack_'):
-                        attack_element = effect.code.replace("attack_","")
-                        weapon_attack_elements.append(attack_element)
+        # Weight the gear by how long the fight is expected to last
+        estimated_rounds = predict(CombatStats.from_character(self.api.char, rested=True), monster).rounds
+
+        # One scoring pass over the whole bank, then equip whatever changed
+        banned_items = []
+        for _ in range(3):
+            equipped = self.equipped_slots()
+            loadout, weapon_attack_elements = self.gear.best_loadout(
+                monster, self.get_bank_contents(), equipped, self.api.char.level, banned_items, estimated_rounds)
+            failed = False
+            for slot, best_item_code in loadout.items():
+                if not best_item_code or equipped.get(slot) == best_item_code:
+                    continue
+                equipped_item = False
+                if self.withdraw_from_bank(best_item_code, 1):
+                    slot_name = slot.replace('_slot','')
+                    self.unequip(slot_name)
+                    if self.equip(best_item_code, slot_name):
+                        equipped_item = True
+                if not equipped_item:
+                    self.logger.info(f"\n\nERROR\n\n\ngear_up could not equip {best_item_code}, probably not really in the bank")
+                    banned_items.append(best_item_code)
+                    failed = True
+            if not failed:
+                break
 
+        weapon_code = self.api.char.weapon_slot
         self.logger.info(f"gear_up with main weapon {weapon_code} attack elements {weapon_attack_elements}")
         self.deposit_all_inventory_to_bank()
-        self.get_consumables(contents, attack_elements, defense_elements, weapon_attack_elements)
+        self.get_consumables(contents, attack_elements, defense_elements, weapon_attack_elements, estimated_rounds)
+
+        prediction = predict(CombatStats.from_character(self.api.char, rested=True), monster)
+        self.logger.info(f"gear_up predicts {prediction}")
+        self.checkpoint.save(loadout=self.loadout())
+        return prediction
+
+    def equipped_slots(self) -> Dict[str, str]:
+        return {slot: self.get_slot(slot) for slots in SLOTS.values() for slot in slots}
 
-    def get_consumables(self, contents, attack_elements, defense_elements, weapon_attack_elements: List):
+    def loadout(self) -> Dict[str, str]:
+        """Everything equipped, gear and utilities, by slot attribute e.g. 'helmet_slot'."""
+        loadout = self.equipped_slots()
+        for slot in ('utility1_slot', 'utility2_slot'):
+            loadout[slot] = self.get_slot(slot)
+        return loadout
+
+    def predict_fights(self, monsters: List[Monster]) -> List[FightPrediction]:
+        """
+        Predicts fights against each monster in the best gear the bank holds, without taking any action.
+
+        Args:
+            monsters (List[Monster]): The monsters to consider.
+
+        Returns:
+            List[FightPrediction]: One prediction per monster.
+        """
+        if not monsters:
+            return []
+        current = CombatStats.from_character(self.api.char, rested=True)
+        contents = self.get_bank_contents()
+        equipped = self.equipped_slots()
+        fighters = []
+        for monster, first_guess in zip(monsters, simulate([current], monsters)):
+            loadout, _ = self.gear.best_loadout(monster, contents, equipped, self.api.char.level, estimated_rounds=first_guess.rounds)
+            changed = [slot for slot, code in loadout.items() if code and code != equipped.get(slot)]
+            fighters.append(current.swap(
+                [self.get_item(equipped[slot]) for slot in changed if equipped.get(slot)],
+                [self.get_item(loadout[slot]) for slot in changed]))
+        return simulate(fighters, monsters)
+
+    def get_consumables(self, contents, attack_elements, defense_elements, weapon_attack_elements: List, estimated_rounds: int = 40):
         character_data = self.get_character()
         if self.role == 'fighter':
             best_items = {}
@@ -178,11 +264,11 @@ class CharacterAPI:
             for item_dict in contents:
                 item_code = item_dict['code']
                 item = self.get_item(item_code)
-                if item.type != 'utility':
+                if item is None or item.type != 'utility':
                     continue
 
                 if item.level != None and item.level > character_data.level:
-                    self.logger.info(f"get_consumables item {item.code} is too high level {item.level} for me at {self.api.char.level}")
+                    self.logger.info("get_consumables item %s is too high level %s for me at %s", item.code, item.level, self.api.char.level, extra=GEAR)
                     continue
                 
                 for best_key in best_items.keys():
@@ -190,7 +276,7 @@ class CharacterAPI:
                     best_item = None
                     if best_item_code:
                         best_item = self.get_item(best_item_code)
-                    if self.item_better(best_item, item, attack_elements, defense_elements, weapon_attack_elements):
+                    if self.item_better(best_item, item, attack_elements, defense_elements, weapon_attack_elements, estimated_rounds):
                         if best_key == 'utility1_slot':
                             if best_items['utility2_slot'] != item.code:
                                 best_items[best_key] = item.code
@@ -206,13 +292,13 @@ class CharacterAPI:
                     self.logger.info(f"get_consumables switch from {current} to {best_item_code} in slot {slot}")
                     if current:
                         if slot == 'utility1_slot':
-                            self.api.actions.unequip_item('utility1', self.api.char.utility1_slot_quantity)
+                            self.act(self.api.actions.unequip_item, 'utility1', self.api.char.utility1_slot_quantity)
                         else:
-                            self.api.actions.unequip_item('utility2', self.api.char.utility2_slot_quantity)
-                    quantity = self.withdraw_all(best_item_code, contents)
+                            self.act(self.api.actions.unequip_item, 'utility2', self.api.char.utility2_slot_quantity)
+                    quantity = self.withdraw_all(best_item_code)
                     if quantity > 0:
                         slot_name = slot.replace('_slot','')
-                        if self.api.actions.equip_item(best_item_code, slot_name, quantity):
+                        if self.act(self.api.actions.equip_item, best_item_code, slot_name, quantity):
                             equipped = True
                     if not equipped:
                         self.logger.info(f"\n\nERROR\n\nget_consumables could not equip {best_item_code}, probably not really in the bank")
@@ -223,103 +309,45 @@ class CharacterAPI:
                         current_quantity = self.api.char.utility1_slot_quantity
                     else:
                         current_quantity = self.api.char.utility2_slot_quantity
-                    taken = self.withdraw_all(current, contents)
+                    taken = self.withdraw_all(current)
                     ideal_amount = 100 - current_quantity
                     quantity = min(ideal_amount, taken)
                     if quantity == 0:
                         self.logger.info(f"no more {current} to add")
                         continue
                     slot_name = slot.replace('_slot','')
-                    self.api.actions.equip_item(current, slot_name, quantity)
+                    self.act(self.api.actions.equip_item, current, slot_name, quantity)
 
         self.deposit_all_inventory_to_bank()
         for item_dict in contents:
             item = self.get_item(item_dict['code'])
-            if item.level != None and item.level > character_data.level:
+            if item is None or item.level > character_data.level:
                 continue
             if item.type == 'consumable' and item.subtype == 'food':
                 self.logger.info(f"load up on {item.code}")
-                self.withdraw_all(item.code, contents)
-
-    def gear_up_slot(self, slot_type, slots, contents, attack_elements, defense_elements, banned_items: List, weapon_attack_elements: List):
-        best_items = self.find_best_item(slot_type, slots, contents, attack_elements, defense_elements, banned_items, weapon_attack_elements)
-        for slot in best_items.keys():
-            best_item_code = best_items[slot]
-            current = self.get_slot(slot)
-            if current != best_item_code:
-                equipped = False
-                if self.withdraw_from_bank(best_item_code, 1):
-                    slot_name = slot.replace('_slot','')
-                    self.unequip(slot_name)
-                    if self.equip(best_item_code, slot_name):
-                        equipped = True
-                if not equipped:
-                    self.logger.info(f"\n\nERROR\n\n\ngear_up_slot could not equip {best_item_code}, probably not really in the bank")
-                    banned_items.append(best_item_code)
-                    self.gear_up_slot(slot_type, slots, contents, attack_elements, defense_elements, banned_items, weapon_attack_elements)
+                self.withdraw_all(item.code)
 
-    def find_best_item(self, slot_name, slots, contents, attack_elements, defense_elements, banned_items: List, weapon_attack_elements: List):
-        character_data = self.get_character()
-
-        # Keep a map of slots to the best item for the slot, start with the original ones
-        best_items = {}
-        for slot in slots:
-            try:
-                original_item = getattr(character_data, slot)
-                best_items[slot] = original_item
-            except AttributeError:
-                print(f"find_best_item slot '{slot}' not found.")
-                best_items['slot'] = None
-                return
-
-        # Iterate everything looking for best items
-        for item_dict in contents:
-            item_code = item_dict['code']
-            if item_code in banned_items:
-                self.logger.info(f"find_best_item {item_code} banned")
-                continue
-
-            item = self.get_item(item_code)
-
-            if item.type != slot_name:
-                continue
-
-            if item.level > character_data.level:
-                self.logger.info(f"item {item.code} is too high level {item.level} for me at {self.api.char.level}")
-                continue
-            
-            for best_key in best_items.keys():
-                best_item_code = best_items[best_key]
-                best_item = None
-                if best_item_code:
-                    best_item = self.get_item(best_item_code)
-                if self.item_better(best_item, item, attack_elements, defense_elements, weapon_attack_elements):
-                    best_items[best_key] = item.code
-        
-        return best_items
-
-    def item_better(self, best_item, item, attack_elements, defense_elements, weapon_attack_elements: List):
+    def item_better(self, best_item, item, attack_elements, defense_elements, weapon_attack_elements: List, estimated_rounds: int = 40):
         if item.level > self.api.char.level:
-            self.logger.info(f"{item.code} too high level {item.level}")
+            self.logger.info("%s too high level %s", item.code, item.level, extra=GEAR)
             return False
         
         best_total = 0
         best_item_code = "None"
         if best_item:
-            best_total = self.calculate_item_value(best_item, attack_elements, defense_elements, weapon_attack_elements)
+            best_total = self.calculate_item_value(best_item, attack_elements, defense_elements, weapon_attack_elements, estimated_rounds)
             best_item_code = best_item.code
 
-        new_total = self.calculate_item_value(item, attack_elements, defense_elements, weapon_attack_elements)
+        new_total = self.calculate_item_value(item, attack_elements, defense_elements, weapon_attack_elements, estimated_rounds)
         better = new_total > best_total and new_total > 0
         if better:
-            self.logger.info(f"item_better best {best_item_code} = {best_total}, new best {item.code} = {new_total}")
+            self.logger.info("item_better best %s = %s, new best %s = %s", best_item_code, best_total, item.code, new_total, extra=GEAR)
         return better
-    def calculate_item_value(self, item, attack_elements: Dict, defense_elements: Dict, weapon_attack_elements: List):
+    def calculate_item_value(self, item, attack_elements: Dict, defense_elements: Dict, weapon_attack_elements: List, estimated_rounds: int = 40):
         # Samples
         # ogre attack elements: {'air': 0, 'earth': 80, 'fire': 0, 'water': 0}
         # ogre resist elements: {'air': 0, 'earth': 30, 'fire': -20, 'water': 0}
         value = 0
-        estimated_rounds = 40
         for effect in item.effects:
             add = 0
             # Hp once per battle
@@ -391,23 +419,30 @@ class CharacterAPI:
 
         # Special case, always be on the lookout for bandit lizards
         x,y = self.find_closest_content('monster', 'bandit_lizard')
-        if (x, y) != (None, None):
-            closest_monster = self.api.monsters.get('bandit_lizard')
+        lizard = self.catalog.monster('bandit_lizard')
+        if (x, y) != (None, None) and self.predict_fights([lizard])[0].winnable:
+            closest_monster = lizard
             if self.withdraw_all('small_antidote') > 0:
                 self.equip_utility('small_antidote')
         else:
-            monsters = self.api.monsters.get(min_level=target_monster_level,max_level=level-6)
+            monsters = [monster for monster in self.catalog.monsters_between(target_monster_level, level-6)
+                        if self.find_closest_content('monster', monster.code) != (None, None)]
             if not monsters:
                 self.logger.info('No monsters found within the level range')
                 return None
-            
-            while not ((x, y) != (None, None)):
-                closest_monster = random.choice(monsters)
-                self.logger.info(f"check for monster {closest_monster.code}")
-                x,y = self.find_closest_content('monster',closest_monster.code)
+
+            # Only spend fights on monsters we expect to beat
+            predictions = self.predict_fights(monsters)
+            winnable = [monster for monster, prediction in zip(monsters, predictions) if prediction.winnable]
+            if not winnable:
+                self.logger.info(f'No winnable monsters within the level range: {predictions}')
+                return None
+            closest_monster = self.rng.choice(winnable)
             self.logger.info(f'Closest monster found: {closest_monster}')
         
-        self.gear_up(closest_monster)
+        if not self.gear_up(closest_monster).winnable:
+            self.logger.info(f'Not fighting {closest_monster.code}, geared up it still looks like a loss')
+            return None
 
         x,y = self.find_closest_content('monster', closest_monster.code)
         self.move_character(x, y)
@@ -416,34 +451,42 @@ class CharacterAPI:
         return
 
     def find_closest_content(self, content_type: str, content_code: str):
-        maps_data = self.api.maps.get(content_code=content_code, content_type=content_type)
-        self.logger.info(f"closest {content_code} in {maps_data}")
-
         char_x = self.api.char.pos.x
         char_y = self.api.char.pos.y
-        
-        closest_distance = float('inf')
+
         x = None
         y = None
-        
-        # Iterate through all map tiles
-        for tile in maps_data:
-            if tile.content_code != content_code:
-                continue
+        closest = self.maps.closest(char_x, char_y, content_type, content_code)
+        if closest is not None:
+            x, y = closest
 
-            # Calculate the Manhattan distance between the character and the tile
-            distance = abs(tile.x - char_x) + abs(tile.y - char_y)
-            
-            # Update the closest tile if this tile is closer
-            if distance < closest_distance:
-                closest_distance = distance
-                x = tile.x
-                y = tile.y
-        
-        self.logger.info(f"closest {content_type} {content_code} at {x},{y}")
+        self.logger.info("closest %s %s at %s,%s", content_type, content_code, x, y, extra=ROUTE)
         return x,y
 
+    def plan_route(self, stops: List[Tuple[str, str]], end: Optional[Tuple[str, str]] = None) -> List[Tuple[Tuple[str, str], Tuple[int, int]]]:
+        """
+        Plans the shortest walk from here through the given map content.
+
+        Args:
+            stops (List[Tuple[str, str]]): (content_type, content_code) to visit, in any order.
+            end (Tuple[str, str]): Content to finish at, e.g. ('bank', 'bank').
+
+        Returns:
+            List[Tuple[Tuple[str, str], Tuple[int, int]]]: Each stop and the tile to visit, in order, the end last.
+        """
+        path = route(self.maps, (self.api.char.pos.x, self.api.char.pos.y), stops, end)
+        self.logger.info("plan_route %s", Lazy(lambda: [f'{code} at {x},{y}' for (_, code), (x, y) in path]), extra=ROUTE)
+        return path
+
     def get_bank_contents(self) -> List[Dict]:
+        """
+        Returns the bank contents from the local mirror, paging the full bank only when the mirror is stale.
+        """
+        if self.bank.stale:
+            self.bank.seed(self.fetch_bank_contents())
+        return self.bank.contents()
+
+    def fetch_bank_contents(self) -> List[Dict]:
         all_data = []
         page=1
         response = self.api.account.get_bank_items(page = page)
@@ -455,64 +498,68 @@ class CharacterAPI:
             response = self.api.account.get_bank_items(page = page)
             all_data.extend(response.get("data",[]))
         return all_data
+
+    def bank_quantity(self, code: str) -> int:
+        if self.bank.stale:
+            self.get_bank_contents()
+        return self.bank.quantity(code)
+
+    def update_bank(self, code: str, delta: int, response: Optional[Dict]):
+        if not self.bank.apply(code, delta, response):
+            self.logger.info(f"{self.current_character}: bank changed under us, took the bank from the {code} response")
     
-    def withdraw_all_but_5(self, code: str, contents = None) -> int:
-        if not contents:
-            contents = self.get_bank_contents()
+    def withdraw_all_but_5(self, code: str) -> int:
         space = self.api.char.get_inventory_space() - 25
-        for item in contents:
-            if item["code"] == code:
-                quantity = min(item['quantity'],100)
-                take = min(space,quantity-5)
-                if take > 0:
-                    if self.withdraw_from_bank(code,take):
-                        return take
+        quantity = min(self.bank_quantity(code),100)
+        take = min(space,quantity-5)
+        if take > 0:
+            if self.withdraw_from_bank(code,take):
+                return take
         return 0
 
-    def withdraw_all(self, code: str, contents = None) -> int:
-        if not contents:
-            contents = self.get_bank_contents()
+    def withdraw_all(self, code: str) -> int:
         space = self.api.char.get_inventory_space() - 25
-        for item in contents:
-            if item["code"] == code:
-                quantity = min(item['quantity'],100)
-                take = min(space,quantity)
-                if take > 0:
-                    if self.withdraw_from_bank(code,take):
-                        self.logger.info(f"{self.api.char.name}: withdrew {quantity} {code}, {item['quantity']-quantity} remains")
-                        return take
+        in_bank = self.bank_quantity(code)
+        quantity = min(in_bank,100)
+        take = min(space,quantity)
+        if take > 0:
+            if self.withdraw_from_bank(code,take):
+                self.logger.info(f"{self.api.char.name}: withdrew {take} {code}, {in_bank-take} remains")
+                return take
         return 0
 
+    @timed_action('withdraw_from_bank')
     def withdraw_from_bank(self, code: str, quantity: int) -> Optional[Dict]:
         try:
-            response = self.api.actions.bank_withdraw_item(code, quantity)
-            data = response["data"]
-            bank = data.get('bank',[])
-            for item in bank:
-                if item['code'] == code:
-                    quantity_remaining = item.get('quantity',None)
-                    self.logger.info(f"withdraw_from_bank {self.api.char.name} withdrew {quantity} {code}, {quantity_remaining} remains")
-                    break
-
+            response = self.act(self.api.actions.bank_withdraw_item, code, quantity)
+            self.update_bank(code, -quantity, response)
+            self.logger.info(f"withdraw_from_bank {self.api.char.name} withdrew {quantity} {code}, {self.bank.quantity(code)} remains")
             return True
         except Exception as e:
             self.logger.info(f"withdraw_from_bank error {e}")
-            pass
+            self.bank.invalidate()
         return None
     
+    @timed_action('deposit_to_bank')
     def deposit_to_bank(self, code: str, quantity: int) -> Optional[Dict]:
         if (quantity <= 0):
             return
         
         self.logger.info(f"{self.current_character}: Depositing {quantity} of {code} into the bank.")
-        self.api.actions.bank_deposit_item(code, quantity)
+        try:
+            response = self.act(self.api.actions.bank_deposit_item, code, quantity)
+        except:
+            self.bank.invalidate()
+            raise
+        self.update_bank(code, quantity, response)
 
+    @timed_action('recycle')
     def recycle(self, code: str, quantity: int) -> Optional[Dict]:
         if (quantity <= 0):
             return
         
         self.logger.info(f"{self.current_character}: Recycle {quantity} {code}")
-        response = self.api.actions.recycle_item(code, quantity)
+        response = self.act(self.api.actions.recycle_item, code, quantity)
         if response:
             return response
         else:
@@ -548,7 +595,7 @@ class CharacterAPI:
         self.logger.info(f"{self.current_character}: No current task. Requesting a new task...")
         x, y = self.find_taskmaster(fight_task)
         self.move_character(x, y)
-        response = self.api.actions.taskmaster_accept_task()
+        response = self.act(self.api.actions.taskmaster_accept_task)
         if not response:
             self.logger.error(f"{self.current_character}: Failed to request a new task.")
             return None
@@ -576,11 +623,11 @@ class CharacterAPI:
 
     def complete_task(self):
         self.logger.info(f"{self.current_character}: Complete task")
-        self.api.actions.taskmaster_complete_task()
+        self.act(self.api.actions.taskmaster_complete_task)
 
     def trade_task_items(self, code: str, quantity: int):
         self.logger.info(f"{self.current_character}: Trade in {quantity} {code}")
-        response = self.api.actions.taskmaster_trade_task(code, quantity)
+        response = self.act(self.api.actions.taskmaster_trade_task, code, quantity)
 
     def equip_utility(self, code: str):
         existing_quantity = 0
@@ -608,10 +655,11 @@ class CharacterAPI:
 
                 self.logger.info(f"{self.current_character}: Equip {equip_quantity} {code} into {slot}")
                 try:
-                    self.api.actions.equip_item(code, slot, equip_quantity)
+                    self.act(self.api.actions.equip_item, code, slot, equip_quantity)
                 except:
                     pass
 
+    @timed_action('equip')
     def equip(self, code: str, slot: str):
         """
         Equips an item with the specified code into the specified slot.
@@ -621,13 +669,14 @@ class CharacterAPI:
             slot (str): The slot to equip the item into (e.g., "weapon").
         """
         try:
-            response = self.api.actions.equip_item(code, slot)
+            response = self.act(self.api.actions.equip_item, code, slot)
             if response is not None:
                 return True
         except:
             return False
         return False
 
+    @timed_action('craft')
     def craft(self, item_code: str, amount: int = 1):
         """
         Crafts an item with the specified code and waits for the cooldown period.
@@ -638,7 +687,7 @@ class CharacterAPI:
         """
         self.logger.info(f"{self.current_character}: Crafting {item_code} {amount} time(s)")
 
-        response = self.api.actions.craft_item(item_code, amount)
+        response = self.act(self.api.actions.craft_item, item_code, amount)
         if not response:
             self.logger.error(f"{self.current_character}: Failed to craft item.")
             return -1
@@ -650,21 +699,11 @@ class CharacterAPI:
 
         character_json = response.get("data", {}).get("character", {})
 
-        self.logger.info(f"{self.current_character}: Crafted {item_code} for {xp_gained}xp")
-        self.logger.info(f'weaponcraft level {character_json.get("weaponcrafting_level", 0)} {character_json.get("weaponcrafting_xp", 0)}/{character_json.get("weaponcrafting_max_xp", 0)}')
-        self.logger.info(f'gearcraft level {character_json.get("gearcrafting_level", 0)} {character_json.get("gearcrafting_xp", 0)}/{character_json.get("gearcrafting_max_xp", 0)}')
-        self.logger.info(f'jewelrycraft level {character_json.get("jewelrycrafting_level", 0)} {character_json.get("jewelrycrafting_xp", 0)}/{character_json.get("jewelrycrafting_max_xp", 0)}')
-        self.logger.info(f'woodcutting level {character_json.get("woodcutting_level", 0)} {character_json.get("woodcutting_xp", 0)}/{character_json.get("woodcutting_max_xp", 0)}')
-        self.logger.info(f'mining level {character_json.get("mining_level", 0)} {character_json.get("mining_xp", 0)}/{character_json.get("mining_max_xp", 0)}')
-        self.logger.info(f'fishing level {character_json.get("fishing_level", 0)} {character_json.get("fishing_xp", 0)}/{character_json.get("fishing_max_xp", 0)}')
-        self.logger.info(f'alchemy level {character_json.get("alchemy_level", 0)} {character_json.get("alchemy_xp", 0)}/{character_json.get("alchemy_max_xp", 0)}')
-        self.logger.info(f'cooking level {character_json.get("cooking_level", 0)} {character_json.get("cooking_xp", 0)}/{character_json.get("cooking_max_xp", 0)}')
-        if items_crafted:
-            self.logger.info(f"{self.current_character}: Items crafted:")
-            for item in items_crafted:
-                self.logger.info(f"{self.current_character}:   - {item['code']}: {item['quantity']}")
+        log_action(self.logger, self.current_character, 'craft', item=item_code, amount=amount, xp=xp_gained,
+                   items=items_crafted, skills=skill_levels(character_json))
         return xp_gained
 
+    @timed_action('unequip')
     def unequip(self, slot: str):
         """
         Unequips an item from the specified slot.
@@ -681,10 +720,11 @@ class CharacterAPI:
             return
 
         if slot_value:
-            self.api.actions.unequip_item(slot)
+            self.act(self.api.actions.unequip_item, slot)
         else:
             self.logger.info(f"Nothing equipped in {slot_attribute}")
 
+    @timed_action('gather')
     def gather(self, target_quantity: int):
         """
         Makes the character gather resources until the target quantity of the first item is reached.
@@ -700,7 +740,7 @@ class CharacterAPI:
         while gathered_quantity < target_quantity:
             response = None
             try:
-                response = self.api.actions.gather()
+                response = self.act(self.api.actions.gather)
             except:
                 pass
 
@@ -712,32 +752,21 @@ class CharacterAPI:
             items_gathered = details.get("items", [])
 
             character_json = response.get("data", {}).get("character", {})
-            self.logger.info(f'weaponcraft level {character_json.get("weaponcrafting_level", 0)} {character_json.get("weaponcrafting_xp", 0)}/{character_json.get("weaponcrafting_max_xp", 0)}')
-            self.logger.info(f'gearcraft level {character_json.get("gearcrafting_level", 0)} {character_json.get("gearcrafting_xp", 0)}/{character_json.get("gearcrafting_max_xp", 0)}')
-            self.logger.info(f'jewelrycraft level {character_json.get("jewelrycrafting_level", 0)} {character_json.get("jewelrycrafting_xp", 0)}/{character_json.get("jewelrycrafting_max_xp", 0)}')
-            self.logger.info(f'woodcutting level {character_json.get("woodcutting_level", 0)} {character_json.get("woodcutting_xp", 0)}/{character_json.get("woodcutting_max_xp", 0)}')
-            self.logger.info(f'fishing level {character_json.get("fishing_level", 0)} {character_json.get("fishing_xp", 0)}/{character_json.get("fishing_max_xp", 0)}')
-            self.logger.info(f'mining level {character_json.get("mining_level", 0)} {character_json.get("mining_xp", 0)}/{character_json.get("mining_max_xp", 0)}')
-            self.logger.info(f'alchemy level {character_json.get("alchemy_level", 0)} {character_json.get("alchemy_xp", 0)}/{character_json.get("alchemy_max_xp", 0)}')
-            self.logger.info(f'cooking level {character_json.get("cooking_level", 0)} {character_json.get("cooking_xp", 0)}/{character_json.get("cooking_max_xp", 0)}')
-
-            self.logger.info(f"{self.current_character}: Gathered {xp_gained} XP.")
-            if items_gathered:
-                self.logger.info(f"{self.current_character}: Items gathered:")
-                for item in items_gathered:
-                    self.logger.info(f"{self.current_character}:   - {item['code']}: {item['quantity']}")
-                    if first_item_code is None:
-                        first_item_code = item["code"]
-                        self.logger.info(f"{self.current_character}: First item detected: {first_item_code}")
-                    if item["code"] == first_item_code:
-                        gathered_quantity += item["quantity"]
-
-            self.logger.info(f"{self.current_character}: Total {first_item_code} gathered: {gathered_quantity}/{target_quantity}")
+            for item in items_gathered:
+                if first_item_code is None:
+                    first_item_code = item["code"]
+                if item["code"] == first_item_code:
+                    gathered_quantity += item["quantity"]
+            log_action(self.logger, self.current_character, 'gather', xp=xp_gained, items=items_gathered,
+                       item=first_item_code, gathered=gathered_quantity, target=target_quantity,
+                       skills=skill_levels(character_json))
+
             if gathered_quantity >= target_quantity:
                 self.logger.info(f"{self.current_character}: Target quantity of {first_item_code} reached. Exiting gather loop.")
                 return True
         return False
 
+    @timed_action('rest')
     def rest(self):
         """
         Makes the character rest repeatedly until HP is fully restored.
@@ -749,47 +778,54 @@ class CharacterAPI:
             
             self.logger.info(f"{self.current_character}: Resting...")
             if self.api.char.hp != self.api.char.max_hp:
-                self.api.actions.rest()
+                self.act(self.api.actions.rest)
                 self.logger.info(f"{self.current_character}: Rested. HP: {self.api.char.hp}/{self.api.char.max_hp}")
             return
             
     def eat(self):
-        if self.api.char.hp == self.api.char.max_hp:
-            self.logger.info(f"Full health, no need to eat")
-            return True
-        for inventory_item in self.api.char.inventory:
-            item_code = inventory_item.code
-            item = self.api.items.get(item_code)
-
-            if item.level != None and item.level > self.api.level:
-                continue
-
-            if item.type == 'consumable' and item.subtype == 'food':
-                heal_value = 1000
-                if item.effects:
-                    for effect in item.effects:
-                        if effect.code == 'heal':
-                            heal_value = effect.attributes['value']
-                
-                # calculate how much to eat to max out
-                desired_heal = self.api.char.max_hp - self.api.char.hp
-                quantity: int = min(inventory_item.quantity, round((desired_heal / heal_value) + 1))
-
-                self.logger.info(f"{self.current_character}: eat {quantity} {item.code}")
+        """
+        Eats what heals the missing HP most exactly, one use_item per food.
+
+        Food in the inventory comes first; standing at the bank, the bank's
+        food can be withdrawn too, as much as the free space holds. Only the
+        typed client (client = typed) sends a food's whole quantity in one
+        action: the default wrapper sends every use and withdraw as quantity 1,
+        so there each round eats one unit per food and the plan is made again
+        from the character as it now is, until HP is full or eating stops
+        helping. Returns True if HP ends up full.
+        """
+        while True:
+            char = self.api.char
+            deficit = char.max_hp - char.hp
+            if deficit <= 0:
+                self.logger.info(f"Full health, no need to eat")
+                return True
+            inventory = {}
+            for slot in char.inventory:
+                inventory[slot.code] = inventory.get(slot.code, 0) + slot.quantity
+            bank = None
+            if (char.pos.x, char.pos.y) == self.find_closest_content('bank', 'bank'):
+                if self.bank.stale:
+                    self.get_bank_contents()
+                bank = self.bank.snapshot()
+            plan = self.food.plan(deficit, inventory, bank, char.level, char.get_inventory_space())
+            if not plan.eat:
+                return False
+            self.logger.info(f"{self.current_character}: eat {plan.eat} for {plan.healed} of {deficit} missing HP")
+            for code, quantity in plan.withdraw:
+                if not self.withdraw_from_bank(code, quantity):
+                    return False
+            for code, quantity in plan.eat:
                 try:
-                    response = self.api.actions.use_item(item_code, quantity)
-                    if response:
-                        character_json = response.get("data", {}).get("character", {})
-                        hp = character_json['hp']
-                        max_hp = character_json['max_hp']
-                        if (hp != max_hp):
-                            self.logger.info(f"{self.current_character}: Bit peckish stil...what else we got?")
-                            return self.eat()
-                        return True
-                except:
-                    pass
-        return False
+                    self.act(self.api.actions.use_item, code, quantity)
+                except Exception as e:
+                    self.logger.info(f"{self.current_character}: could not eat {quantity} {code}: {e}")
+                    return False
+            if self.api.char.hp <= char.hp:
+                # Nothing went down, do not spend actions on the same plan again
+                return False
 
+    @timed_action('fight')
     def fight(self, combats=1):
         """
         Initiates a fight, waits for the cooldown period, and rests if health is below 50%.
@@ -809,7 +845,7 @@ class CharacterAPI:
                 self.rest()
 
             self.logger.info(f"{self.current_character}: Fight!!!")
-            response = self.api.actions.fight()
+            response = self.act(self.api.actions.fight)
             fight_data = response.get("data", {}).get("fight", {})
             result = fight_data.get("result", "unknown")
             xp_gained = fight_data.get("xp", 0)
@@ -858,7 +894,7 @@ class CharacterAPI:
                     self.rest()
 
             self.logger.info(f"{self.current_character}: Fight!!!")
-            response = self.api.actions.fight()
+            response = self.act(self.api.actions.fight)
             if not response:
                 self.logger.info(f"fight_drop no response Can't beat monster to get {item_code}")
                 return False
@@ -919,6 +955,7 @@ class CharacterAPI:
         """
         return self.api.char
 
+    @timed_action('move_character')
     def move_character(self, x: int, y: int):
         """
         Moves the character to the specified (x, y) position, waits for the cooldown period,
@@ -930,11 +967,11 @@ class CharacterAPI:
         """
         if self.api.char.pos.x == x and self.api.char.pos.y == y:
             return
-        self.api.actions.move(x,y)
+        self.act(self.api.actions.move, x,y)
 
     def exchange_task_coins(self):
         self.logger.info(f"{self.current_character}: exchange task coins")
-        response = self.api.actions.taskmaster_exchange_task()
+        response = self.act(self.api.actions.taskmaster_exchange_task)
         if response:
             self.logger.info(f"{self.current_character}: Exchanged task coins")
             self.logger.info(response)
@@ -946,16 +983,28 @@ class CharacterAPI:
         Args:
             cooldown (Dict): The cooldown details from the API response.
         """
-        remaining_seconds = cooldown.get("remaining_seconds", 0)
+        if self.scheduler.update_from_cooldown(self.current_character, cooldown) is None:
+            self.scheduler.set_ready_in(self.current_character, cooldown.get("remaining_seconds", 0))
+        remaining_seconds = self.scheduler.remaining(self.current_character)
         if remaining_seconds > 0:
-            self.logger.info(f"{self.current_character}: Waiting for cooldown: {remaining_seconds} seconds")
-            time.sleep(remaining_seconds)
-            self.logger.info(f"{self.current_character}: Cooldown period over. Ready for the next action.")
+            self.logger.info(f"{self.current_character}: Cooldown for {remaining_seconds:.1f} seconds, next action waits for it")
         else:
             self.logger.info(f"{self.current_character}: No cooldown. Ready for the next action.")
 
     def handle_error(self, e: Exception):
+        """
+        Returns True when the error was a cooldown, after recording it with the scheduler.
+        """
         self.logger.info("handle error")
+        message = str(e)
+        if "Error 499" in message:
+            # The wrapper raises its own exception carrying the API message
+            match = re.search(r"(\d+\.?\d*) seconds? left", message)
+            if match:
+                cooldown_seconds = float(match.group(1))
+                self.logger.info(f"{self.current_character}: Cooldown detected, next action in {cooldown_seconds} seconds.")
+                self.scheduler.set_ready_in(self.current_character, cooldown_seconds)
+                return True
         if isinstance(e, requests.exceptions.HTTPError):
             if e.response is not None:
                 if e.response.status_code == 499:
@@ -966,8 +1015,8 @@ class CharacterAPI:
                             match = re.search(r"(\d+\.?\d*) seconds left", error_message)
                             if match:
                                 cooldown_seconds = float(match.group(1))
-                                self.logger.info(f"{self.current_character}: Cooldown detected. Waiting for {cooldown_seconds} seconds.")
-                                time.sleep(cooldown_seconds)
+                                self.logger.info(f"{self.current_character}: Cooldown detected, next action in {cooldown_seconds} seconds.")
+                                self.scheduler.set_ready_in(self.current_character, cooldown_seconds)
                                 return True
                             else:
                                 self.logger.error(f"{self.current_character}: Cooldown duration not found in the error message.")
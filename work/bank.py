@@ -0,0 +1,84 @@
+import threading
+from typing import Dict, List, Optional
+
+class BankMirror:
+    """
+    Local copy of the account bank, keyed by item code.
+
+    Seeded from a full /my/bank/items read, then kept current from the
+    deposit and withdraw responses, which carry the whole bank. It is only
+    marked stale, forcing a full re-read, when a bank action fails.
+    """
+    def __init__(self):
+        self._items: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stale = True
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    def invalidate(self):
+        with self._lock:
+            self._stale = True
+
+    def seed(self, contents: List[Dict]):
+        with self._lock:
+            self._replace(contents)
+
+    def _replace(self, contents: List[Dict]):
+        self._items = {item['code']: item['quantity'] for item in contents if item.get('quantity', 0) > 0}
+        self._stale = False
+
+    def quantity(self, code: str) -> int:
+        return self._items.get(code, 0)
+
+    def contents(self) -> List[Dict]:
+        """Returns the bank in the same shape as the /my/bank/items pages."""
+        with self._lock:
+            return [{'code': code, 'quantity': quantity} for code, quantity in self._items.items()]
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._items)
+
+    def apply(self, code: str, delta: int, response: Optional[Dict] = None) -> bool:
+        """
+        Applies a deposit (positive delta) or withdraw (negative delta).
+
+        If the action response includes the bank it replaces the local copy.
+        Returns False when the response did not match the expected quantity,
+        which means another character touched the bank since our last read.
+        """
+        with self._lock:
+            expected = self._items.get(code, 0) + delta
+            bank = None
+            if response:
+                bank = response.get('data', {}).get('bank')
+
+            if bank is None:
+                if expected > 0:
+                    self._items[code] = expected
+                else:
+                    self._items.pop(code, None)
+                return True
+
+            actual = 0
+            for item in bank:
+                if item['code'] == code:
+                    actual = item['quantity']
+                    break
+            self._replace(bank)
+            return actual == expected
+
+_bank_mirror: Optional[BankMirror] = None
+_bank_mirror_lock = threading.Lock()
+
+def get_bank_mirror() -> BankMirror:
+    """Returns the process-wide bank mirror. The bank is shared by every character on the account."""
+    global _bank_mirror
+    if _bank_mirror is None:
+        with _bank_mirror_lock:
+            if _bank_mirror is None:
+                _bank_mirror = BankMirror()
+    return _bank_mirror
@@ -0,0 +1,209 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from work.catalog import DB_FILE_PATH
+
+ROLES = ['fighter', 'forager', 'crafter', 'support', 'tasker']
+QUEUE_SIZES = [10, 1_000, 100_000]
+# Per case: stop after this many runs or this much wall time, whichever comes first
+MAX_RUNS = 200
+MIN_RUNS = 3
+BUDGET_SECONDS = 2.0
+# The character the snapshot is taken for
+LEVEL = 30
+SKILL_LEVEL = 20
+MONSTERS = ['chicken', 'wolf', 'skeleton', 'ogre']
+
+def measure(fn: Callable[[], object], setup: Optional[Callable[[], object]] = None,
+            max_runs: int = MAX_RUNS, budget: float = BUDGET_SECONDS) -> Dict:
+    """
+    Times fn alone, calling setup (untimed) before every run.
+
+    Returns:
+        Dict: Run count and min/median/mean/p95 milliseconds.
+    """
+    samples: List[float] = []
+    deadline = time.perf_counter() + budget
+    while len(samples) < max_runs and (len(samples) < MIN_RUNS or time.perf_counter() < deadline):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "runs": len(samples),
+        "min_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "p95_ms": samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+    }
+
+def bank_snapshot(catalog) -> List[Dict]:
+    """A fixed, well stocked bank: a few of every piece of gear, plenty of every resource."""
+    contents = []
+    for code, item in sorted(catalog.items.items()):
+        if item.type == 'resource':
+            contents.append({"code": code, "quantity": 200})
+        elif item.type != 'currency':
+            contents.append({"code": code, "quantity": 3})
+    return contents
+
+def orders(count: int) -> List[Dict]:
+    return [{"role": ROLES[index % len(ROLES)], "code": f"item_{index}", "quantity": 1 + index % 7}
+            for index in range(count)]
+
+def queue_cases(results: Dict, directory: str, sizes: List[int]):
+    """TaskQueue and SqliteTaskQueue operations, and the fill_orders claim, at each queue size."""
+    from work.task_queue import SqliteTaskQueue, TaskQueue
+
+    banned = [f"item_{index}" for index in range(0, 50, 5)]
+    for size in sizes:
+        queued = orders(size)
+        backends = {
+            "sqlite": SqliteTaskQueue(os.path.join(directory, f"tasks_{size}.db")),
+            "json": TaskQueue(os.path.join(directory, f"tasks_{size}.json")),
+        }
+        for backend, queue in backends.items():
+            queue.clear_tasks()
+            if backend == "json":
+                # Codes are unique, so the merged queue is the list itself; merging 100k one by one is quadratic
+                queue._write_tasks(queued)
+            else:
+                queue.create_tasks(queued)
+            prefix = f"task_queue.{backend}.{size}"
+            results[f"{prefix}.read_tasks"] = measure(queue.read_tasks)
+            results[f"{prefix}.create_tasks"] = measure(
+                lambda: queue.create_tasks([{"role": "fighter", "code": "item_new", "quantity": 1}]),
+                setup=lambda: queue.delete_orders("fighter", "item_new"))
+            results[f"{prefix}.delete_orders"] = measure(
+                lambda: queue.delete_orders("fighter", "item_new"),
+                setup=lambda: queue.create_tasks([{"role": "fighter", "code": "item_new", "quantity": 1}]))
+
+            claimed: List[Dict] = []
+            def claim():
+                claimed[:] = queue.claim_tasks(100, None, banned, first_role='crafter')
+            def put_back():
+                if claimed:
+                    queue.create_tasks(claimed, front=True)
+                    claimed.clear()
+            # The claim fill_orders makes: any role, crafter orders first, banned codes skipped
+            results[f"{prefix}.fill_orders_claim"] = measure(claim, setup=put_back)
+            put_back()
+
+def decision_cases(results: Dict, directory: str):
+    """The planning paths of a real CharacterAPI, against an in-process mock server and a fixed bank."""
+    from work.mock_server import MockWorld, start_mock_server
+    from work.session import install_wrapper_session, set_api_base_url
+
+    world = MockWorld(DB_FILE_PATH, time_scale=1_000_000, seed=1)
+    char = world.character("bench")
+    char["level"] = LEVEL
+    for skill in ('weaponcrafting', 'gearcrafting', 'jewelrycrafting', 'cooking', 'alchemy',
+                  'mining', 'woodcutting', 'fishing'):
+        char[f"{skill}_level"] = SKILL_LEVEL
+    world._refresh_stats(char)
+    server = start_mock_server(world, 0)
+    set_api_base_url(f"http://127.0.0.1:{server.server_address[1]}")
+    install_wrapper_session()
+
+    from artifactsmmo_wrapper import logger as wrapper_logger
+    from work import tasks
+    from work.api import CharacterAPI
+    from work.tasks import choose_lowest_item, has_requirements, setup_tasks
+
+    quiet = logging.getLogger("benchmarks.character")
+    quiet.propagate = False
+    api = CharacterAPI(quiet, "bench", "bench", "crafter")
+    contents = bank_snapshot(api.catalog)
+    world.bank.update({entry["code"]: entry["quantity"] for entry in contents})
+    api.bank.seed(contents)
+    setup_tasks(quiet, "bench", "crafter", api, directory)
+    # CharacterAPI turns the wrapper's request logging up to DEBUG
+    wrapper_logger.setLevel(logging.WARNING)
+
+    for code in MONSTERS:
+        monster = api.catalog.monster(code)
+        if monster is None:
+            continue
+        attack = {element: getattr(monster, f"attack_{element}") for element in ('air', 'earth', 'fire', 'water')}
+        defense = {element: getattr(monster, f"res_{element}") for element in ('air', 'earth', 'fire', 'water')}
+        gear = [api.catalog.item(entry["code"]) for entry in contents]
+        gear = [item for item in gear if item.type not in ('resource', 'consumable')]
+        results[f"calculate_item_value.{code}"] = measure(
+            lambda: [api.calculate_item_value(item, attack, defense, ['earth']) for item in gear])
+        equipped = api.equipped_slots()
+        results[f"gear.best_loadout.{code}"] = measure(
+            lambda: api.gear.best_loadout(monster, contents, equipped, LEVEL))
+
+    for skill in ('weaponcrafting', 'gearcrafting', 'cooking'):
+        results[f"choose_lowest_item.{skill}"] = measure(
+            lambda: choose_lowest_item(api, skill), setup=tasks.current_orders.clear_tasks)
+
+    # More than the bank holds and ordered=True: the bank check alone, no orders, moves or withdrawals
+    for code in ('copper_dagger', 'iron_sword', 'cooked_gudgeon'):
+        item = api.catalog.item(code)
+        if item is None or not item.craft:
+            continue
+        results[f"has_requirements.{code}"] = measure(
+            lambda: has_requirements(api, code, item.craft['items'], True, 10_000))
+
+    for content_type, code in (('bank', 'bank'), ('workshop', 'weaponcrafting'), ('monster', 'ogre'),
+                               ('resource', 'copper_rocks')):
+        results[f"find_closest_content.{content_type}.{code}"] = measure(
+            lambda: api.find_closest_content(content_type, code))
+    server.shutdown()
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(sizes: List[int], groups: List[str]) -> Dict:
+    """
+    Runs the cases of the given groups, 'queues' and/or 'decisions'.
+
+    Returns:
+        Dict: The commit, environment and per-case timings, ready to dump as JSON.
+    """
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="benchmarks-") as directory:
+        if 'queues' in groups:
+            queue_cases(results, directory, sizes)
+        if 'decisions' in groups:
+            decision_cases(results, directory)
+    return {
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the pure-CPU decision paths against fixed snapshots.")
+    parser.add_argument("--output", type=str, default="benchmarks.json", help="Where to write the JSON results.")
+    parser.add_argument("--sizes", type=str, default=",".join(str(size) for size in QUEUE_SIZES),
+                        help="Order queue sizes, comma separated.")
+    parser.add_argument("--group", choices=["all", "queues", "decisions"], default="all",
+                        help="Only the task queue cases, or only the planning paths.")
+    args = parser.parse_args()
+
+    groups = ["queues", "decisions"] if args.group == "all" else [args.group]
+    report = run([int(size) for size in args.sizes.split(",")], groups)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    for name, result in report["results"].items():
+        print(f"{name:60} {result['median_ms']:10.3f} ms median  {result['p95_ms']:10.3f} ms p95  ({result['runs']} runs)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from artifactsmmo_wrapper.subclasses import Item, Monster, Resource
+from artifactsmmo_wrapper.game_data_classes import Drop, Effect
+
+# The wrapper keeps its game data cache here, relative to the repo root
+DB_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "artifacts.db")
+
+# Items the API reports without a level or a recipe
+LEVEL_OVERRIDES = {
+    'old_boots': 20,
+    'wooden_club': 25,
+}
+
+def fix_item_level(item: Item) -> Item:
+    """
+    Fills in a usable level for items the API leaves unset.
+
+    Falls back to the craft level, then to the known overrides, then to 1.
+    """
+    item_level = 1
+    if item.level is not None:
+        if item.level > 0:
+            item_level = item.level
+    elif item.craft is not None:
+        item_level = item.craft.get('level', 1)
+    elif item.code in LEVEL_OVERRIDES:
+        item_level = LEVEL_OVERRIDES[item.code]
+    item.level = item_level
+    return item
+
+def _parse_json(value, default):
+    if not value:
+        return default
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return default
+
+def _parse_drops(value) -> List[Drop]:
+    return [Drop(**drop) for drop in _parse_json(value, [])]
+
+class GameCatalog:
+    """
+    Read-only view of the items, monsters and resources in the wrapper's cache db.
+
+    Everything is loaded and parsed once, so lookups are plain dict hits.
+    """
+    def __init__(self, db_path: str = DB_FILE_PATH):
+        self.db_path = db_path
+        self.items: Dict[str, Item] = {}
+        self.monsters: Dict[str, Monster] = {}
+        self.resources: Dict[str, Resource] = {}
+
+        self.items_by_type: Dict[str, List[Item]] = defaultdict(list)
+        self.items_by_subtype: Dict[tuple, List[Item]] = defaultdict(list)
+        self.items_by_craft_skill: Dict[str, List[Item]] = defaultdict(list)
+        self.monsters_by_drop: Dict[str, List[Monster]] = defaultdict(list)
+        self.resources_by_drop: Dict[str, List[Resource]] = defaultdict(list)
+        self.resources_by_skill: Dict[str, List[Resource]] = defaultdict(list)
+
+        self._load()
+
+    def _load(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        try:
+            for row in connection.execute("SELECT * FROM item_cache"):
+                self._add_item(row)
+            for row in connection.execute("SELECT * FROM monster_cache"):
+                self._add_monster(row)
+            for row in connection.execute("SELECT * FROM resource_cache"):
+                self._add_resource(row)
+        finally:
+            connection.close()
+
+    def _add_item(self, row: sqlite3.Row):
+        effects = [
+            Effect(code=effect['code'], name=effect['code'], description=effect['code'],
+                   attributes={'value': effect['value']} if 'value' in effect else {})
+            for effect in _parse_json(row['effects'], [])
+        ]
+        item = Item(
+            name=row['name'],
+            code=row['code'],
+            type=row['type'],
+            subtype=row['subtype'],
+            description=row['description'],
+            effects=effects,
+            craft=_parse_json(row['craft'], None),
+            tradeable=bool(row['tradeable']),
+            level=row['level'] if 'level' in row.keys() else None,
+        )
+        fix_item_level(item)
+
+        self.items[item.code] = item
+        self.items_by_type[item.type].append(item)
+        self.items_by_subtype[(item.type, item.subtype)].append(item)
+        if item.craft:
+            self.items_by_craft_skill[item.craft.get('skill')].append(item)
+
+    def _add_monster(self, row: sqlite3.Row):
+        monster = Monster(
+            code=row['code'],
+            name=row['name'],
+            level=row['level'],
+            hp=row['hp'],
+            attack_fire=row['attack_fire'],
+            attack_earth=row['attack_earth'],
+            attack_water=row['attack_water'],
+            attack_air=row['attack_air'],
+            res_fire=row['res_fire'],
+            res_earth=row['res_earth'],
+            res_water=row['res_water'],
+            res_air=row['res_air'],
+            min_gold=row['min_gold'],
+            max_gold=row['max_gold'],
+            drops=_parse_drops(row['drops']),
+        )
+        self.monsters[monster.code] = monster
+        for drop in monster.drops:
+            self.monsters_by_drop[drop.code].append(monster)
+
+    def _add_resource(self, row: sqlite3.Row):
+        resource = Resource(
+            code=row['code'],
+            name=row['name'],
+            skill=row['skill'],
+            level=row['level'],
+            drops=_parse_drops(row['drops']),
+        )
+        self.resources[resource.code] = resource
+        self.resources_by_skill[resource.skill].append(resource)
+        for drop in resource.drops:
+            self.resources_by_drop[drop.code].append(resource)
+
+    def item(self, code: str) -> Optional[Item]:
+        return self.items.get(code)
+
+    def monster(self, code: str) -> Optional[Monster]:
+        return self.monsters.get(code)
+
+    def resource(self, code: str) -> Optional[Resource]:
+        return self.resources.get(code)
+
+    def items_of_type(self, item_type: str, subtype: str = None) -> List[Item]:
+        if subtype is None:
+            return self.items_by_type.get(item_type, [])
+        return self.items_by_subtype.get((item_type, subtype), [])
+
+    def craftable_with(self, skill: str) -> List[Item]:
+        return self.items_by_craft_skill.get(skill, [])
+
+    def monsters_dropping(self, item_code: str) -> List[Monster]:
+        return self.monsters_by_drop.get(item_code, [])
+
+    def monsters_between(self, min_level: int, max_level: int) -> List[Monster]:
+        return [monster for monster in self.monsters.values() if min_level <= monster.level <= max_level]
+
+    def resources_dropping(self, item_code: str) -> List[Resource]:
+        return self.resources_by_drop.get(item_code, [])
+
+    def resources_for_skill(self, skill: str) -> List[Resource]:
+        return self.resources_by_skill.get(skill, [])
+
+_catalog: Optional[GameCatalog] = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> GameCatalog:
+    """Returns the process-wide catalog, loading it on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = GameCatalog()
+    return _catalog
@@ -0,0 +1,170 @@
+from typing import Dict, List, Optional
+
+from work.client import ApiError, ArtifactsClient, CharacterSchema, InventorySlot
+from work.session import request
+
+CLIENTS = ('wrapper', 'typed')
+BANK_PAGE_SIZE = 100
+
+class Position:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
+    def __repr__(self) -> str:
+        return f"Position(x={self.x}, y={self.y})"
+
+class CharacterState(CharacterSchema):
+    """The character from the last response, with the few extras the wrapper's PlayerData offers."""
+    __slots__ = ()
+
+    @property
+    def pos(self) -> Position:
+        return Position(self._data["x"], self._data["y"])
+
+    @property
+    def inventory(self) -> List[InventorySlot]:
+        # Only the slots holding something, like the wrapper
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decoded = {}
+        slots = decoded.get("inventory")
+        if slots is None:
+            slots = decoded["inventory"] = [InventorySlot(slot) for slot in self._data.get("inventory") or () if slot["code"]]
+        return slots
+
+    def get_inventory_space(self) -> int:
+        return self._data["inventory_max_items"] - sum(slot["quantity"] for slot in self._data.get("inventory") or ())
+
+class _Actions:
+    """The wrapper's action method names, on the generated client."""
+    def __init__(self, character: 'TypedCharacter'):
+        self._character = character
+        self._client = character.client
+
+    def _act(self, call, *args, **kwargs) -> Optional[Dict]:
+        try:
+            response = call(self._character.name, *args, **kwargs).to_dict()
+        except ApiError as e:
+            if e.status == 490:
+                # Already at the destination, not worth an exception, the wrapper only warned too
+                return e.payload
+            raise
+        self._character.update(response)
+        return response
+
+    def move(self, x: int, y: int):
+        return self._act(self._client.action_move, x, y)
+
+    def rest(self):
+        return self._act(self._client.action_rest)
+
+    def equip_item(self, item_code: str, slot: str, quantity: int = 1):
+        return self._act(self._client.action_equip_item, item_code, slot, quantity=quantity)
+
+    def unequip_item(self, slot: str, quantity: int = 1):
+        return self._act(self._client.action_unequip_item, slot, quantity=quantity)
+
+    def use_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_use_item, item_code, quantity)
+
+    def delete_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_delete_item, item_code, quantity)
+
+    def fight(self):
+        return self._act(self._client.action_fight)
+
+    def gather(self):
+        return self._act(self._client.action_gathering)
+
+    def craft_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_crafting, item_code, quantity=quantity)
+
+    def recycle_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_recycling, item_code, quantity=quantity)
+
+    def bank_deposit_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_deposit_bank, item_code, quantity)
+
+    def bank_withdraw_item(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_withdraw_bank, item_code, quantity)
+
+    def bank_deposit_gold(self, quantity: int):
+        return self._act(self._client.action_deposit_bank_gold, quantity)
+
+    def bank_withdraw_gold(self, quantity: int):
+        return self._act(self._client.action_withdraw_bank_gold, quantity)
+
+    def npc_buy(self, code: str, quantity: int):
+        return self._act(self._client.action_npc_buy_item, code, quantity)
+
+    def npc_sell(self, code: str, quantity: int):
+        return self._act(self._client.action_npc_sell_item, code, quantity)
+
+    def taskmaster_accept_task(self):
+        return self._act(self._client.action_accept_new_task)
+
+    def taskmaster_complete_task(self):
+        return self._act(self._client.action_complete_task)
+
+    def taskmaster_exchange_task(self):
+        return self._act(self._client.action_task_exchange)
+
+    def taskmaster_trade_task(self, item_code: str, quantity: int = 1):
+        return self._act(self._client.action_task_trade, item_code, quantity)
+
+    def taskmaster_cancel_task(self):
+        return self._act(self._client.action_task_cancel)
+
+class _Account:
+    def __init__(self, client: ArtifactsClient):
+        self._client = client
+
+    def get_bank_details(self) -> Dict:
+        return self._client.get_bank_details().to_dict()
+
+    def get_bank_items(self, item_code: Optional[str] = None, page: int = 1) -> Dict:
+        return self._client.get_bank_items(item_code, page, BANK_PAGE_SIZE).to_dict()
+
+class TypedCharacter:
+    """
+    Stands in for the wrapper's ArtifactsAPI on the generated client: `.char`, `.actions` and `.account`.
+
+    `.char` is taken from the character every action response already carries,
+    where the wrapper fetches the character again after each action.
+    """
+    def __init__(self, token: str, character_name: str):
+        from artifactsmmo_wrapper.config import config
+        self.name = character_name
+        self.client = ArtifactsClient(token, config.api_base_url, request)
+        self.char = CharacterState(self.client.get_character(character_name).get("data"))
+        self.actions = _Actions(self)
+        self.account = _Account(self.client)
+
+    def update(self, response: Dict):
+        character = (response.get("data") or {}).get("character")
+        if character is not None:
+            self.char = CharacterState(character)
+
+    def get_character(self) -> CharacterState:
+        self.char = CharacterState(self.client.get_character(self.name).get("data"))
+        return self.char
+
+_client = 'wrapper'
+
+def set_client(name: str):
+    """Chooses what every CharacterAPI built after this talks to the game through, 'wrapper' or 'typed'."""
+    global _client
+    if name not in CLIENTS:
+        raise ValueError(f"Unknown client {name}, choose one of {', '.join(CLIENTS)}")
+    _client = name
+
+def open_character(token: str, character_name: str):
+    """The character handle for the chosen client, the wrapper's ArtifactsAPI or a TypedCharacter."""
+    if _client == 'typed':
+        return TypedCharacter(token, character_name)
+    from artifactsmmo_wrapper import wrapper
+    wrapper.token = token
+    return wrapper.character(character_name)
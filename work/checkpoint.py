@@ -0,0 +1,61 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Older checkpoints are ignored, the bank and the orders have moved on too far to trust them
+CHECKPOINT_MAX_AGE_SECONDS = 3600
+
+class Checkpoint:
+    """
+    What a character is in the middle of, kept on disk so a restart can pick it up.
+
+    Holds the loadout gear_up last chose, the order claims being filled and the
+    item being crafted. Every change is written straight away, to a temporary
+    file moved over the old one, so a crash never leaves half a checkpoint.
+    Without a file_path it is only kept in memory.
+    """
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._state: Dict = {}
+        # Whether the file held a recent checkpoint when it was opened
+        self.warm = False
+        if file_path and os.path.exists(file_path):
+            try:
+                with open(file_path, "r") as file:
+                    state = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                state = {}
+            if time.time() - state.get("saved_at", 0) <= CHECKPOINT_MAX_AGE_SECONDS:
+                self._state = state
+                self.warm = True
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            return self._state.get(key, default)
+
+    def save(self, **fields):
+        """Sets the given fields, None removes one, and writes the checkpoint out."""
+        with self._lock:
+            for key, value in fields.items():
+                if value is None:
+                    self._state.pop(key, None)
+                else:
+                    self._state[key] = value
+            self._state["saved_at"] = time.time()
+            if not self.file_path:
+                return
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump(self._state, file, indent=4)
+            os.replace(temp_path, self.file_path)
+
+    def clear(self):
+        """Forgets everything, the next start is a cold one."""
+        with self._lock:
+            self._state = {}
+            self.warm = False
+            if self.file_path and os.path.exists(self.file_path):
+                os.remove(self.file_path)
@@ -0,0 +1,1777 @@
+# Generated by work/gen_client.py from work/openapi.json (API 4.0), do not edit.
+# Regenerate with: python -m work.gen_client
+from typing import Dict, Optional
+from urllib.parse import quote, urlencode
+
+from work.session import send
+
+TIMEOUT = 10
+
+class ApiError(Exception):
+    """A non-200 answer, the message reads "Error <status>: <message>" like the wrapper's errors."""
+    def __init__(self, status: int, message: str, payload=None):
+        super().__init__(f"Error {status}: {message}")
+        self.status = status
+        self.message = message
+        self.payload = payload
+
+class Field:
+    """A plain value, read from the response dict on access."""
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._data.get(self.name)
+
+class Nested:
+    """A schema value, or list of them, wrapped on first access and kept."""
+    __slots__ = ('name', 'schema', 'many')
+
+    def __init__(self, name: str, schema: str, many: bool = False):
+        self.name = name
+        self.schema = schema
+        self.many = many
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        decoded = obj._decoded
+        if decoded is None:
+            decoded = obj._decoded = {}
+        try:
+            return decoded[self.name]
+        except KeyError:
+            pass
+        raw = obj._data.get(self.name)
+        cls = SCHEMAS[self.schema]
+        if raw is None:
+            value = None
+        elif self.many:
+            value = [cls(entry) for entry in raw]
+        else:
+            value = cls(raw)
+        decoded[self.name] = value
+        return value
+
+class Schema:
+    """
+    A view over one decoded JSON object.
+
+    Nothing is converted up front: plain fields are read from the dict when
+    accessed, nested objects are wrapped the first time they are accessed.
+    """
+    __slots__ = ('_data', '_decoded')
+    FIELDS = ()
+
+    def __init__(self, data: Dict):
+        self._data = data
+        self._decoded = None
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict:
+        return self._data
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._data == self._data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+def _body(**fields) -> Dict:
+    return {key: value for key, value in fields.items() if value is not None}
+
+def _query(**params) -> str:
+    params = {key: value for key, value in params.items() if value is not None}
+    return f"?{urlencode(params)}" if params else ""
+
+class AccountAchievementSchema(Schema):
+    """AccountAchievementSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'description', 'points', 'type', 'target', 'total', 'rewards', 'current', 'completed_at', )
+    name = Field('name')
+    code = Field('code')
+    description = Field('description')
+    points = Field('points')
+    type = Field('type')
+    target = Field('target')
+    total = Field('total')
+    rewards = Nested('rewards', 'AchievementRewardsSchema')
+    current = Field('current')
+    completed_at = Field('completed_at')
+
+class AccountDetails(Schema):
+    """AccountDetails"""
+    __slots__ = ()
+    FIELDS = ('username', 'subscribed', 'status', 'badges', 'achievements_points', 'banned', 'ban_reason', )
+    username = Field('username')
+    subscribed = Field('subscribed')
+    status = Field('status')
+    badges = Field('badges')
+    achievements_points = Field('achievements_points')
+    banned = Field('banned')
+    ban_reason = Field('ban_reason')
+
+class AccountDetailsSchema(Schema):
+    """AccountDetailsSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'AccountDetails')
+
+class AccountLeaderboardSchema(Schema):
+    """AccountLeaderboardSchema"""
+    __slots__ = ()
+    FIELDS = ('position', 'account', 'status', 'achievements_points', 'gold', )
+    position = Field('position')
+    account = Field('account')
+    status = Field('status')
+    achievements_points = Field('achievements_points')
+    gold = Field('gold')
+
+class AchievementResponseSchema(Schema):
+    """AchievementResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'AchievementSchema')
+
+class AchievementRewardsSchema(Schema):
+    """AchievementRewardsSchema"""
+    __slots__ = ()
+    FIELDS = ('gold', )
+    gold = Field('gold')
+
+class AchievementSchema(Schema):
+    """AchievementSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'description', 'points', 'type', 'target', 'total', 'rewards', )
+    name = Field('name')
+    code = Field('code')
+    description = Field('description')
+    points = Field('points')
+    type = Field('type')
+    target = Field('target')
+    total = Field('total')
+    rewards = Nested('rewards', 'AchievementRewardsSchema')
+
+class ActiveEventSchema(Schema):
+    """ActiveEventSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'map', 'previous_skin', 'duration', 'expiration', 'created_at', )
+    name = Field('name')
+    code = Field('code')
+    map = Nested('map', 'MapSchema')
+    previous_skin = Field('previous_skin')
+    duration = Field('duration')
+    expiration = Field('expiration')
+    created_at = Field('created_at')
+
+class AddAccountSchema(Schema):
+    """AddAccountSchema"""
+    __slots__ = ()
+    FIELDS = ('username', 'password', 'email', )
+    username = Field('username')
+    password = Field('password')
+    email = Field('email')
+
+class AddCharacterSchema(Schema):
+    """AddCharacterSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'skin', )
+    name = Field('name')
+    skin = Field('skin')
+
+class AnnouncementSchema(Schema):
+    """AnnouncementSchema"""
+    __slots__ = ()
+    FIELDS = ('message', 'created_at', )
+    message = Field('message')
+    created_at = Field('created_at')
+
+class BadgeConditionSchema(Schema):
+    """BadgeConditionSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class BadgeResponseSchema(Schema):
+    """BadgeResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'BadgeSchema')
+
+class BadgeSchema(Schema):
+    """BadgeSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'season', 'description', 'conditions', )
+    code = Field('code')
+    season = Field('season')
+    description = Field('description')
+    conditions = Nested('conditions', 'BadgeConditionSchema', many=True)
+
+class BankExtensionSchema(Schema):
+    """BankExtensionSchema"""
+    __slots__ = ()
+    FIELDS = ('price', )
+    price = Field('price')
+
+class BankExtensionTransactionResponseSchema(Schema):
+    """BankExtensionTransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'BankExtensionTransactionSchema')
+
+class BankExtensionTransactionSchema(Schema):
+    """BankExtensionTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'transaction', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    transaction = Nested('transaction', 'BankExtensionSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class BankGoldTransactionResponseSchema(Schema):
+    """BankGoldTransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'BankGoldTransactionSchema')
+
+class BankGoldTransactionSchema(Schema):
+    """BankGoldTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'bank', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    bank = Nested('bank', 'GoldSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class BankItemTransactionResponseSchema(Schema):
+    """BankItemTransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'BankItemTransactionSchema')
+
+class BankItemTransactionSchema(Schema):
+    """BankItemTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'item', 'bank', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    item = Nested('item', 'ItemSchema')
+    bank = Nested('bank', 'SimpleItemSchema', many=True)
+    character = Nested('character', 'CharacterSchema')
+
+class BankResponseSchema(Schema):
+    """BankResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'BankSchema')
+
+class BankSchema(Schema):
+    """BankSchema"""
+    __slots__ = ()
+    FIELDS = ('slots', 'expansions', 'next_expansion_cost', 'gold', )
+    slots = Field('slots')
+    expansions = Field('expansions')
+    next_expansion_cost = Field('next_expansion_cost')
+    gold = Field('gold')
+
+class BlockedHitsSchema(Schema):
+    """BlockedHitsSchema"""
+    __slots__ = ()
+    FIELDS = ('fire', 'earth', 'water', 'air', 'total', )
+    fire = Field('fire')
+    earth = Field('earth')
+    water = Field('water')
+    air = Field('air')
+    total = Field('total')
+
+class ChangePassword(Schema):
+    """ChangePassword"""
+    __slots__ = ()
+    FIELDS = ('current_password', 'new_password', )
+    current_password = Field('current_password')
+    new_password = Field('new_password')
+
+class CharacterFightDataSchema(Schema):
+    """CharacterFightDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'fight', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    fight = Nested('fight', 'FightSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class CharacterFightResponseSchema(Schema):
+    """CharacterFightResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'CharacterFightDataSchema')
+
+class CharacterLeaderboardSchema(Schema):
+    """CharacterLeaderboardSchema"""
+    __slots__ = ()
+    FIELDS = ('position', 'name', 'account', 'skin', 'level', 'total_xp', 'mining_level', 'mining_total_xp', 'woodcutting_level', 'woodcutting_total_xp', 'fishing_level', 'fishing_total_xp', 'weaponcrafting_level', 'weaponcrafting_total_xp', 'gearcrafting_level', 'gearcrafting_total_xp', 'jewelrycrafting_level', 'jewelrycrafting_total_xp', 'cooking_level', 'cooking_total_xp', 'alchemy_level', 'alchemy_total_xp', 'gold', )
+    position = Field('position')
+    name = Field('name')
+    account = Field('account')
+    skin = Field('skin')
+    level = Field('level')
+    total_xp = Field('total_xp')
+    mining_level = Field('mining_level')
+    mining_total_xp = Field('mining_total_xp')
+    woodcutting_level = Field('woodcutting_level')
+    woodcutting_total_xp = Field('woodcutting_total_xp')
+    fishing_level = Field('fishing_level')
+    fishing_total_xp = Field('fishing_total_xp')
+    weaponcrafting_level = Field('weaponcrafting_level')
+    weaponcrafting_total_xp = Field('weaponcrafting_total_xp')
+    gearcrafting_level = Field('gearcrafting_level')
+    gearcrafting_total_xp = Field('gearcrafting_total_xp')
+    jewelrycrafting_level = Field('jewelrycrafting_level')
+    jewelrycrafting_total_xp = Field('jewelrycrafting_total_xp')
+    cooking_level = Field('cooking_level')
+    cooking_total_xp = Field('cooking_total_xp')
+    alchemy_level = Field('alchemy_level')
+    alchemy_total_xp = Field('alchemy_total_xp')
+    gold = Field('gold')
+
+class CharacterMovementDataSchema(Schema):
+    """CharacterMovementDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'destination', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    destination = Nested('destination', 'MapSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class CharacterMovementResponseSchema(Schema):
+    """CharacterMovementResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'CharacterMovementDataSchema')
+
+class CharacterResponseSchema(Schema):
+    """CharacterResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'CharacterSchema')
+
+class CharacterRestDataSchema(Schema):
+    """CharacterRestDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'hp_restored', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    hp_restored = Field('hp_restored')
+    character = Nested('character', 'CharacterSchema')
+
+class CharacterRestResponseSchema(Schema):
+    """CharacterRestResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'CharacterRestDataSchema')
+
+class CharacterSchema(Schema):
+    """CharacterSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'account', 'skin', 'level', 'xp', 'max_xp', 'gold', 'speed', 'mining_level', 'mining_xp', 'mining_max_xp', 'woodcutting_level', 'woodcutting_xp', 'woodcutting_max_xp', 'fishing_level', 'fishing_xp', 'fishing_max_xp', 'weaponcrafting_level', 'weaponcrafting_xp', 'weaponcrafting_max_xp', 'gearcrafting_level', 'gearcrafting_xp', 'gearcrafting_max_xp', 'jewelrycrafting_level', 'jewelrycrafting_xp', 'jewelrycrafting_max_xp', 'cooking_level', 'cooking_xp', 'cooking_max_xp', 'alchemy_level', 'alchemy_xp', 'alchemy_max_xp', 'hp', 'max_hp', 'haste', 'critical_strike', 'wisdom', 'prospecting', 'attack_fire', 'attack_earth', 'attack_water', 'attack_air', 'dmg', 'dmg_fire', 'dmg_earth', 'dmg_water', 'dmg_air', 'res_fire', 'res_earth', 'res_water', 'res_air', 'x', 'y', 'cooldown', 'cooldown_expiration', 'weapon_slot', 'rune_slot', 'shield_slot', 'helmet_slot', 'body_armor_slot', 'leg_armor_slot', 'boots_slot', 'ring1_slot', 'ring2_slot', 'amulet_slot', 'artifact1_slot', 'artifact2_slot', 'artifact3_slot', 'utility1_slot', 'utility1_slot_quantity', 'utility2_slot', 'utility2_slot_quantity', 'bag_slot', 'task', 'task_type', 'task_progress', 'task_total', 'inventory_max_items', 'inventory', )
+    name = Field('name')
+    account = Field('account')
+    skin = Field('skin')
+    level = Field('level')
+    xp = Field('xp')
+    max_xp = Field('max_xp')
+    gold = Field('gold')
+    speed = Field('speed')
+    mining_level = Field('mining_level')
+    mining_xp = Field('mining_xp')
+    mining_max_xp = Field('mining_max_xp')
+    woodcutting_level = Field('woodcutting_level')
+    woodcutting_xp = Field('woodcutting_xp')
+    woodcutting_max_xp = Field('woodcutting_max_xp')
+    fishing_level = Field('fishing_level')
+    fishing_xp = Field('fishing_xp')
+    fishing_max_xp = Field('fishing_max_xp')
+    weaponcrafting_level = Field('weaponcrafting_level')
+    weaponcrafting_xp = Field('weaponcrafting_xp')
+    weaponcrafting_max_xp = Field('weaponcrafting_max_xp')
+    gearcrafting_level = Field('gearcrafting_level')
+    gearcrafting_xp = Field('gearcrafting_xp')
+    gearcrafting_max_xp = Field('gearcrafting_max_xp')
+    jewelrycrafting_level = Field('jewelrycrafting_level')
+    jewelrycrafting_xp = Field('jewelrycrafting_xp')
+    jewelrycrafting_max_xp = Field('jewelrycrafting_max_xp')
+    cooking_level = Field('cooking_level')
+    cooking_xp = Field('cooking_xp')
+    cooking_max_xp = Field('cooking_max_xp')
+    alchemy_level = Field('alchemy_level')
+    alchemy_xp = Field('alchemy_xp')
+    alchemy_max_xp = Field('alchemy_max_xp')
+    hp = Field('hp')
+    max_hp = Field('max_hp')
+    haste = Field('haste')
+    critical_strike = Field('critical_strike')
+    wisdom = Field('wisdom')
+    prospecting = Field('prospecting')
+    attack_fire = Field('attack_fire')
+    attack_earth = Field('attack_earth')
+    attack_water = Field('attack_water')
+    attack_air = Field('attack_air')
+    dmg = Field('dmg')
+    dmg_fire = Field('dmg_fire')
+    dmg_earth = Field('dmg_earth')
+    dmg_water = Field('dmg_water')
+    dmg_air = Field('dmg_air')
+    res_fire = Field('res_fire')
+    res_earth = Field('res_earth')
+    res_water = Field('res_water')
+    res_air = Field('res_air')
+    x = Field('x')
+    y = Field('y')
+    cooldown = Field('cooldown')
+    cooldown_expiration = Field('cooldown_expiration')
+    weapon_slot = Field('weapon_slot')
+    rune_slot = Field('rune_slot')
+    shield_slot = Field('shield_slot')
+    helmet_slot = Field('helmet_slot')
+    body_armor_slot = Field('body_armor_slot')
+    leg_armor_slot = Field('leg_armor_slot')
+    boots_slot = Field('boots_slot')
+    ring1_slot = Field('ring1_slot')
+    ring2_slot = Field('ring2_slot')
+    amulet_slot = Field('amulet_slot')
+    artifact1_slot = Field('artifact1_slot')
+    artifact2_slot = Field('artifact2_slot')
+    artifact3_slot = Field('artifact3_slot')
+    utility1_slot = Field('utility1_slot')
+    utility1_slot_quantity = Field('utility1_slot_quantity')
+    utility2_slot = Field('utility2_slot')
+    utility2_slot_quantity = Field('utility2_slot_quantity')
+    bag_slot = Field('bag_slot')
+    task = Field('task')
+    task_type = Field('task_type')
+    task_progress = Field('task_progress')
+    task_total = Field('task_total')
+    inventory_max_items = Field('inventory_max_items')
+    inventory = Nested('inventory', 'InventorySlot', many=True)
+
+class CooldownSchema(Schema):
+    """CooldownSchema"""
+    __slots__ = ()
+    FIELDS = ('total_seconds', 'remaining_seconds', 'started_at', 'expiration', 'reason', )
+    total_seconds = Field('total_seconds')
+    remaining_seconds = Field('remaining_seconds')
+    started_at = Field('started_at')
+    expiration = Field('expiration')
+    reason = Field('reason')
+
+class CraftSchema(Schema):
+    """CraftSchema"""
+    __slots__ = ()
+    FIELDS = ('skill', 'level', 'items', 'quantity', )
+    skill = Field('skill')
+    level = Field('level')
+    items = Nested('items', 'SimpleItemSchema', many=True)
+    quantity = Field('quantity')
+
+class CraftingSchema(Schema):
+    """CraftingSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class DataPage_AccountAchievementSchema(Schema):
+    """DataPage[AccountAchievementSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'AccountAchievementSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_AccountLeaderboardSchema(Schema):
+    """DataPage[AccountLeaderboardSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'AccountLeaderboardSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_AchievementSchema(Schema):
+    """DataPage[AchievementSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'AchievementSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_ActiveEventSchema(Schema):
+    """DataPage[ActiveEventSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'ActiveEventSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_BadgeSchema(Schema):
+    """DataPage[BadgeSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'BadgeSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_CharacterLeaderboardSchema(Schema):
+    """DataPage[CharacterLeaderboardSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'CharacterLeaderboardSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_DropRateSchema(Schema):
+    """DataPage[DropRateSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'DropRateSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_EffectSchema(Schema):
+    """DataPage[EffectSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'EffectSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_EventSchema(Schema):
+    """DataPage[EventSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'EventSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_GEOrderSchema(Schema):
+    """DataPage[GEOrderSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'GEOrderSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_GeOrderHistorySchema(Schema):
+    """DataPage[GeOrderHistorySchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'GeOrderHistorySchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_ItemSchema(Schema):
+    """DataPage[ItemSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'ItemSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_LogSchema(Schema):
+    """DataPage[LogSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'LogSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_MapSchema(Schema):
+    """DataPage[MapSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'MapSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_MonsterSchema(Schema):
+    """DataPage[MonsterSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'MonsterSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_NPCItem(Schema):
+    """DataPage[NPCItem]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'NPCItem', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_NPCSchema(Schema):
+    """DataPage[NPCSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'NPCSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_ResourceSchema(Schema):
+    """DataPage[ResourceSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'ResourceSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_SimpleItemSchema(Schema):
+    """DataPage[SimpleItemSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'SimpleItemSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DataPage_TaskFullSchema(Schema):
+    """DataPage[TaskFullSchema]"""
+    __slots__ = ()
+    FIELDS = ('data', 'total', 'page', 'size', 'pages', )
+    data = Nested('data', 'TaskFullSchema', many=True)
+    total = Field('total')
+    page = Field('page')
+    size = Field('size')
+    pages = Field('pages')
+
+class DeleteCharacterSchema(Schema):
+    """DeleteCharacterSchema"""
+    __slots__ = ()
+    FIELDS = ('name', )
+    name = Field('name')
+
+class DeleteItemResponseSchema(Schema):
+    """DeleteItemResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'DeleteItemSchema')
+
+class DeleteItemSchema(Schema):
+    """DeleteItemSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'item', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    item = Nested('item', 'SimpleItemSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class DepositWithdrawGoldSchema(Schema):
+    """DepositWithdrawGoldSchema"""
+    __slots__ = ()
+    FIELDS = ('quantity', )
+    quantity = Field('quantity')
+
+class DestinationSchema(Schema):
+    """DestinationSchema"""
+    __slots__ = ()
+    FIELDS = ('x', 'y', )
+    x = Field('x')
+    y = Field('y')
+
+class DropRateSchema(Schema):
+    """DropRateSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'rate', 'min_quantity', 'max_quantity', )
+    code = Field('code')
+    rate = Field('rate')
+    min_quantity = Field('min_quantity')
+    max_quantity = Field('max_quantity')
+
+class DropSchema(Schema):
+    """DropSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class EffectResponseSchema(Schema):
+    """EffectResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'EffectSchema')
+
+class EffectSchema(Schema):
+    """EffectSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'description', 'type', 'subtype', )
+    name = Field('name')
+    code = Field('code')
+    description = Field('description')
+    type = Field('type')
+    subtype = Field('subtype')
+
+class EquipRequestSchema(Schema):
+    """EquipRequestSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'slot', 'item', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    slot = Field('slot')
+    item = Nested('item', 'ItemSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class EquipSchema(Schema):
+    """EquipSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'slot', 'quantity', )
+    code = Field('code')
+    slot = Field('slot')
+    quantity = Field('quantity')
+
+class EquipmentResponseSchema(Schema):
+    """EquipmentResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'EquipRequestSchema')
+
+class EventContentSchema(Schema):
+    """EventContentSchema"""
+    __slots__ = ()
+    FIELDS = ('type', 'code', )
+    type = Field('type')
+    code = Field('code')
+
+class EventMapSchema(Schema):
+    """EventMapSchema"""
+    __slots__ = ()
+    FIELDS = ('x', 'y', )
+    x = Field('x')
+    y = Field('y')
+
+class EventSchema(Schema):
+    """EventSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'maps', 'skin', 'duration', 'rate', 'content', )
+    name = Field('name')
+    code = Field('code')
+    maps = Nested('maps', 'EventMapSchema', many=True)
+    skin = Field('skin')
+    duration = Field('duration')
+    rate = Field('rate')
+    content = Nested('content', 'EventContentSchema')
+
+class FightSchema(Schema):
+    """FightSchema"""
+    __slots__ = ()
+    FIELDS = ('xp', 'gold', 'drops', 'turns', 'monster_blocked_hits', 'player_blocked_hits', 'logs', 'result', )
+    xp = Field('xp')
+    gold = Field('gold')
+    drops = Nested('drops', 'DropSchema', many=True)
+    turns = Field('turns')
+    monster_blocked_hits = Nested('monster_blocked_hits', 'BlockedHitsSchema')
+    player_blocked_hits = Nested('player_blocked_hits', 'BlockedHitsSchema')
+    logs = Field('logs')
+    result = Field('result')
+
+class GEBuyOrderSchema(Schema):
+    """GEBuyOrderSchema"""
+    __slots__ = ()
+    FIELDS = ('id', 'quantity', )
+    id = Field('id')
+    quantity = Field('quantity')
+
+class GECancelOrderSchema(Schema):
+    """GECancelOrderSchema"""
+    __slots__ = ()
+    FIELDS = ('id', )
+    id = Field('id')
+
+class GECreateOrderTransactionResponseSchema(Schema):
+    """GECreateOrderTransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'GEOrderTransactionSchema')
+
+class GEOrderCreatedSchema(Schema):
+    """GEOrderCreatedSchema"""
+    __slots__ = ()
+    FIELDS = ('id', 'created_at', 'code', 'quantity', 'price', 'total_price', 'tax', )
+    id = Field('id')
+    created_at = Field('created_at')
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+    total_price = Field('total_price')
+    tax = Field('tax')
+
+class GEOrderCreationrSchema(Schema):
+    """GEOrderCreationrSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', 'price', )
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+
+class GEOrderReponseSchema(Schema):
+    """GEOrderReponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'GEOrderSchema')
+
+class GEOrderSchema(Schema):
+    """GEOrderSchema"""
+    __slots__ = ()
+    FIELDS = ('id', 'seller', 'code', 'quantity', 'price', 'created_at', )
+    id = Field('id')
+    seller = Field('seller')
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+    created_at = Field('created_at')
+
+class GEOrderTransactionSchema(Schema):
+    """GEOrderTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'order', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    order = Nested('order', 'GEOrderCreatedSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class GETransactionListSchema(Schema):
+    """GETransactionListSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'order', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    order = Nested('order', 'GETransactionSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class GETransactionResponseSchema(Schema):
+    """GETransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'GETransactionListSchema')
+
+class GETransactionSchema(Schema):
+    """GETransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('id', 'code', 'quantity', 'price', 'total_price', )
+    id = Field('id')
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+    total_price = Field('total_price')
+
+class GeOrderHistorySchema(Schema):
+    """GeOrderHistorySchema"""
+    __slots__ = ()
+    FIELDS = ('order_id', 'seller', 'buyer', 'code', 'quantity', 'price', 'sold_at', )
+    order_id = Field('order_id')
+    seller = Field('seller')
+    buyer = Field('buyer')
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+    sold_at = Field('sold_at')
+
+class GoldSchema(Schema):
+    """GoldSchema"""
+    __slots__ = ()
+    FIELDS = ('quantity', )
+    quantity = Field('quantity')
+
+class HTTPValidationError(Schema):
+    """HTTPValidationError"""
+    __slots__ = ()
+    FIELDS = ('detail', )
+    detail = Nested('detail', 'ValidationError', many=True)
+
+class InventorySlot(Schema):
+    """InventorySlot"""
+    __slots__ = ()
+    FIELDS = ('slot', 'code', 'quantity', )
+    slot = Field('slot')
+    code = Field('code')
+    quantity = Field('quantity')
+
+class ItemResponseSchema(Schema):
+    """ItemResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'ItemSchema')
+
+class ItemSchema(Schema):
+    """ItemSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'level', 'type', 'subtype', 'description', 'effects', 'craft', 'tradeable', )
+    name = Field('name')
+    code = Field('code')
+    level = Field('level')
+    type = Field('type')
+    subtype = Field('subtype')
+    description = Field('description')
+    effects = Nested('effects', 'SimpleEffectSchema', many=True)
+    craft = Nested('craft', 'CraftSchema')
+    tradeable = Field('tradeable')
+
+class LogSchema(Schema):
+    """LogSchema"""
+    __slots__ = ()
+    FIELDS = ('character', 'account', 'type', 'description', 'content', 'cooldown', 'cooldown_expiration', 'created_at', )
+    character = Field('character')
+    account = Field('account')
+    type = Field('type')
+    description = Field('description')
+    content = Field('content')
+    cooldown = Field('cooldown')
+    cooldown_expiration = Field('cooldown_expiration')
+    created_at = Field('created_at')
+
+class MapContentSchema(Schema):
+    """MapContentSchema"""
+    __slots__ = ()
+    FIELDS = ('type', 'code', )
+    type = Field('type')
+    code = Field('code')
+
+class MapResponseSchema(Schema):
+    """MapResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'MapSchema')
+
+class MapSchema(Schema):
+    """MapSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'skin', 'x', 'y', 'content', )
+    name = Field('name')
+    skin = Field('skin')
+    x = Field('x')
+    y = Field('y')
+    content = Nested('content', 'MapContentSchema')
+
+class MonsterResponseSchema(Schema):
+    """MonsterResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'MonsterSchema')
+
+class MonsterSchema(Schema):
+    """MonsterSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'level', 'hp', 'attack_fire', 'attack_earth', 'attack_water', 'attack_air', 'res_fire', 'res_earth', 'res_water', 'res_air', 'critical_strike', 'effects', 'min_gold', 'max_gold', 'drops', )
+    name = Field('name')
+    code = Field('code')
+    level = Field('level')
+    hp = Field('hp')
+    attack_fire = Field('attack_fire')
+    attack_earth = Field('attack_earth')
+    attack_water = Field('attack_water')
+    attack_air = Field('attack_air')
+    res_fire = Field('res_fire')
+    res_earth = Field('res_earth')
+    res_water = Field('res_water')
+    res_air = Field('res_air')
+    critical_strike = Field('critical_strike')
+    effects = Nested('effects', 'SimpleEffectSchema', many=True)
+    min_gold = Field('min_gold')
+    max_gold = Field('max_gold')
+    drops = Nested('drops', 'DropRateSchema', many=True)
+
+class MyAccountDetails(Schema):
+    """MyAccountDetails"""
+    __slots__ = ()
+    FIELDS = ('username', 'email', 'subscribed', 'status', 'badges', 'gems', 'achievements_points', 'banned', 'ban_reason', )
+    username = Field('username')
+    email = Field('email')
+    subscribed = Field('subscribed')
+    status = Field('status')
+    badges = Field('badges')
+    gems = Field('gems')
+    achievements_points = Field('achievements_points')
+    banned = Field('banned')
+    ban_reason = Field('ban_reason')
+
+class MyAccountDetailsSchema(Schema):
+    """MyAccountDetailsSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'MyAccountDetails')
+
+class MyCharactersListSchema(Schema):
+    """MyCharactersListSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'CharacterSchema', many=True)
+
+class NPCItem(Schema):
+    """NPCItem"""
+    __slots__ = ()
+    FIELDS = ('code', 'npc', 'buy_price', 'sell_price', )
+    code = Field('code')
+    npc = Field('npc')
+    buy_price = Field('buy_price')
+    sell_price = Field('sell_price')
+
+class NPCResponseSchema(Schema):
+    """NPCResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'NPCSchema')
+
+class NPCSchema(Schema):
+    """NPCSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'description', 'type', )
+    name = Field('name')
+    code = Field('code')
+    description = Field('description')
+    type = Field('type')
+
+class NpcItemTransactionSchema(Schema):
+    """NpcItemTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', 'price', 'total_price', )
+    code = Field('code')
+    quantity = Field('quantity')
+    price = Field('price')
+    total_price = Field('total_price')
+
+class NpcMerchantBuySchema(Schema):
+    """NpcMerchantBuySchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class NpcMerchantTransactionResponseSchema(Schema):
+    """NpcMerchantTransactionResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'NpcMerchantTransactionSchema')
+
+class NpcMerchantTransactionSchema(Schema):
+    """NpcMerchantTransactionSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'transaction', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    transaction = Nested('transaction', 'NpcItemTransactionSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class RecyclingDataSchema(Schema):
+    """RecyclingDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'details', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    details = Nested('details', 'RecyclingItemsSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class RecyclingItemsSchema(Schema):
+    """RecyclingItemsSchema"""
+    __slots__ = ()
+    FIELDS = ('items', )
+    items = Nested('items', 'DropSchema', many=True)
+
+class RecyclingResponseSchema(Schema):
+    """RecyclingResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'RecyclingDataSchema')
+
+class RecyclingSchema(Schema):
+    """RecyclingSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class ResourceResponseSchema(Schema):
+    """ResourceResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'ResourceSchema')
+
+class ResourceSchema(Schema):
+    """ResourceSchema"""
+    __slots__ = ()
+    FIELDS = ('name', 'code', 'skill', 'level', 'drops', )
+    name = Field('name')
+    code = Field('code')
+    skill = Field('skill')
+    level = Field('level')
+    drops = Nested('drops', 'DropRateSchema', many=True)
+
+class ResponseSchema(Schema):
+    """ResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('message', )
+    message = Field('message')
+
+class RewardDataResponseSchema(Schema):
+    """RewardDataResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'RewardDataSchema')
+
+class RewardDataSchema(Schema):
+    """RewardDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'rewards', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    rewards = Nested('rewards', 'RewardsSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class RewardResponseSchema(Schema):
+    """RewardResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'DropRateSchema')
+
+class RewardsSchema(Schema):
+    """RewardsSchema"""
+    __slots__ = ()
+    FIELDS = ('items', 'gold', )
+    items = Nested('items', 'SimpleItemSchema', many=True)
+    gold = Field('gold')
+
+class SimpleEffectSchema(Schema):
+    """SimpleEffectSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'value', )
+    code = Field('code')
+    value = Field('value')
+
+class SimpleItemSchema(Schema):
+    """SimpleItemSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class SkillDataSchema(Schema):
+    """SkillDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'details', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    details = Nested('details', 'SkillInfoSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class SkillInfoSchema(Schema):
+    """SkillInfoSchema"""
+    __slots__ = ()
+    FIELDS = ('xp', 'items', )
+    xp = Field('xp')
+    items = Nested('items', 'DropSchema', many=True)
+
+class SkillResponseSchema(Schema):
+    """SkillResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'SkillDataSchema')
+
+class StatusResponseSchema(Schema):
+    """StatusResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'StatusSchema')
+
+class StatusSchema(Schema):
+    """StatusSchema"""
+    __slots__ = ()
+    FIELDS = ('status', 'version', 'max_level', 'characters_online', 'server_time', 'announcements', 'last_wipe', 'next_wipe', )
+    status = Field('status')
+    version = Field('version')
+    max_level = Field('max_level')
+    characters_online = Field('characters_online')
+    server_time = Field('server_time')
+    announcements = Nested('announcements', 'AnnouncementSchema', many=True)
+    last_wipe = Field('last_wipe')
+    next_wipe = Field('next_wipe')
+
+class TaskCancelledResponseSchema(Schema):
+    """TaskCancelledResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'TaskCancelledSchema')
+
+class TaskCancelledSchema(Schema):
+    """TaskCancelledSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class TaskDataSchema(Schema):
+    """TaskDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'task', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    task = Nested('task', 'TaskSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class TaskFullResponseSchema(Schema):
+    """TaskFullResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'TaskFullSchema')
+
+class TaskFullSchema(Schema):
+    """TaskFullSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'level', 'type', 'min_quantity', 'max_quantity', 'skill', 'rewards', )
+    code = Field('code')
+    level = Field('level')
+    type = Field('type')
+    min_quantity = Field('min_quantity')
+    max_quantity = Field('max_quantity')
+    skill = Field('skill')
+    rewards = Nested('rewards', 'RewardsSchema')
+
+class TaskResponseSchema(Schema):
+    """TaskResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'TaskDataSchema')
+
+class TaskSchema(Schema):
+    """TaskSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'type', 'total', 'rewards', )
+    code = Field('code')
+    type = Field('type')
+    total = Field('total')
+    rewards = Nested('rewards', 'RewardsSchema')
+
+class TaskTradeDataSchema(Schema):
+    """TaskTradeDataSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'trade', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    trade = Nested('trade', 'TaskTradeSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class TaskTradeResponseSchema(Schema):
+    """TaskTradeResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'TaskTradeDataSchema')
+
+class TaskTradeSchema(Schema):
+    """TaskTradeSchema"""
+    __slots__ = ()
+    FIELDS = ('code', 'quantity', )
+    code = Field('code')
+    quantity = Field('quantity')
+
+class TokenResponseSchema(Schema):
+    """TokenResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('token', )
+    token = Field('token')
+
+class UnequipSchema(Schema):
+    """UnequipSchema"""
+    __slots__ = ()
+    FIELDS = ('slot', 'quantity', )
+    slot = Field('slot')
+    quantity = Field('quantity')
+
+class UseItemResponseSchema(Schema):
+    """UseItemResponseSchema"""
+    __slots__ = ()
+    FIELDS = ('data', )
+    data = Nested('data', 'UseItemSchema')
+
+class UseItemSchema(Schema):
+    """UseItemSchema"""
+    __slots__ = ()
+    FIELDS = ('cooldown', 'item', 'character', )
+    cooldown = Nested('cooldown', 'CooldownSchema')
+    item = Nested('item', 'ItemSchema')
+    character = Nested('character', 'CharacterSchema')
+
+class ValidationError(Schema):
+    """ValidationError"""
+    __slots__ = ()
+    FIELDS = ('loc', 'msg', 'type', )
+    loc = Field('loc')
+    msg = Field('msg')
+    type = Field('type')
+
+SCHEMAS = {
+    'AccountAchievementSchema': AccountAchievementSchema,
+    'AccountDetails': AccountDetails,
+    'AccountDetailsSchema': AccountDetailsSchema,
+    'AccountLeaderboardSchema': AccountLeaderboardSchema,
+    'AchievementResponseSchema': AchievementResponseSchema,
+    'AchievementRewardsSchema': AchievementRewardsSchema,
+    'AchievementSchema': AchievementSchema,
+    'ActiveEventSchema': ActiveEventSchema,
+    'AddAccountSchema': AddAccountSchema,
+    'AddCharacterSchema': AddCharacterSchema,
+    'AnnouncementSchema': AnnouncementSchema,
+    'BadgeConditionSchema': BadgeConditionSchema,
+    'BadgeResponseSchema': BadgeResponseSchema,
+    'BadgeSchema': BadgeSchema,
+    'BankExtensionSchema': BankExtensionSchema,
+    'BankExtensionTransactionResponseSchema': BankExtensionTransactionResponseSchema,
+    'BankExtensionTransactionSchema': BankExtensionTransactionSchema,
+    'BankGoldTransactionResponseSchema': BankGoldTransactionResponseSchema,
+    'BankGoldTransactionSchema': BankGoldTransactionSchema,
+    'BankItemTransactionResponseSchema': BankItemTransactionResponseSchema,
+    'BankItemTransactionSchema': BankItemTransactionSchema,
+    'BankResponseSchema': BankResponseSchema,
+    'BankSchema': BankSchema,
+    'BlockedHitsSchema': BlockedHitsSchema,
+    'ChangePassword': ChangePassword,
+    'CharacterFightDataSchema': CharacterFightDataSchema,
+    'CharacterFightResponseSchema': CharacterFightResponseSchema,
+    'CharacterLeaderboardSchema': CharacterLeaderboardSchema,
+    'CharacterMovementDataSchema': CharacterMovementDataSchema,
+    'CharacterMovementResponseSchema': CharacterMovementResponseSchema,
+    'CharacterResponseSchema': CharacterResponseSchema,
+    'CharacterRestDataSchema': CharacterRestDataSchema,
+    'CharacterRestResponseSchema': CharacterRestResponseSchema,
+    'CharacterSchema': CharacterSchema,
+    'CooldownSchema': CooldownSchema,
+    'CraftSchema': CraftSchema,
+    'CraftingSchema': CraftingSchema,
+    'DataPage_AccountAchievementSchema_': DataPage_AccountAchievementSchema,
+    'DataPage_AccountLeaderboardSchema_': DataPage_AccountLeaderboardSchema,
+    'DataPage_AchievementSchema_': DataPage_AchievementSchema,
+    'DataPage_ActiveEventSchema_': DataPage_ActiveEventSchema,
+    'DataPage_BadgeSchema_': DataPage_BadgeSchema,
+    'DataPage_CharacterLeaderboardSchema_': DataPage_CharacterLeaderboardSchema,
+    'DataPage_DropRateSchema_': DataPage_DropRateSchema,
+    'DataPage_EffectSchema_': DataPage_EffectSchema,
+    'DataPage_EventSchema_': DataPage_EventSchema,
+    'DataPage_GEOrderSchema_': DataPage_GEOrderSchema,
+    'DataPage_GeOrderHistorySchema_': DataPage_GeOrderHistorySchema,
+    'DataPage_ItemSchema_': DataPage_ItemSchema,
+    'DataPage_LogSchema_': DataPage_LogSchema,
+    'DataPage_MapSchema_': DataPage_MapSchema,
+    'DataPage_MonsterSchema_': DataPage_MonsterSchema,
+    'DataPage_NPCItem_': DataPage_NPCItem,
+    'DataPage_NPCSchema_': DataPage_NPCSchema,
+    'DataPage_ResourceSchema_': DataPage_ResourceSchema,
+    'DataPage_SimpleItemSchema_': DataPage_SimpleItemSchema,
+    'DataPage_TaskFullSchema_': DataPage_TaskFullSchema,
+    'DeleteCharacterSchema': DeleteCharacterSchema,
+    'DeleteItemResponseSchema': DeleteItemResponseSchema,
+    'DeleteItemSchema': DeleteItemSchema,
+    'DepositWithdrawGoldSchema': DepositWithdrawGoldSchema,
+    'DestinationSchema': DestinationSchema,
+    'DropRateSchema': DropRateSchema,
+    'DropSchema': DropSchema,
+    'EffectResponseSchema': EffectResponseSchema,
+    'EffectSchema': EffectSchema,
+    'EquipRequestSchema': EquipRequestSchema,
+    'EquipSchema': EquipSchema,
+    'EquipmentResponseSchema': EquipmentResponseSchema,
+    'EventContentSchema': EventContentSchema,
+    'EventMapSchema': EventMapSchema,
+    'EventSchema': EventSchema,
+    'FightSchema': FightSchema,
+    'GEBuyOrderSchema': GEBuyOrderSchema,
+    'GECancelOrderSchema': GECancelOrderSchema,
+    'GECreateOrderTransactionResponseSchema': GECreateOrderTransactionResponseSchema,
+    'GEOrderCreatedSchema': GEOrderCreatedSchema,
+    'GEOrderCreationrSchema': GEOrderCreationrSchema,
+    'GEOrderReponseSchema': GEOrderReponseSchema,
+    'GEOrderSchema': GEOrderSchema,
+    'GEOrderTransactionSchema': GEOrderTransactionSchema,
+    'GETransactionListSchema': GETransactionListSchema,
+    'GETransactionResponseSchema': GETransactionResponseSchema,
+    'GETransactionSchema': GETransactionSchema,
+    'GeOrderHistorySchema': GeOrderHistorySchema,
+    'GoldSchema': GoldSchema,
+    'HTTPValidationError': HTTPValidationError,
+    'InventorySlot': InventorySlot,
+    'ItemResponseSchema': ItemResponseSchema,
+    'ItemSchema': ItemSchema,
+    'LogSchema': LogSchema,
+    'MapContentSchema': MapContentSchema,
+    'MapResponseSchema': MapResponseSchema,
+    'MapSchema': MapSchema,
+    'MonsterResponseSchema': MonsterResponseSchema,
+    'MonsterSchema': MonsterSchema,
+    'MyAccountDetails': MyAccountDetails,
+    'MyAccountDetailsSchema': MyAccountDetailsSchema,
+    'MyCharactersListSchema': MyCharactersListSchema,
+    'NPCItem': NPCItem,
+    'NPCResponseSchema': NPCResponseSchema,
+    'NPCSchema': NPCSchema,
+    'NpcItemTransactionSchema': NpcItemTransactionSchema,
+    'NpcMerchantBuySchema': NpcMerchantBuySchema,
+    'NpcMerchantTransactionResponseSchema': NpcMerchantTransactionResponseSchema,
+    'NpcMerchantTransactionSchema': NpcMerchantTransactionSchema,
+    'RecyclingDataSchema': RecyclingDataSchema,
+    'RecyclingItemsSchema': RecyclingItemsSchema,
+    'RecyclingResponseSchema': RecyclingResponseSchema,
+    'RecyclingSchema': RecyclingSchema,
+    'ResourceResponseSchema': ResourceResponseSchema,
+    'ResourceSchema': ResourceSchema,
+    'ResponseSchema': ResponseSchema,
+    'RewardDataResponseSchema': RewardDataResponseSchema,
+    'RewardDataSchema': RewardDataSchema,
+    'RewardResponseSchema': RewardResponseSchema,
+    'RewardsSchema': RewardsSchema,
+    'SimpleEffectSchema': SimpleEffectSchema,
+    'SimpleItemSchema': SimpleItemSchema,
+    'SkillDataSchema': SkillDataSchema,
+    'SkillInfoSchema': SkillInfoSchema,
+    'SkillResponseSchema': SkillResponseSchema,
+    'StatusResponseSchema': StatusResponseSchema,
+    'StatusSchema': StatusSchema,
+    'TaskCancelledResponseSchema': TaskCancelledResponseSchema,
+    'TaskCancelledSchema': TaskCancelledSchema,
+    'TaskDataSchema': TaskDataSchema,
+    'TaskFullResponseSchema': TaskFullResponseSchema,
+    'TaskFullSchema': TaskFullSchema,
+    'TaskResponseSchema': TaskResponseSchema,
+    'TaskSchema': TaskSchema,
+    'TaskTradeDataSchema': TaskTradeDataSchema,
+    'TaskTradeResponseSchema': TaskTradeResponseSchema,
+    'TaskTradeSchema': TaskTradeSchema,
+    'TokenResponseSchema': TokenResponseSchema,
+    'UnequipSchema': UnequipSchema,
+    'UseItemResponseSchema': UseItemResponseSchema,
+    'UseItemSchema': UseItemSchema,
+    'ValidationError': ValidationError,
+}
+
+class ArtifactsClient:
+    """
+    One method per API operation, each returning the typed response schema.
+
+    Requests go through one keep-alive session shared by the process, or any
+    `request(method, url, **kwargs)` callable, e.g. the journalling one.
+    """
+    def __init__(self, token: Optional[str] = None, base_url: str = "https://api.artifactsmmo.com", request=None):
+        self.base_url = base_url.rstrip("/")
+        self.headers = {"Accept": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self._request = request
+
+    def _call(self, method: str, path: str, schema, body: Optional[Dict] = None, auth=None):
+        request = self._request or send
+        response = request(method, self.base_url + path, headers=self.headers, json=body, auth=auth, timeout=TIMEOUT)
+        if response.status_code != 200:
+            try:
+                payload = response.json()
+                message = (payload.get("error") or {}).get("message", "")
+            except ValueError:
+                payload, message = None, response.text
+            raise ApiError(response.status_code, message, payload)
+        return schema(response.json())
+
+    def get_bank_details(self) -> 'BankResponseSchema':
+        """Fetch bank details."""
+        return self._call('GET', "/my/bank", BankResponseSchema)
+
+    def get_bank_items(self, item_code: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_SimpleItemSchema':
+        """Fetch all items in your bank."""
+        return self._call('GET', "/my/bank/items" + _query(item_code=item_code, page=page, size=size), DataPage_SimpleItemSchema)
+
+    def get_my_ge_sell_orders(self, code: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_GEOrderSchema':
+        """Fetch your sell orders details."""
+        return self._call('GET', "/my/grandexchange/orders" + _query(code=code, page=page, size=size), DataPage_GEOrderSchema)
+
+    def get_my_ge_sell_history(self, id: Optional[str] = None, code: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_GeOrderHistorySchema':
+        """Fetch your sales history of the last 7 days."""
+        return self._call('GET', "/my/grandexchange/history" + _query(id=id, code=code, page=page, size=size), DataPage_GeOrderHistorySchema)
+
+    def get_account_details(self) -> 'MyAccountDetailsSchema':
+        """Fetch account details."""
+        return self._call('GET', "/my/details", MyAccountDetailsSchema)
+
+    def change_password(self, current_password: str, new_password: str) -> 'ResponseSchema':
+        """Change your account password. Changing the password reset the account token."""
+        return self._call('POST', "/my/change_password", ResponseSchema, _body(current_password=current_password, new_password=new_password))
+
+    def action_move(self, name: str, x: int, y: int) -> 'CharacterMovementResponseSchema':
+        """Moves a character on the map using the map's X and Y position."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/move", CharacterMovementResponseSchema, _body(x=x, y=y))
+
+    def action_rest(self, name: str) -> 'CharacterRestResponseSchema':
+        """Recovers hit points by resting. (1 second per 5 HP, minimum 3 seconds)"""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/rest", CharacterRestResponseSchema)
+
+    def action_equip_item(self, name: str, code: str, slot: str, quantity: Optional[int] = None) -> 'EquipmentResponseSchema':
+        """Equip an item on your character."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/equip", EquipmentResponseSchema, _body(code=code, slot=slot, quantity=quantity))
+
+    def action_unequip_item(self, name: str, slot: str, quantity: Optional[int] = None) -> 'EquipmentResponseSchema':
+        """Unequip an item on your character."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/unequip", EquipmentResponseSchema, _body(slot=slot, quantity=quantity))
+
+    def action_use_item(self, name: str, code: str, quantity: int) -> 'UseItemResponseSchema':
+        """Use an item as a consumable."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/use", UseItemResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_fight(self, name: str) -> 'CharacterFightResponseSchema':
+        """Start a fight against a monster on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/fight", CharacterFightResponseSchema)
+
+    def action_gathering(self, name: str) -> 'SkillResponseSchema':
+        """Harvest a resource on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/gathering", SkillResponseSchema)
+
+    def action_crafting(self, name: str, code: str, quantity: Optional[int] = None) -> 'SkillResponseSchema':
+        """Crafting an item. The character must be on a map with a workshop."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/crafting", SkillResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_deposit_bank_gold(self, name: str, quantity: int) -> 'BankGoldTransactionResponseSchema':
+        """Deposit gold in a bank on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/bank/deposit/gold", BankGoldTransactionResponseSchema, _body(quantity=quantity))
+
+    def action_deposit_bank(self, name: str, code: str, quantity: int) -> 'BankItemTransactionResponseSchema':
+        """Deposit an item in a bank on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/bank/deposit", BankItemTransactionResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_withdraw_bank(self, name: str, code: str, quantity: int) -> 'BankItemTransactionResponseSchema':
+        """Take an item from your bank and put it in the character's inventory."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/bank/withdraw", BankItemTransactionResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_withdraw_bank_gold(self, name: str, quantity: int) -> 'BankGoldTransactionResponseSchema':
+        """Withdraw gold from your bank."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/bank/withdraw/gold", BankGoldTransactionResponseSchema, _body(quantity=quantity))
+
+    def action_buy_bank_expansion(self, name: str) -> 'BankExtensionTransactionResponseSchema':
+        """Buy a 20 slots bank expansion."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/bank/buy_expansion", BankExtensionTransactionResponseSchema)
+
+    def action_npc_buy_item(self, name: str, code: str, quantity: int) -> 'NpcMerchantTransactionResponseSchema':
+        """Buy an item from an NPC on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/npc/buy", NpcMerchantTransactionResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_npc_sell_item(self, name: str, code: str, quantity: int) -> 'NpcMerchantTransactionResponseSchema':
+        """Sell an item to an NPC on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/npc/sell", NpcMerchantTransactionResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_recycling(self, name: str, code: str, quantity: Optional[int] = None) -> 'RecyclingResponseSchema':
+        """Recycling an item. The character must be on a map with a workshop (only for equipments and weapons)."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/recycling", RecyclingResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_ge_buy_item(self, name: str, id: str, quantity: int) -> 'GETransactionResponseSchema':
+        """Buy an item at the Grand Exchange on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/grandexchange/buy", GETransactionResponseSchema, _body(id=id, quantity=quantity))
+
+    def action_ge_create_sell_order(self, name: str, code: str, quantity: int, price: int) -> 'GECreateOrderTransactionResponseSchema':
+        """Create a sell order at the Grand Exchange on the character's map. Please note that a 5% sales tax is charged."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/grandexchange/sell", GECreateOrderTransactionResponseSchema, _body(code=code, quantity=quantity, price=price))
+
+    def action_ge_cancel_sell_order(self, name: str, id: str) -> 'GETransactionResponseSchema':
+        """Cancel a sell order at the Grand Exchange on the character's map."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/grandexchange/cancel", GETransactionResponseSchema, _body(id=id))
+
+    def action_complete_task(self, name: str) -> 'RewardDataResponseSchema':
+        """Complete a task."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/task/complete", RewardDataResponseSchema)
+
+    def action_task_exchange(self, name: str) -> 'RewardDataResponseSchema':
+        """Exchange 6 tasks coins for a random reward. Rewards are exclusive items or resources."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/task/exchange", RewardDataResponseSchema)
+
+    def action_accept_new_task(self, name: str) -> 'TaskResponseSchema':
+        """Accepting a new task."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/task/new", TaskResponseSchema)
+
+    def action_task_trade(self, name: str, code: str, quantity: int) -> 'TaskTradeResponseSchema':
+        """Trading items with a Tasks Master."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/task/trade", TaskTradeResponseSchema, _body(code=code, quantity=quantity))
+
+    def action_task_cancel(self, name: str) -> 'TaskCancelledResponseSchema':
+        """Cancel a task for 1 tasks coin."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/task/cancel", TaskCancelledResponseSchema)
+
+    def action_delete_item(self, name: str, code: str, quantity: int) -> 'DeleteItemResponseSchema':
+        """Delete an item from your character's inventory."""
+        return self._call('POST', f"/my/{quote(str(name), safe='')}/action/delete", DeleteItemResponseSchema, _body(code=code, quantity=quantity))
+
+    def get_all_characters_logs(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_LogSchema':
+        """History of the last 100 actions of all your characters."""
+        return self._call('GET', "/my/logs" + _query(page=page, size=size), DataPage_LogSchema)
+
+    def get_my_characters(self) -> 'MyCharactersListSchema':
+        """List of your characters."""
+        return self._call('GET', "/my/characters", MyCharactersListSchema)
+
+    def create_account(self, username: str, password: str, email: Optional[str] = None) -> 'ResponseSchema':
+        """Create Account"""
+        return self._call('POST', "/accounts/create", ResponseSchema, _body(username=username, password=password, email=email))
+
+    def get_account_achievements(self, account: str, type: Optional[str] = None, completed: Optional[bool] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_AccountAchievementSchema':
+        """Retrieve the achievements of a account."""
+        return self._call('GET', f"/accounts/{quote(str(account), safe='')}/achievements" + _query(type=type, completed=completed, page=page, size=size), DataPage_AccountAchievementSchema)
+
+    def get_account(self, account: str) -> 'AccountDetailsSchema':
+        """Retrieve the details of a character."""
+        return self._call('GET', f"/accounts/{quote(str(account), safe='')}", AccountDetailsSchema)
+
+    def get_all_achievements(self, type: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_AchievementSchema':
+        """List of all achievements."""
+        return self._call('GET', "/achievements" + _query(type=type, page=page, size=size), DataPage_AchievementSchema)
+
+    def get_achievement(self, code: str) -> 'AchievementResponseSchema':
+        """Retrieve the details of a achievement."""
+        return self._call('GET', f"/achievements/{quote(str(code), safe='')}", AchievementResponseSchema)
+
+    def get_all_badges(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_BadgeSchema':
+        """List of all badges."""
+        return self._call('GET', "/badges" + _query(page=page, size=size), DataPage_BadgeSchema)
+
+    def get_badge(self, code: str) -> 'BadgeResponseSchema':
+        """Retrieve the details of a badge."""
+        return self._call('GET', f"/badges/{quote(str(code), safe='')}", BadgeResponseSchema)
+
+    def create_character(self, name: str, skin: str) -> 'CharacterResponseSchema':
+        """Create new character on your account. You can create up to 5 characters."""
+        return self._call('POST', "/characters/create", CharacterResponseSchema, _body(name=name, skin=skin))
+
+    def delete_character(self, name: str) -> 'CharacterResponseSchema':
+        """Delete character on your account."""
+        return self._call('POST', "/characters/delete", CharacterResponseSchema, _body(name=name))
+
+    def get_character(self, name: str) -> 'CharacterResponseSchema':
+        """Retrieve the details of a character."""
+        return self._call('GET', f"/characters/{quote(str(name), safe='')}", CharacterResponseSchema)
+
+    def get_all_effects(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_EffectSchema':
+        """List of all effects. Effects are used by equipment, tools, runes, consumables and monsters. An effect is an action that produces an effect on the game."""
+        return self._call('GET', "/effects" + _query(page=page, size=size), DataPage_EffectSchema)
+
+    def get_effect(self, code: str) -> 'EffectResponseSchema':
+        """Retrieve the details of a badge."""
+        return self._call('GET', f"/effects/{quote(str(code), safe='')}", EffectResponseSchema)
+
+    def get_all_active_events(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_ActiveEventSchema':
+        """Fetch active events details."""
+        return self._call('GET', "/events/active" + _query(page=page, size=size), DataPage_ActiveEventSchema)
+
+    def get_all_events(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_EventSchema':
+        """Fetch events details."""
+        return self._call('GET', "/events" + _query(page=page, size=size), DataPage_EventSchema)
+
+    def get_ge_sell_history(self, code: str, seller: Optional[str] = None, buyer: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_GeOrderHistorySchema':
+        """Fetch the sales history of the item for the last 7 days."""
+        return self._call('GET', f"/grandexchange/history/{quote(str(code), safe='')}" + _query(seller=seller, buyer=buyer, page=page, size=size), DataPage_GeOrderHistorySchema)
+
+    def get_ge_sell_orders(self, code: Optional[str] = None, seller: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_GEOrderSchema':
+        """Fetch all sell orders."""
+        return self._call('GET', "/grandexchange/orders" + _query(code=code, seller=seller, page=page, size=size), DataPage_GEOrderSchema)
+
+    def get_ge_sell_order(self, id: str) -> 'GEOrderReponseSchema':
+        """Retrieve the sell order of a item."""
+        return self._call('GET', f"/grandexchange/orders/{quote(str(id), safe='')}", GEOrderReponseSchema)
+
+    def get_all_items(self, min_level: Optional[int] = None, max_level: Optional[int] = None, name: Optional[str] = None, type: Optional[str] = None, craft_skill: Optional[str] = None, craft_material: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_ItemSchema':
+        """Fetch items details."""
+        return self._call('GET', "/items" + _query(min_level=min_level, max_level=max_level, name=name, type=type, craft_skill=craft_skill, craft_material=craft_material, page=page, size=size), DataPage_ItemSchema)
+
+    def get_item(self, code: str) -> 'ItemResponseSchema':
+        """Retrieve the details of a item."""
+        return self._call('GET', f"/items/{quote(str(code), safe='')}", ItemResponseSchema)
+
+    def get_characters_leaderboard(self, sort: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_CharacterLeaderboardSchema':
+        """Fetch leaderboard details."""
+        return self._call('GET', "/leaderboard/characters" + _query(sort=sort, page=page, size=size), DataPage_CharacterLeaderboardSchema)
+
+    def get_accounts_leaderboard(self, sort: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_AccountLeaderboardSchema':
+        """Fetch leaderboard details."""
+        return self._call('GET', "/leaderboard/accounts" + _query(sort=sort, page=page, size=size), DataPage_AccountLeaderboardSchema)
+
+    def get_all_maps(self, content_type: Optional[str] = None, content_code: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_MapSchema':
+        """Fetch maps details."""
+        return self._call('GET', "/maps" + _query(content_type=content_type, content_code=content_code, page=page, size=size), DataPage_MapSchema)
+
+    def get_map(self, x: int, y: int) -> 'MapResponseSchema':
+        """Retrieve the details of a map."""
+        return self._call('GET', f"/maps/{quote(str(x), safe='')}/{quote(str(y), safe='')}", MapResponseSchema)
+
+    def get_all_monsters(self, min_level: Optional[int] = None, max_level: Optional[int] = None, drop: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_MonsterSchema':
+        """Fetch monsters details."""
+        return self._call('GET', "/monsters" + _query(min_level=min_level, max_level=max_level, drop=drop, page=page, size=size), DataPage_MonsterSchema)
+
+    def get_monster(self, code: str) -> 'MonsterResponseSchema':
+        """Retrieve the details of a monster."""
+        return self._call('GET', f"/monsters/{quote(str(code), safe='')}", MonsterResponseSchema)
+
+    def get_all_npcs(self, type: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_NPCSchema':
+        """Fetch NPCs details."""
+        return self._call('GET', "/npcs" + _query(type=type, page=page, size=size), DataPage_NPCSchema)
+
+    def get_npc(self, code: str) -> 'NPCResponseSchema':
+        """Retrieve the details of a NPC."""
+        return self._call('GET', f"/npcs/{quote(str(code), safe='')}", NPCResponseSchema)
+
+    def get_npc_items(self, code: str, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_NPCItem':
+        """Retrieve the items list of a NPC. If the NPC has items to buy or sell, they will be displayed."""
+        return self._call('GET', f"/npcs/{quote(str(code), safe='')}/items" + _query(page=page, size=size), DataPage_NPCItem)
+
+    def get_all_resources(self, min_level: Optional[int] = None, max_level: Optional[int] = None, skill: Optional[str] = None, drop: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_ResourceSchema':
+        """Fetch resources details."""
+        return self._call('GET', "/resources" + _query(min_level=min_level, max_level=max_level, skill=skill, drop=drop, page=page, size=size), DataPage_ResourceSchema)
+
+    def get_resource(self, code: str) -> 'ResourceResponseSchema':
+        """Retrieve the details of a resource."""
+        return self._call('GET', f"/resources/{quote(str(code), safe='')}", ResourceResponseSchema)
+
+    def get_all_tasks(self, min_level: Optional[int] = None, max_level: Optional[int] = None, skill: Optional[str] = None, type: Optional[str] = None, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_TaskFullSchema':
+        """Fetch the list of all tasks."""
+        return self._call('GET', "/tasks/list" + _query(min_level=min_level, max_level=max_level, skill=skill, type=type, page=page, size=size), DataPage_TaskFullSchema)
+
+    def get_task(self, code: str) -> 'TaskFullResponseSchema':
+        """Retrieve the details of a task."""
+        return self._call('GET', f"/tasks/list/{quote(str(code), safe='')}", TaskFullResponseSchema)
+
+    def get_all_tasks_rewards(self, page: Optional[int] = None, size: Optional[int] = None) -> 'DataPage_DropRateSchema':
+        """Fetch the list of all tasks rewards. To obtain these rewards, you must exchange 6 task coins with a tasks master."""
+        return self._call('GET', "/tasks/rewards" + _query(page=page, size=size), DataPage_DropRateSchema)
+
+    def get_tasks_reward(self, code: str) -> 'RewardResponseSchema':
+        """Retrieve the details of a tasks reward."""
+        return self._call('GET', f"/tasks/rewards/{quote(str(code), safe='')}", RewardResponseSchema)
+
+    def generate_token(self, username: str, password: str) -> 'TokenResponseSchema':
+        """Use your account as HTTPBasic Auth to generate your token to use the API. You can also generate your token directly on the website."""
+        return self._call('POST', "/token", TokenResponseSchema, auth=(username, password))
+
+    def get_status(self) -> 'StatusResponseSchema':
+        """Return the status of the game server."""
+        return self._call('GET', "/", StatusResponseSchema)
@@ -0,0 +1,181 @@
+import math
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+import numpy as np
+from artifactsmmo_wrapper.subclasses import Item, Monster
+
+ELEMENTS = ['air', 'earth', 'fire', 'water']
+
+# Each attack is one turn, the character always strikes first
+MAX_TURNS = 100
+CRITICAL_MULTIPLIER = 1.5
+# Not in monster_cache, most monsters carry a small crit chance
+MONSTER_CRITICAL_STRIKE = 5
+SAMPLES = 256
+# Fights below this are not worth the cooldown and the walk back from spawn
+MIN_WIN_PROBABILITY = 0.9
+
+@dataclass
+class CombatStats:
+    """The fight-relevant stats of a character wearing a given set of gear."""
+    hp: int
+    max_hp: int
+    attack: Dict[str, int] = field(default_factory=dict)
+    dmg: Dict[str, int] = field(default_factory=dict)
+    res: Dict[str, int] = field(default_factory=dict)
+    dmg_all: int = 0
+    critical_strike: int = 0
+    haste: int = 0
+    lifesteal: int = 0
+
+    @classmethod
+    def from_character(cls, char, rested: bool = False) -> "CombatStats":
+        """Stats of the character as it stands, with full hp if it will rest before fighting."""
+        return cls(
+            hp=char.max_hp if rested else char.hp,
+            max_hp=char.max_hp,
+            attack={element: getattr(char, f"attack_{element}") for element in ELEMENTS},
+            dmg={element: getattr(char, f"dmg_{element}") for element in ELEMENTS},
+            res={element: getattr(char, f"res_{element}") for element in ELEMENTS},
+            dmg_all=char.dmg,
+            critical_strike=char.critical_strike,
+            haste=char.haste,
+        )
+
+    def swap(self, removed: List[Item], added: List[Item]) -> "CombatStats":
+        """Stats after taking off the removed items and putting on the added ones."""
+        stats = replace(self, attack=dict(self.attack), dmg=dict(self.dmg), res=dict(self.res))
+        for items, sign in ((removed, -1), (added, 1)):
+            for item in items:
+                if item is None:
+                    continue
+                for effect in item.effects:
+                    stats._apply(effect.code, sign * effect.attributes.get('value', 0))
+        return stats
+
+    def _apply(self, code: str, value: int):
+        if code == 'hp':
+            self.hp += value
+            self.max_hp += value
+        elif code == 'dmg':
+            self.dmg_all += value
+        elif code in ('critical_strike', 'haste', 'lifesteal'):
+            setattr(self, code, getattr(self, code) + value)
+        else:
+            prefix, _, element = code.partition('_')
+            if element in ELEMENTS and prefix in ('attack', 'dmg', 'res'):
+                stats = getattr(self, prefix)
+                stats[element] = stats.get(element, 0) + value
+
+    def hit(self, monster: Monster) -> int:
+        """Damage of one normal character attack on the monster."""
+        total = 0
+        for element in ELEMENTS:
+            attack = round(self.attack.get(element, 0) * (1 + (self.dmg_all + self.dmg.get(element, 0)) / 100))
+            total += round(attack * (1 - getattr(monster, f"res_{element}") / 100))
+        return max(total, 0)
+
+    def hit_by(self, monster: Monster) -> int:
+        """Damage of one normal monster attack on the character."""
+        total = 0
+        for element in ELEMENTS:
+            total += round(getattr(monster, f"attack_{element}") * (1 - self.res.get(element, 0) / 100))
+        return max(total, 0)
+
+@dataclass
+class FightPrediction:
+    monster: str
+    win_probability: float
+    turns: float
+    hp_lost: float
+    cooldown: float
+
+    @property
+    def winnable(self) -> bool:
+        return self.win_probability >= MIN_WIN_PROBABILITY
+
+    @property
+    def rounds(self) -> int:
+        """Character attacks in the fight, the unit gear scoring works in."""
+        return max(math.ceil(self.turns / 2), 1)
+
+def fight_cooldown(turns: np.ndarray, haste: np.ndarray) -> np.ndarray:
+    """Seconds of cooldown a fight costs, two per turn less haste."""
+    return np.maximum(np.round(2 * turns * (1 - haste / 100)), 5)
+
+def simulate(fighters: List[CombatStats], monsters: List[Monster], samples: int = SAMPLES,
+             rng: Optional[np.random.Generator] = None) -> List[FightPrediction]:
+    """
+    Plays out fights locally, all of them at once.
+
+    Either list may hold a single entry, which then faces every entry of the
+    other: one character against many monsters, or many loadouts against
+    one monster. Otherwise fighters[i] faces monsters[i].
+
+    Args:
+        fighters (List[CombatStats]): The character stats for each fight.
+        monsters (List[Monster]): The monster for each fight.
+        samples (int): Fights played per pair, critical strikes are random.
+        rng (np.random.Generator): Random source, for repeatable results.
+
+    Returns:
+        List[FightPrediction]: One prediction per pair.
+    """
+    count = max(len(fighters), len(monsters))
+    if count == 0:
+        return []
+    if len(fighters) == 1:
+        fighters = fighters * count
+    if len(monsters) == 1:
+        monsters = monsters * count
+    if len(fighters) != len(monsters):
+        raise ValueError(f"simulate got {len(fighters)} fighters for {len(monsters)} monsters")
+    rng = rng or np.random.default_rng()
+
+    character_hit = np.array([[fighter.hit(monster)] for fighter, monster in zip(fighters, monsters)], dtype=float)
+    monster_hit = np.array([[fighter.hit_by(monster)] for fighter, monster in zip(fighters, monsters)], dtype=float)
+    character_crit = np.array([[fighter.critical_strike / 100] for fighter in fighters])
+    lifesteal = np.array([[fighter.lifesteal / 100] for fighter in fighters])
+    max_hp = np.array([[fighter.max_hp] for fighter in fighters], dtype=float)
+    start_hp = np.array([[fighter.hp] for fighter in fighters], dtype=float)
+
+    character_hp = np.repeat(start_hp, samples, axis=1)
+    monster_hp = np.repeat(np.array([[monster.hp] for monster in monsters], dtype=float), samples, axis=1)
+    active = np.ones((count, samples), dtype=bool)
+    won = np.zeros((count, samples), dtype=bool)
+    turns = np.full((count, samples), MAX_TURNS, dtype=float)
+
+    for turn in range(1, MAX_TURNS + 1):
+        if turn % 2:
+            crit = rng.random((count, samples)) < character_crit
+            damage = np.where(crit, np.round(character_hit * CRITICAL_MULTIPLIER), character_hit) * active
+            monster_hp -= damage
+            character_hp = np.minimum(character_hp + np.where(crit, damage * lifesteal, 0), max_hp)
+            ended = active & (monster_hp <= 0)
+            won |= ended
+        else:
+            crit = rng.random((count, samples)) < MONSTER_CRITICAL_STRIKE / 100
+            character_hp -= np.where(crit, np.round(monster_hit * CRITICAL_MULTIPLIER), monster_hit) * active
+            ended = active & (character_hp <= 0)
+        turns[ended] = turn
+        active &= ~ended
+        if not active.any():
+            break
+
+    hp_lost = start_hp - np.maximum(character_hp, 0)
+    haste = np.array([[fighter.haste] for fighter in fighters], dtype=float)
+    cooldown = fight_cooldown(turns, haste)
+    return [
+        FightPrediction(
+            monster=monster.code,
+            win_probability=float(won[row].mean()),
+            turns=float(turns[row].mean()),
+            hp_lost=float(hp_lost[row].mean()),
+            cooldown=float(cooldown[row].mean()),
+        )
+        for row, monster in enumerate(monsters)
+    ]
+
+def predict(fighter: CombatStats, monster: Monster) -> FightPrediction:
+    return simulate([fighter], [monster])[0]
@@ -18,4 +18,10 @@ def load_config():
 config = load_config()
 TOKEN = config['DEFAULT']['token']
 if not TOKEN:
-    os.getenv("SECRET_TOKEN")
\ No newline at end of file
+    os.getenv("SECRET_TOKEN")
+
+# Another server speaking the Artifacts API, e.g. the local mock in work/mock_server.py
+API_BASE_URL = config['DEFAULT'].get('api_base_url', '')
+
+# 'wrapper' for artifactsmmo_wrapper, 'typed' for the client generated from work/openapi.json
+CLIENT = config['DEFAULT'].get('client', 'wrapper')
@@ -0,0 +1,131 @@
+import math
+import threading
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Dict, List, Optional, Tuple
+
+from work.catalog import GameCatalog, get_catalog
+
+# Healing an extra use_item or withdraw must save to be worth its cooldown
+ACTION_HP = 25
+
+@dataclass
+class FoodPlan:
+    """What to withdraw and eat to cover a deficit, one action per code."""
+    deficit: int
+    healed: int = 0
+    withdraw: List[Tuple[str, int]] = field(default_factory=list)
+    eat: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def full(self) -> bool:
+        return self.healed >= self.deficit
+
+class FoodPlanner:
+    """
+    Picks the food that heals a deficit most exactly in the fewest actions.
+
+    Heal values come from the catalog once. A plan is a small bounded
+    knapsack over what the inventory and bank hold, counting the portions
+    withdrawn against the free inventory space: heal the whole deficit if the
+    food allows, then waste as little healing as possible, counting each
+    use_item and withdraw as ACTION_HP of waste.
+    """
+    def __init__(self, catalog: GameCatalog):
+        # code -> (heal, level)
+        self.heals: Dict[str, Tuple[int, int]] = {}
+        for item in catalog.items_of_type('consumable', 'food'):
+            heal = sum(effect.attributes.get('value', 0) for effect in item.effects if effect.code == 'heal')
+            if heal > 0:
+                self.heals[item.code] = (heal, item.level or 1)
+
+    def plan(self, deficit: int, inventory: Dict[str, int], bank: Optional[Dict[str, int]] = None, level: int = 1,
+             space: Optional[int] = None) -> FoodPlan:
+        """
+        Plans eating for an HP deficit.
+
+        Args:
+            deficit (int): max_hp - hp.
+            inventory (Dict[str, int]): Quantity by code in the inventory, eaten first.
+            bank (Dict[str, int]): Quantity by code that can be withdrawn, none if not given.
+            level (int): The character's level, food above it cannot be eaten.
+            space (int): Free inventory space, how many portions can be withdrawn in all.
+
+        Returns:
+            FoodPlan: Empty if there is nothing to eat or nothing to heal.
+        """
+        result = FoodPlan(deficit)
+        bank = bank or {}
+        foods = []
+        budget = 0
+        for code in sorted(set(inventory) | set(bank)):
+            heal, food_level = self.heals.get(code, (0, 0))
+            if heal and food_level <= level:
+                held = inventory.get(code, 0)
+                # Anything past ceil(deficit / heal) of one food is only waste
+                useful = math.ceil(deficit / heal)
+                available = min(held + bank.get(code, 0), useful)
+                if available > 0:
+                    foods.append((code, heal, held, available))
+                    budget += max(available - held, 0)
+        if deficit <= 0 or not foods:
+            return result
+        if space is not None:
+            budget = min(budget, max(space, 0))
+
+        # Heal sums in units of the heals' common divisor keep the table small
+        unit = reduce(math.gcd, (heal for _, heal, _, _ in foods))
+        target = math.ceil(deficit / unit)
+        # Past the target plus the largest heal, dropping any one portion still heals fully
+        cap = target + max(heal for _, heal, _, _ in foods) // unit
+        # (heal units, portions withdrawn) -> fewest actions, the withdrawals share the free space
+        actions: Dict[Tuple[int, int], int] = {(0, 0): 0}
+        choices: List[Dict[Tuple[int, int], int]] = []
+        for code, heal, held, available in foods:
+            step = heal // unit
+            chosen: Dict[Tuple[int, int], int] = {}
+            updated = dict(actions)
+            for (total, withdrawn), count in actions.items():
+                for quantity in range(1, available + 1):
+                    state = (total + quantity * step, withdrawn + max(quantity - held, 0))
+                    if state[0] > cap or state[1] > budget:
+                        break
+                    cost = count + 1 + (1 if quantity > held else 0)
+                    if state not in updated or cost < updated[state]:
+                        updated[state] = cost
+                        chosen[state] = quantity
+            actions = updated
+            choices.append(chosen)
+
+        def score(state: Tuple[int, int]):
+            total = state[0]
+            shortfall = max(target - total, 0)
+            return shortfall, max(total - target, 0) * unit + actions[state] * ACTION_HP
+        best = min((state for state in actions if state[0] > 0), key=score, default=None)
+        if best is None:
+            return result
+
+        total, withdrawn = best
+        for (code, heal, held, _), chosen in zip(reversed(foods), reversed(choices)):
+            quantity = chosen.get((total, withdrawn), 0)
+            taken = max(quantity - held, 0)
+            total -= quantity * (heal // unit)
+            withdrawn -= taken
+            if taken:
+                result.withdraw.append((code, taken))
+            if quantity:
+                result.eat.append((code, quantity))
+        result.healed = sum(quantity * self.heals[code][0] for code, quantity in result.eat)
+        return result
+
+_food_planner: Optional[FoodPlanner] = None
+_food_planner_lock = threading.Lock()
+
+def get_food_planner() -> FoodPlanner:
+    """Returns the process-wide food planner, its heal table built on first use."""
+    global _food_planner
+    if _food_planner is None:
+        with _food_planner_lock:
+            if _food_planner is None:
+                _food_planner = FoodPlanner(get_catalog())
+    return _food_planner
@@ -0,0 +1,185 @@
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from artifactsmmo_wrapper.subclasses import Monster
+
+from work.catalog import GameCatalog, get_catalog
+
+ELEMENTS = ['air', 'earth', 'fire', 'water']
+
+# Item type -> character slot attributes it can go in
+SLOTS = {
+    'weapon': ['weapon_slot'],
+    'rune': ['rune_slot'],
+    'shield': ['shield_slot'],
+    'helmet': ['helmet_slot'],
+    'body_armor': ['body_armor_slot'],
+    'leg_armor': ['leg_armor_slot'],
+    'boots': ['boots_slot'],
+    'ring': ['ring1_slot', 'ring2_slot'],
+    'amulet': ['amulet_slot'],
+    'bag': ['bag_slot'],
+    'artifact': ['artifact1_slot', 'artifact2_slot', 'artifact3_slot'],
+}
+
+# The same artifact cannot be worn twice
+UNIQUE_TYPES = {'artifact'}
+
+# Effects worth value * rounds, and flat effects
+PER_ROUND_EFFECTS = ['restore', 'lifesteal', 'heal']
+FLAT_EFFECTS = {'hp': 1.0, 'prospecting': 0.1, 'wisdom': 0.1}
+
+class GearScorer:
+    """
+    Every equippable item in the catalog compiled into one effect matrix.
+
+    Scores follow CharacterAPI.calculate_item_value, but a whole bank is
+    scored against a monster with a couple of matrix operations.
+    """
+    def __init__(self, catalog: GameCatalog):
+        items = [item for item_type in SLOTS for item in catalog.items_of_type(item_type)]
+        effect_codes = sorted({effect.code for item in items for effect in item.effects})
+
+        self.codes: List[str] = [item.code for item in items]
+        self.rows: Dict[str, int] = {code: row for row, code in enumerate(self.codes)}
+        self.types = np.array([item.type for item in items], dtype=object)
+        self.levels = np.array([item.level for item in items])
+        self.columns: Dict[str, int] = {code: column for column, code in enumerate(effect_codes)}
+
+        self.values = np.zeros((len(items), len(effect_codes)))
+        self.present = np.zeros((len(items), len(effect_codes)), dtype=bool)
+        for row, item in enumerate(items):
+            for effect in item.effects:
+                column = self.columns[effect.code]
+                self.values[row, column] = effect.attributes.get('value', 0)
+                self.present[row, column] = True
+
+        # Elemental attack columns are scored against the monster's resistance
+        self.attack_columns: List[int] = []
+        self.attack_elements: List[str] = []
+        for element in ELEMENTS:
+            for prefix in ('attack_', 'dmg_', 'boost_dmg_'):
+                column = self.columns.get(f"{prefix}{element}")
+                if column is not None:
+                    self.attack_columns.append(column)
+                    self.attack_elements.append(element)
+
+    def weapon_elements(self, code: str) -> List[str]:
+        row = self.rows.get(code)
+        if row is None:
+            return []
+        return [element for element in ELEMENTS
+                if f"attack_{element}" in self.columns and self.present[row, self.columns[f"attack_{element}"]]]
+
+    def score(self, monster: Monster, weapon_attack_elements: List[str], estimated_rounds: float = 40) -> np.ndarray:
+        """
+        Scores every compiled item against the monster. Returns one value per row.
+        """
+        weights = np.zeros(len(self.columns))
+        for code, weight in FLAT_EFFECTS.items():
+            if code in self.columns:
+                weights[self.columns[code]] = weight
+        for code in PER_ROUND_EFFECTS:
+            if code in self.columns:
+                weights[self.columns[code]] = estimated_rounds
+        if 'dmg' in self.columns:
+            weights[self.columns['dmg']] = estimated_rounds * len(weapon_attack_elements)
+        for element in ELEMENTS:
+            column = self.columns.get(f"res_{element}")
+            if column is not None and getattr(monster, f"attack_{element}") > 0:
+                weights[column] = estimated_rounds
+        # critical_strike is not counted, same as calculate_item_value
+        scores = self.values @ weights
+
+        if self.attack_columns:
+            resistances = np.array([getattr(monster, f"res_{element}") for element in self.attack_elements])
+            active = np.array([not weapon_attack_elements or element in weapon_attack_elements
+                               for element in self.attack_elements])
+            attack = self.values[:, self.attack_columns]
+            boosted = np.maximum(attack - resistances, 0) * self.present[:, self.attack_columns]
+            scores += boosted @ (active * estimated_rounds)
+        return scores
+
+    def best_loadout(self, monster: Monster, contents: List[Dict], equipped: Dict[str, str], level: int,
+                     banned_items: List[str] = (), estimated_rounds: float = 40) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Picks the best item for every slot from the bank and what is already worn.
+
+        The weapon is chosen first and its attack elements weight the rest.
+
+        Args:
+            monster (Monster): The monster to gear up against.
+            contents (List[Dict]): Bank contents, as from get_bank_contents.
+            equipped (Dict[str, str]): Slot attribute (e.g. "ring1_slot") to the item code worn there.
+            level (int): Character level, higher level items are skipped.
+            banned_items (List[str]): Codes not to pick, e.g. ones that failed to equip.
+            estimated_rounds (float): Expected rounds of the fight.
+
+        Returns:
+            Tuple[Dict[str, str], List[str]]: Slot attribute to item code for every slot, and the weapon's attack elements.
+        """
+        available = Counter()
+        for item in contents:
+            if item['code'] in self.rows and item['code'] not in banned_items:
+                available[item['code']] += item['quantity']
+
+        loadout: Dict[str, str] = {}
+        weapon_scores = self.score(monster, [], estimated_rounds)
+        loadout.update(self._fill('weapon', weapon_scores, available, equipped, level))
+        weapon_attack_elements = self.weapon_elements(loadout.get('weapon_slot'))
+
+        scores = self.score(monster, weapon_attack_elements, estimated_rounds)
+        for item_type in SLOTS:
+            if item_type != 'weapon':
+                loadout.update(self._fill(item_type, scores, available, equipped, level))
+        return loadout, weapon_attack_elements
+
+    def _fill(self, item_type: str, scores: np.ndarray, available: Counter, equipped: Dict[str, str], level: int) -> Dict[str, str]:
+        slots = SLOTS[item_type]
+        incumbents = {slot: equipped.get(slot) or None for slot in slots}
+
+        # Each usable unit is a (score, keep, code): worn items first on ties
+        units = []
+        worn = Counter(code for code in incumbents.values() if code)
+        for code, count in worn.items():
+            row = self.rows.get(code)
+            units.extend([(scores[row] if row is not None else 0.0, 1, code)] * count)
+        for code, quantity in available.items():
+            row = self.rows[code]
+            if self.types[row] != item_type or self.levels[row] > level or scores[row] <= 0:
+                continue
+            if item_type in UNIQUE_TYPES:
+                quantity = 0 if worn[code] else 1
+            units.extend([(scores[row], 0, code)] * min(quantity, len(slots)))
+
+        chosen = Counter(code for _, _, code in sorted(units, key=lambda unit: (-unit[0], -unit[1]))[:len(slots)])
+
+        # Slots keep what they wear if it made the cut, the rest take the new picks
+        result = {}
+        open_slots = []
+        for slot in slots:
+            code = incumbents[slot]
+            if code and chosen[code] > 0:
+                chosen[code] -= 1
+                result[slot] = code
+            else:
+                open_slots.append(slot)
+        picks = [code for code, count in chosen.items() for _ in range(count)]
+        picks.sort(key=lambda code: -scores[self.rows[code]])
+        for slot in open_slots:
+            result[slot] = picks.pop(0) if picks else incumbents[slot]
+        return result
+
+_gear_scorer: Optional[GearScorer] = None
+_gear_scorer_lock = threading.Lock()
+
+def get_gear_scorer() -> GearScorer:
+    """Returns the process-wide scorer, compiling the catalog on first use."""
+    global _gear_scorer
+    if _gear_scorer is None:
+        with _gear_scorer_lock:
+            if _gear_scorer is None:
+                _gear_scorer = GearScorer(get_catalog())
+    return _gear_scorer
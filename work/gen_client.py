@@ -0,0 +1,273 @@
+import argparse
+import json
+import keyword
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "openapi.json")
+CLIENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client.py")
+
+HEADER = '''# Generated by work/gen_client.py from work/openapi.json (API {version}), do not edit.
+# Regenerate with: python -m work.gen_client
+from typing import Dict, Optional
+from urllib.parse import quote, urlencode
+
+from work.session import send
+
+TIMEOUT = 10
+
+class ApiError(Exception):
+    """A non-200 answer, the message reads "Error <status>: <message>" like the wrapper's errors."""
+    def __init__(self, status: int, message: str, payload=None):
+        super().__init__(f"Error {{status}}: {{message}}")
+        self.status = status
+        self.message = message
+        self.payload = payload
+
+class Field:
+    """A plain value, read from the response dict on access."""
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._data.get(self.name)
+
+class Nested:
+    """A schema value, or list of them, wrapped on first access and kept."""
+    __slots__ = ('name', 'schema', 'many')
+
+    def __init__(self, name: str, schema: str, many: bool = False):
+        self.name = name
+        self.schema = schema
+        self.many = many
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        decoded = obj._decoded
+        if decoded is None:
+            decoded = obj._decoded = {{}}
+        try:
+            return decoded[self.name]
+        except KeyError:
+            pass
+        raw = obj._data.get(self.name)
+        cls = SCHEMAS[self.schema]
+        if raw is None:
+            value = None
+        elif self.many:
+            value = [cls(entry) for entry in raw]
+        else:
+            value = cls(raw)
+        decoded[self.name] = value
+        return value
+
+class Schema:
+    """
+    A view over one decoded JSON object.
+
+    Nothing is converted up front: plain fields are read from the dict when
+    accessed, nested objects are wrapped the first time they are accessed.
+    """
+    __slots__ = ('_data', '_decoded')
+    FIELDS = ()
+
+    def __init__(self, data: Dict):
+        self._data = data
+        self._decoded = None
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict:
+        return self._data
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._data == self._data
+
+    def __repr__(self):
+        return f"{{type(self).__name__}}({{self._data!r}})"
+
+def _body(**fields) -> Dict:
+    return {{key: value for key, value in fields.items() if value is not None}}
+
+def _query(**params) -> str:
+    params = {{key: value for key, value in params.items() if value is not None}}
+    return f"?{{urlencode(params)}}" if params else ""
+'''
+
+CLIENT_HEADER = '''
+class ArtifactsClient:
+    """
+    One method per API operation, each returning the typed response schema.
+
+    Requests go through one keep-alive session shared by the process, or any
+    `request(method, url, **kwargs)` callable, e.g. the journalling one.
+    """
+    def __init__(self, token: Optional[str] = None, base_url: str = "{base_url}", request=None):
+        self.base_url = base_url.rstrip("/")
+        self.headers = {{"Accept": "application/json"}}
+        if token:
+            self.headers["Authorization"] = f"Bearer {{token}}"
+        self._request = request
+
+    def _call(self, method: str, path: str, schema, body: Optional[Dict] = None, auth=None):
+        request = self._request or send
+        response = request(method, self.base_url + path, headers=self.headers, json=body, auth=auth, timeout=TIMEOUT)
+        if response.status_code != 200:
+            try:
+                payload = response.json()
+                message = (payload.get("error") or {{}}).get("message", "")
+            except ValueError:
+                payload, message = None, response.text
+            raise ApiError(response.status_code, message, payload)
+        return schema(response.json())
+'''
+
+def ref_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+def class_name(schema: str) -> str:
+    # Enum schemas like "ItemType_a-zA-Z0-9_-_____" carry their pattern in the name
+    return re.sub(r"\W", "_", schema).strip("_")
+
+def schema_ref(prop: Dict) -> Tuple[Optional[str], bool]:
+    """The object schema a property holds, and whether it is a list of them."""
+    if "$ref" in prop:
+        return ref_name(prop["$ref"]), False
+    for key in ("allOf", "anyOf", "oneOf"):
+        for option in prop.get(key, ()):
+            if "$ref" in option:
+                return ref_name(option["$ref"]), False
+    if prop.get("type") == "array" and "$ref" in prop.get("items", {}):
+        return ref_name(prop["items"]["$ref"]), True
+    return None, False
+
+def is_object(schemas: Dict, name: Optional[str]) -> bool:
+    return name is not None and schemas.get(name, {}).get("type") == "object"
+
+def attribute(name: str) -> str:
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+def docstring(text: str, indent: str) -> str:
+    first = (text or "").strip().splitlines()[0] if (text or "").strip() else ""
+    first = first.replace('"""', "'''").replace("\\", "\\\\")
+    return f'{indent}"""{first}"""\n' if first else ""
+
+def render_schema(name: str, schema: Dict, schemas: Dict) -> str:
+    properties = schema.get("properties", {})
+    lines = [f"class {class_name(name)}(Schema):\n"]
+    lines.append(docstring(schema.get("description") or schema.get("title", name), "    "))
+    lines.append("    __slots__ = ()\n")
+    lines.append(f"    FIELDS = ({''.join(repr(prop) + ', ' for prop in properties)})\n")
+    for prop, spec in properties.items():
+        target, many = schema_ref(spec)
+        if is_object(schemas, target):
+            flag = ", many=True" if many else ""
+            lines.append(f"    {attribute(prop)} = Nested({prop!r}, {class_name(target)!r}{flag})\n")
+        else:
+            lines.append(f"    {attribute(prop)} = Field({prop!r})\n")
+    return "".join(lines)
+
+def base_name(operation_id: str, path: str, method: str) -> str:
+    # FastAPI ids are <function>_<path>_<method>, keep the function
+    suffix = re.sub(r"[^0-9a-zA-Z]", "_", path) + "_" + method
+    return operation_id[:-len(suffix)] if operation_id.endswith(suffix) else operation_id
+
+def method_name(operation_id: str, path: str, method: str, shared: set) -> str:
+    """The function name, the account's own variant of a shared one gets a my_ prefix."""
+    name = base_name(operation_id, path, method)
+    if name in shared and path.startswith("/my/"):
+        name = name.replace("get_", "get_my_", 1)
+    return name
+
+PY_TYPES = {"integer": "int", "number": "float", "string": "str", "boolean": "bool"}
+
+def py_type(spec: Dict) -> str:
+    """int, str, ... for a parameter or property, nullable options ignored, Optional added by the caller."""
+    for option in [spec] + spec.get("anyOf", []):
+        if option.get("type") in PY_TYPES:
+            return PY_TYPES[option["type"]]
+    return "str"
+
+def render_operation(path: str, method: str, op: Dict, spec: Dict, shared: set) -> str:
+    schemas = spec["components"]["schemas"]
+    name = method_name(op["operationId"], path, method, shared)
+    response = ref_name(op["responses"]["200"]["content"]["application/json"]["schema"]["$ref"])
+
+    types: Dict[str, str] = {}
+    path_params: List[str] = []
+    query_params: List[str] = []
+    for param in op.get("parameters", []):
+        types[param["name"]] = py_type(param.get("schema", {}))
+        (path_params if param["in"] == "path" else query_params).append(param["name"])
+    body_props: List[str] = []
+    required: List[str] = []
+    if "requestBody" in op:
+        body = schemas[ref_name(op["requestBody"]["content"]["application/json"]["schema"]["$ref"])]
+        body_props = list(body.get("properties", {}))
+        required = [prop for prop in body_props if prop in body.get("required", [])]
+        types.update({prop: py_type(spec) for prop, spec in body.get("properties", {}).items()})
+    basic = any("HTTPBasic" in entry for entry in op.get("security") or [])
+
+    args = ["self"] + [f"{attribute(param)}: {types[param]}" for param in path_params]
+    args += [f"{attribute(prop)}: {types[prop]}" for prop in required]
+    if basic:
+        args += ["username: str", "password: str"]
+    args += [f"{attribute(prop)}: Optional[{types[prop]}] = None" for prop in body_props if prop not in required]
+    args += [f"{attribute(param)}: Optional[{types[param]}] = None" for param in query_params]
+
+    url = path
+    for param in path_params:
+        url = url.replace("{" + param + "}", "{quote(str(" + attribute(param) + "), safe='')}")
+    url_expr = f'f"{url}"' if path_params else f'"{url}"'
+    if query_params:
+        url_expr += " + _query(" + ", ".join(f"{param}={attribute(param)}" for param in query_params) + ")"
+    call = [repr(method.upper()), url_expr, class_name(response)]
+    if body_props:
+        call.append("_body(" + ", ".join(f"{prop}={attribute(prop)}" for prop in body_props) + ")")
+    if basic:
+        call.append("auth=(username, password)")
+
+    lines = [f"    def {name}({', '.join(args)}) -> '{class_name(response)}':\n"]
+    lines.append(docstring(op.get("description") or op.get("summary", ""), "        "))
+    lines.append(f"        return self._call({', '.join(call)})\n")
+    return "".join(lines)
+
+def generate(spec: Dict) -> str:
+    schemas = spec["components"]["schemas"]
+    parts = [HEADER.format(version=spec["info"].get("version", ""))]
+    objects = [name for name, schema in schemas.items() if schema.get("type") == "object"]
+    for name in objects:
+        parts.append("\n" + render_schema(name, schemas[name], schemas))
+    parts.append("\nSCHEMAS = {\n" + "".join(f"    {name!r}: {class_name(name)},\n" for name in objects) + "}\n")
+
+    base_url = (spec.get("servers") or [{"url": "https://api.artifactsmmo.com"}])[0]["url"]
+    parts.append(CLIENT_HEADER.format(base_url=base_url))
+    names = [base_name(op["operationId"], path, method)
+             for path, operations in spec["paths"].items() for method, op in operations.items()]
+    shared = {name for name in names if names.count(name) > 1}
+    for path, operations in spec["paths"].items():
+        for method, op in operations.items():
+            parts.append("\n" + render_operation(path, method, op, spec, shared))
+    return "".join(parts)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates work/client.py from the OpenAPI spec.")
+    parser.add_argument("--spec", type=str, default=SPEC_PATH, help="The OpenAPI JSON to read.")
+    parser.add_argument("--output", type=str, default=CLIENT_PATH, help="Where to write the client module.")
+    args = parser.parse_args()
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    with open(args.output, "w") as f:
+        f.write(generate(spec))
+    print(f"Wrote {args.output}: {len(spec['paths'])} paths")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+# Default place for journals, relative to the repo root
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "journal")
+JOURNAL_FILE = "actions.journal"
+# Rotate and compress once the live file reaches this size
+MAX_BYTES = 16 * 1024 * 1024
+
+_CHARACTER_PATH = re.compile(r"^/(?:my|characters)/([^/]+)")
+
+def request_path(url: str) -> str:
+    """The path of a request, without the API host, so journals replay against any server."""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+def path_character(path: str) -> Optional[str]:
+    """The character a request is for, from /my/{name}/action/... or /characters/{name}."""
+    match = _CHARACTER_PATH.match(path)
+    if match and match.group(1) not in ("bank", "details", "logs", "characters", "grandexchange"):
+        return match.group(1)
+    return None
+
+def journal_entry(method: str, url: str, body, response, started: float, elapsed: float) -> Dict:
+    """
+    One journal record for a request and its response.
+
+    Only the path, body, status and decoded response are kept, never the headers,
+    so the token stays out of the journal.
+    """
+    path = request_path(url)
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = response.text
+    data = payload.get("data") if isinstance(payload, dict) else None
+    cooldown = data.get("cooldown") if isinstance(data, dict) else None
+    return {
+        "t": started,
+        "elapsed": elapsed,
+        "character": path_character(path),
+        "method": method.upper(),
+        "path": path,
+        "body": body,
+        "status": response.status_code,
+        "response": payload,
+        "cooldown": cooldown,
+    }
+
+def seed_entry(character: str, seed: int) -> Dict:
+    """The record of the seed a character's decisions draw from, so a replay makes the same choices."""
+    return {"t": time.time(), "character": character, "seed": seed}
+
+class ActionJournal:
+    """
+    Append-only journal of every request/response pair, shared by all characters.
+
+    Each record is one line, `<byte length> <json>`, so a record torn by a crash
+    is detected and skipped on read. When the live file passes max_bytes it is
+    closed, gzipped next to it with a timestamp and a fresh file is started.
+    """
+    def __init__(self, directory: str = JOURNAL_DIR, max_bytes: int = MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.path = os.path.join(directory, JOURNAL_FILE)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab")
+        if self._file.tell() and not self._ends_with_newline():
+            # Close off a record torn by a crash so the next one starts on its own line
+            self._file.write(b"\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def record(self, entry: Dict):
+        payload = json.dumps(entry, separators=(",", ":"), default=str).encode()
+        line = b"%d %s\n" % (len(payload), payload)
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        # Nanosecond names sort in the order the files were written
+        rotated = os.path.join(self.directory, f"actions-{time.time_ns()}.journal.gz")
+        with open(self.path, "rb") as source, gzip.open(rotated, "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(self.path)
+        self._file = open(self.path, "ab")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+def journal_files(path: str) -> List[str]:
+    """The journal files under a path, oldest first: rotated archives, then the live file."""
+    if not os.path.isdir(path):
+        return [path]
+    rotated = sorted(name for name in os.listdir(path) if name.endswith(".journal.gz"))
+    files = [os.path.join(path, name) for name in rotated]
+    if os.path.exists(os.path.join(path, JOURNAL_FILE)):
+        files.append(os.path.join(path, JOURNAL_FILE))
+    return files
+
+def read_journal(path: str) -> Iterator[Dict]:
+    """
+    Yields the records of a journal file, a rotated .gz, or a whole journal directory.
+
+    Torn or corrupt records, e.g. from a crash mid-write, are skipped.
+    """
+    for file in journal_files(path):
+        opener = gzip.open if file.endswith(".gz") else open
+        with opener(file, "rb") as f:
+            for line in f:
+                length, _, payload = line.rstrip(b"\n").partition(b" ")
+                if not length.isdigit() or int(length) != len(payload):
+                    continue
+                yield json.loads(payload)
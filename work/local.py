@@ -0,0 +1,23 @@
+import threading
+
+class CharacterLocal(threading.local):
+    """
+    Per-character state for the module-level logic and task code.
+
+    Every character runs its loop on its own thread, so values bound by
+    setup_logic/setup_tasks are only visible to that character.
+    """
+
+class Bound:
+    """
+    Forwards attribute access to the object bound under `name` for the calling character.
+
+    Lets module code keep writing `logger.info(...)` or `task_queue.read_tasks()`
+    while several characters share the module in one process.
+    """
+    def __init__(self, local: CharacterLocal, name: str):
+        self._local = local
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(getattr(self._local, self._name), attr)
@@ -0,0 +1,176 @@
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Pass as extra= to put a record in a category that can be sampled
+ACTION = {"category": "action"}
+GEAR = {"category": "gear"}
+ROUTE = {"category": "route"}
+REQUIREMENTS = {"category": "requirements"}
+
+# Keep one in N info/debug records of these categories, the per-item chatter of the decision code
+DEFAULT_SAMPLE_RATES = {"gear": 10, "requirements": 5}
+
+SKILLS = ('weaponcrafting', 'gearcrafting', 'jewelrycrafting', 'woodcutting', 'mining', 'fishing', 'alchemy', 'cooking')
+
+class Lazy:
+    """Calls fn(*args) only when the record is actually formatted, e.g. logger.debug("%s", Lazy(expensive))."""
+    __slots__ = ('fn', 'args')
+
+    def __init__(self, fn: Callable, *args):
+        self.fn = fn
+        self.args = args
+
+    def __str__(self):
+        return str(self.fn(*self.args))
+
+class Fields:
+    """Renders an action's fields as key=value pairs when formatted."""
+    __slots__ = ('fields',)
+
+    def __init__(self, fields: Dict):
+        self.fields = fields
+
+    def __str__(self):
+        return " ".join(f"{key}={_render(value)}" for key, value in self.fields.items() if value is not None)
+
+def _render(value) -> str:
+    # Item lists from action responses, [{"code": ..., "quantity": ...}], as code x quantity
+    if isinstance(value, list):
+        return ",".join(f"{entry['code']}x{entry['quantity']}" if isinstance(entry, dict) and 'code' in entry
+                        else str(entry) for entry in value)
+    return str(value)
+
+def skill_levels(character_json: Dict) -> Lazy:
+    """Every skill as level(xp/max_xp), from the character in an action response."""
+    def render():
+        return ",".join(f"{skill}:{character_json.get(f'{skill}_level', 0)}"
+                        f"({character_json.get(f'{skill}_xp', 0)}/{character_json.get(f'{skill}_max_xp', 0)})"
+                        for skill in SKILLS)
+    return Lazy(render)
+
+def log_action(logger, character: str, action: str, **fields):
+    """
+    One structured record for an action, in place of a line per detail.
+
+    The fields are kept on the record as `fields`, and only joined into
+    key=value text if the record is emitted.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s: %s %s", character, action, Fields(fields),
+                    extra={**ACTION, "action": action, "fields": fields})
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in N info and debug records per category, the first of every N.
+
+    Records without a category, and warnings and above, always pass.
+    """
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self.rates = {category: rate for category, rate in rates.items() if rate > 1}
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(getattr(record, 'category', None))
+        if rate is None or record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            seen = self._seen.get(record.category, 0)
+            self._seen[record.category] = seen + 1
+        return seen % rate == 0
+
+def parse_sample_rates(value: str) -> Dict[str, int]:
+    """Parses "gear=10,requirements=5" over the defaults, rate 1 keeps everything."""
+    rates = dict(DEFAULT_SAMPLE_RATES)
+    for entry in value.split(","):
+        category, _, rate = entry.strip().partition("=")
+        if category:
+            rates[category] = int(rate or 1)
+    return rates
+
+# Args that render the same on the listener thread later as they would now
+DEFERRABLE_ARGS = (Lazy, Fields, str, int, float, bool, type(None))
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queues records unformatted, so their messages are built on the listener thread.
+
+    The standard QueueHandler formats every record before queueing it, which
+    would run Lazy and Fields on the character thread after all. A record
+    with other args, which could change before the listener gets to it, is
+    still formatted here.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if isinstance(args, dict):
+            args = args.values()
+        if not args or all(isinstance(arg, DEFERRABLE_ARGS) for arg in args):
+            return record
+        return super().prepare(record)
+
+_listeners: List[QueueListener] = []
+_listeners_lock = threading.Lock()
+
+def _behind_queue(logger: logging.Logger, sampler: SamplingFilter):
+    # The logger's own handlers move to a listener thread, the logger keeps only a queue
+    handlers = [handler for handler in logger.handlers if not isinstance(handler, QueueHandler)]
+    if not handlers:
+        return
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    queue_handler = DeferredQueueHandler(records)
+    queue_handler.addFilter(sampler)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _listeners.append(listener)
+
+def setup_logging(level: int = logging.INFO, log_file: Optional[str] = None,
+                  sample_rates: Optional[Dict[str, int]] = None, loggers: List[logging.Logger] = ()):
+    """
+    Moves log I/O off the character threads.
+
+    The root logger, and any extra loggers with their own handlers such as the
+    wrapper's, hand records to a queue unformatted; a listener thread per
+    logger builds the messages, including Lazy and Fields args, and writes
+    them to the console and files. Noisy categories are sampled
+    before they are queued.
+
+    Args:
+        level (int): Root logger level, records below it are never formatted.
+        log_file (str): Also write the root logger's records to this file.
+        sample_rates (Dict[str, int]): One in N records kept per category, DEFAULT_SAMPLE_RATES if not given.
+        loggers (List[logging.Logger]): Other loggers whose handlers should write from a listener too.
+    """
+    sampler = SamplingFilter(DEFAULT_SAMPLE_RATES if sample_rates is None else sample_rates)
+    root = logging.getLogger()
+    root.setLevel(level)
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    if not root.handlers:
+        console = logging.StreamHandler()
+        console.setFormatter(formatter)
+        root.addHandler(console)
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        root.addHandler(file_handler)
+    with _listeners_lock:
+        for logger in (root, *loggers):
+            _behind_queue(logger, sampler)
+
+def stop_logging():
+    """Writes out whatever is still queued and stops the listener threads."""
+    with _listeners_lock:
+        while _listeners:
+            _listeners.pop().stop()
+
+atexit.register(stop_logging)
@@ -2,33 +2,41 @@ from typing import Dict, List
 from work.api import CharacterAPI
 import os
 from work.smarty import Smarty
-from work.tasks import alltasks, fill_orders,setup_tasks
+from work.tasks import alltasks, fill_orders, resume, setup_tasks
+from work.local import CharacterLocal
 
-logger = None
-api = CharacterAPI
-character: str
-token: str
-role :str
+# Each character thread binds its own state in setup_logic
+_local = CharacterLocal()
 
-def setup_logic(m_logger, m_token, m_character, m_role):
-    global logger, api, character, token, role
-    logger = m_logger
-    token = m_token
-    character = m_character
-    role = m_role
-    api = CharacterAPI(logger, m_token, m_character, role)
-    setup_tasks(m_logger,m_character, m_role, api)
+def setup_logic(m_logger, m_token, m_character, m_role, m_api: CharacterAPI = None):
+    _local.logger = m_logger
+    _local.token = m_token
+    _local.character = m_character
+    _local.role = m_role
+    if m_api is None:
+        m_api = CharacterAPI(m_logger, m_token, m_character, m_role)
+    _local.api = m_api
+    setup_tasks(m_logger,m_character, m_role, m_api)
 
 def process():
-    global character,api,token
+    api = _local.api
+    role = _local.role
+    logger = _local.logger
 
-    bank_x,bank_y = api.find_closest_content('bank','bank')
-    api.move_character(bank_x,bank_y)
-    api.rest()
-    # derobe
+    # derobe, on a warm start only the slots that no longer hold what gear_up last chose
     slots = ["rune","shield","helmet","body_armor","leg_armor","boots","ring1","ring2","amulet","artifact1","artifact2","artifact3","utility1","utility2"]
+    loadout = api.checkpoint.get('loadout') if api.checkpoint.warm else None
+    if loadout is not None:
+        slots = [slot for slot in slots if api.get_slot(f"{slot}_slot") != loadout.get(f"{slot}_slot")]
+        logger.info(f"Warm start, keeping the last loadout, unequipping {slots}")
+    if loadout is None or slots:
+        bank_x,bank_y = api.find_closest_content('bank','bank')
+        api.move_character(bank_x,bank_y)
+        api.rest()
     for slot in slots:
         api.unequip(slot)
+    if api.checkpoint.warm:
+        resume(api)
 
     if role == 'smarty':
         smarty = Smarty(logger, api)
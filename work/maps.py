@@ -0,0 +1,79 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from work.catalog import DB_FILE_PATH
+
+Position = Tuple[int, int]
+ContentKey = Tuple[str, str]
+
+class MapIndex:
+    """
+    Spatial index over the wrapper's map_cache table.
+
+    Keeps the tiles for every (content_type, content_code) and a precomputed
+    nearest tile for every (tile, content) pair, so "closest bank" style
+    queries from any tile on the map are a single dict lookup.
+    """
+    def __init__(self, db_path: str = DB_FILE_PATH):
+        self.db_path = db_path
+        self.tiles: Dict[Position, ContentKey] = {}
+        self.tiles_by_content: Dict[ContentKey, List[Position]] = defaultdict(list)
+        self.nearest: Dict[Position, Dict[ContentKey, Position]] = {}
+        self._load()
+        self._build_nearest()
+
+    def _load(self):
+        connection = sqlite3.connect(self.db_path)
+        try:
+            for x, y, content_code, content_type in connection.execute(
+                    "SELECT x, y, content_code, content_type FROM map_cache ORDER BY y, x"):
+                key = (content_type or '', content_code or '')
+                self.tiles[(x, y)] = key
+                if content_code:
+                    self.tiles_by_content[key].append((x, y))
+        finally:
+            connection.close()
+
+    def _build_nearest(self):
+        for position in self.tiles:
+            self.nearest[position] = {
+                key: self._scan(position, tiles) for key, tiles in self.tiles_by_content.items()
+            }
+
+    @staticmethod
+    def _scan(position: Position, tiles: List[Position]) -> Position:
+        x, y = position
+        # First tile wins on ties, same as the old linear scan
+        return min(tiles, key=lambda tile: abs(tile[0] - x) + abs(tile[1] - y))
+
+    def closest(self, x: int, y: int, content_type: str, content_code: str) -> Optional[Position]:
+        """
+        Returns the closest tile holding the given content, or None if it is not on the map.
+        """
+        key = (content_type, content_code)
+        table = self.nearest.get((x, y))
+        if table is not None:
+            return table.get(key)
+
+        # Off the indexed map (new tiles since the cache was built), fall back to a scan
+        tiles = self.tiles_by_content.get(key)
+        if not tiles:
+            return None
+        return self._scan((x, y), tiles)
+
+    def locations(self, content_type: str, content_code: str) -> List[Position]:
+        return self.tiles_by_content.get((content_type, content_code), [])
+
+_map_index: Optional[MapIndex] = None
+_map_index_lock = threading.Lock()
+
+def get_map_index() -> MapIndex:
+    """Returns the process-wide map index, building it on first use."""
+    global _map_index
+    if _map_index is None:
+        with _map_index_lock:
+            if _map_index is None:
+                _map_index = MapIndex()
+    return _map_index
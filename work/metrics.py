@@ -0,0 +1,147 @@
+import bisect
+import functools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# Seconds, covering a fast HTTP round trip up to a long craft cooldown
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 60, 120, 300)
+
+LATENCY = 'artifacts_action_latency_seconds'
+COOLDOWN = 'artifacts_action_cooldown_seconds'
+GAP = 'artifacts_action_gap_seconds'
+
+HELP = {
+    LATENCY: "Wall-clock time of the action call until the response is parsed. "
+             "With client = wrapper this includes the wrapper's follow-up GET of the character.",
+    COOLDOWN: "Cooldown the server gave the action.",
+    GAP: "Time between the previous cooldown's expiration, on the local clock, and sending the action: "
+         "our own decision code and idling.",
+}
+
+class Histogram:
+    """Cumulative bucket counts, sum and count, the Prometheus histogram shape."""
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        totals = []
+        running = 0
+        for count in self.counts:
+            running += count
+            totals.append(running)
+        return totals
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+class ActionMetrics:
+    """
+    Per-action histograms for every character in the process.
+
+    Observations are keyed by metric, character, role and action, and the
+    whole registry renders as Prometheus text exposition format.
+    """
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, metric: str, character: str, role: str, action: str, value: float):
+        key = (metric, character, role, action)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(max(value, 0.0))
+
+    def render(self) -> str:
+        with self._lock:
+            snapshot = sorted((key, histogram.cumulative(), histogram.sum, histogram.count)
+                              for key, histogram in self._histograms.items())
+        lines = []
+        current = None
+        for (metric, character, role, action), cumulative, total, count in snapshot:
+            if metric != current:
+                current = metric
+                lines.append(f"# HELP {metric} {HELP.get(metric, metric)}")
+                lines.append(f"# TYPE {metric} histogram")
+            labels = {"character": character, "role": role, "action": action}
+            for bound, value in zip(BUCKETS + ("+Inf",), cumulative):
+                lines.append(f"{metric}_bucket{{{_labels({**labels, 'le': bound})}}} {value}")
+            lines.append(f"{metric}_sum{{{_labels(labels)}}} {total}")
+            lines.append(f"{metric}_count{{{_labels(labels)}}} {count}")
+        return "\n".join(lines) + "\n"
+
+def timed_action(name: str):
+    """
+    Labels the requests a CharacterAPI method makes with the method's name.
+
+    The innermost labelled method wins, so rest() inside fight() is counted
+    as rest and the fight request that follows as fight.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            previous = getattr(self, 'action_label', None)
+            self.action_label = name
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.action_label = previous
+        return wrapper
+    return decorate
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = get_metrics().render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would drown the character logs
+        pass
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serves the process's metrics at http://host:port/metrics on a daemon thread.
+
+    Args:
+        port (int): Port to listen on, 0 picks a free one.
+        host (str): Interface to bind, local only by default.
+
+    Returns:
+        ThreadingHTTPServer: The running server, server_address holds the port in use.
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+_metrics: Optional[ActionMetrics] = None
+_metrics_lock = threading.Lock()
+
+def get_metrics() -> ActionMetrics:
+    """Returns the process-wide metrics registry shared by every character."""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = ActionMetrics()
+    return _metrics
@@ -0,0 +1,689 @@
+import argparse
+import json
+import math
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from work.catalog import DB_FILE_PATH, GameCatalog
+from work.combat import CombatStats, fight_cooldown, simulate
+
+ELEMENTS = ['air', 'earth', 'fire', 'water']
+SKILLS = ['mining', 'woodcutting', 'fishing', 'weaponcrafting', 'gearcrafting', 'jewelrycrafting', 'cooking', 'alchemy']
+SLOTS = ['weapon', 'rune', 'shield', 'helmet', 'body_armor', 'leg_armor', 'boots', 'ring1', 'ring2', 'amulet',
+         'artifact1', 'artifact2', 'artifact3', 'utility1', 'utility2', 'bag']
+# Item type each slot takes
+SLOT_TYPES = {'ring1': 'ring', 'ring2': 'ring', 'artifact1': 'artifact', 'artifact2': 'artifact',
+              'artifact3': 'artifact', 'utility1': 'utility', 'utility2': 'utility'}
+
+# Game rules as far as the bots depend on them, in game seconds
+BASE_HP = 115
+HP_PER_LEVEL = 5
+INVENTORY_SLOTS = 20
+INVENTORY_MAX_ITEMS = 100
+MAX_LEVEL = 50
+MOVE_SECONDS_PER_TILE = 5
+GATHER_SECONDS = 25
+CRAFT_SECONDS = 5
+BANK_SECONDS = 3
+EQUIP_SECONDS = 1
+USE_SECONDS = 3
+TASK_SECONDS = 3
+MIN_REST_SECONDS = 3
+HP_PER_REST_SECOND = 5
+TASK_EXCHANGE_COINS = 6
+BANK_SLOTS = 50
+# New characters start holding one, as in game
+STARTING_WEAPON = 'wooden_stick'
+
+class MockError(Exception):
+    """An API error, sent back as {"error": {"code", "message"}} with the same status."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def max_xp(level: int) -> int:
+    return int(150 * level ** 1.6)
+
+def iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _rows(connection: sqlite3.Connection, table: str) -> List[sqlite3.Row]:
+    return connection.execute(f"SELECT * FROM {table}").fetchall()
+
+def _json(value, default):
+    return json.loads(value) if value else default
+
+def paginate(entries: List, query: Dict[str, List[str]]) -> Dict:
+    size = int(query.get("size", ["50"])[0])
+    page = int(query.get("page", ["1"])[0])
+    start = (page - 1) * size
+    return {
+        "data": entries[start:start + size],
+        "total": len(entries),
+        "page": page,
+        "size": size,
+        "pages": max(math.ceil(len(entries) / size), 1),
+    }
+
+class MockWorld:
+    """
+    Simulated game state for a local stand-in of the Artifacts API.
+
+    Game data (items, monsters, resources and the map) comes from the
+    wrapper's cache db. Characters are created at the spawn tile on first use
+    and share one bank. Every cooldown is divided by time_scale, so at 100
+    a 25 second gather takes a quarter of a second of wall time.
+    """
+    def __init__(self, db_path: str = DB_FILE_PATH, time_scale: float = 1.0, seed: Optional[int] = None):
+        self.time_scale = time_scale
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+        self.catalog = GameCatalog(db_path)
+        self.characters: Dict[str, Dict] = {}
+        self.bank: Dict[str, int] = {}
+        self.bank_gold = 0
+        self._lock = threading.Lock()
+        self._load(db_path)
+
+    def _load(self, db_path: str):
+        connection = sqlite3.connect(db_path)
+        connection.row_factory = sqlite3.Row
+        try:
+            self.items = {
+                row["code"]: {
+                    "name": row["name"], "code": row["code"], "level": row["level"] or 1,
+                    "type": row["type"], "subtype": row["subtype"] or "", "description": row["description"] or "",
+                    "effects": _json(row["effects"], []), "craft": _json(row["craft"], None),
+                    "tradeable": bool(row["tradeable"]),
+                }
+                for row in _rows(connection, "item_cache")
+            }
+            self.monsters = {
+                row["code"]: {**dict(row), "drops": _json(row["drops"], [])} for row in _rows(connection, "monster_cache")
+            }
+            self.resources = {
+                row["code"]: {**dict(row), "drops": _json(row["drops"], [])} for row in _rows(connection, "resource_cache")
+            }
+            self.maps = {}
+            for row in _rows(connection, "map_cache"):
+                content = {"type": row["content_type"], "code": row["content_code"]} if row["content_code"] else None
+                self.maps[(row["x"], row["y"])] = {"name": "", "skin": "", "x": row["x"], "y": row["y"], "content": content}
+            version = connection.execute("SELECT v FROM cache_table WHERE k = 'item_cache'").fetchone()
+            # The wrapper refetches its game data cache when the version differs
+            self.version = version[0] if version else "mock"
+        finally:
+            connection.close()
+
+    # --- Characters ---
+
+    def character(self, name: str) -> Dict:
+        char = self.characters.get(name)
+        if char is None:
+            char = self.characters[name] = self._new_character(name)
+        return char
+
+    def _new_character(self, name: str) -> Dict:
+        char = {
+            "name": name, "account": "mock", "skin": "men1", "level": 1, "xp": 0, "max_xp": max_xp(1),
+            "gold": 0, "speed": 0, "hp": BASE_HP + HP_PER_LEVEL, "max_hp": BASE_HP + HP_PER_LEVEL,
+            "x": 0, "y": 0, "task": "", "task_type": "", "task_progress": 0, "task_total": 0,
+            "inventory_max_items": INVENTORY_MAX_ITEMS, "_inventory": {}, "_ready_at": 0.0,
+        }
+        for skill in SKILLS:
+            char[f"{skill}_level"] = 1
+            char[f"{skill}_xp"] = 0
+            char[f"{skill}_max_xp"] = max_xp(1)
+        for slot in SLOTS:
+            char[f"{slot}_slot"] = ""
+        char["utility1_slot_quantity"] = 0
+        char["utility2_slot_quantity"] = 0
+        if STARTING_WEAPON in self.items:
+            char["weapon_slot"] = STARTING_WEAPON
+        self._refresh_stats(char)
+        return char
+
+    def _refresh_stats(self, char: Dict):
+        """Recomputes every derived stat from the level and the equipped items."""
+        for element in ELEMENTS:
+            char[f"attack_{element}"] = 0
+            char[f"dmg_{element}"] = 0
+            char[f"res_{element}"] = 0
+        for stat in ("haste", "critical_strike", "wisdom", "prospecting", "dmg"):
+            char[stat] = 0
+        max_hp = BASE_HP + HP_PER_LEVEL * char["level"]
+        max_items = INVENTORY_MAX_ITEMS
+        for slot in SLOTS:
+            if slot.startswith("utility"):
+                continue
+            item = self.items.get(char[f"{slot}_slot"])
+            for effect in item["effects"] if item else ():
+                code, value = effect["code"], effect["value"]
+                if code == "hp":
+                    max_hp += value
+                elif code == "inventory_space":
+                    max_items += value
+                elif code in char and code not in ("hp", "max_hp", "level", "gold"):
+                    char[code] += value
+        char["max_hp"] = max_hp
+        char["hp"] = min(char["hp"], max_hp)
+        char["inventory_max_items"] = max_items
+
+    def render(self, char: Dict) -> Dict:
+        """The character as CharacterSchema."""
+        now = time.time()
+        data = {key: value for key, value in char.items() if not key.startswith("_")}
+        data["cooldown"] = max(math.ceil(char["_ready_at"] - now), 0)
+        data["cooldown_expiration"] = iso(max(char["_ready_at"], now))
+        inventory = list(char["_inventory"].items())
+        data["inventory"] = [
+            {"slot": slot + 1, "code": inventory[slot][0] if slot < len(inventory) else "",
+             "quantity": inventory[slot][1] if slot < len(inventory) else 0}
+            for slot in range(INVENTORY_SLOTS)
+        ]
+        return data
+
+    # --- Helpers for actions ---
+
+    def _start(self, char: Dict):
+        remaining = char["_ready_at"] - time.time()
+        if remaining > 0:
+            raise MockError(499, f"Character in cooldown: {remaining:.2f} seconds left.")
+
+    def _cooldown(self, char: Dict, seconds: float, reason: str) -> Dict:
+        now = time.time()
+        seconds = seconds / self.time_scale
+        char["_ready_at"] = now + seconds
+        return {
+            "total_seconds": seconds,
+            "remaining_seconds": seconds,
+            "started_at": iso(now),
+            "expiration": iso(now + seconds),
+            "reason": reason,
+        }
+
+    def _tile(self, char: Dict, content_type: str, code: Optional[str] = None) -> Dict:
+        tile = self.maps.get((char["x"], char["y"]))
+        content = tile["content"] if tile else None
+        if not content or content["type"] != content_type or (code is not None and content["code"] != code):
+            raise MockError(598, f"{content_type} not found on this map.")
+        return content
+
+    def _item(self, code: str) -> Dict:
+        item = self.items.get(code)
+        if item is None:
+            raise MockError(404, "Item not found.")
+        return item
+
+    def _take(self, char: Dict, code: str, quantity: int):
+        inventory = char["_inventory"]
+        if quantity <= 0 or inventory.get(code, 0) < quantity:
+            raise MockError(478, "Missing item or insufficient quantity.")
+        inventory[code] -= quantity
+        if inventory[code] == 0:
+            del inventory[code]
+
+    def _give(self, char: Dict, items: List[Tuple[str, int]]):
+        inventory = char["_inventory"]
+        codes = set(inventory) | {code for code, _ in items}
+        total = sum(inventory.values()) + sum(quantity for _, quantity in items)
+        if len(codes) > INVENTORY_SLOTS or total > char["inventory_max_items"]:
+            raise MockError(497, "Character inventory is full.")
+        for code, quantity in items:
+            inventory[code] = inventory.get(code, 0) + quantity
+
+    def _xp(self, char: Dict, prefix: str, xp: int):
+        """Adds combat (prefix '') or skill xp, levelling up as it fills."""
+        level_key, xp_key, max_key = (f"{prefix}level", f"{prefix}xp", f"{prefix}max_xp")
+        char[xp_key] += xp
+        while char[level_key] < MAX_LEVEL and char[xp_key] >= char[max_key]:
+            char[xp_key] -= char[max_key]
+            char[level_key] += 1
+            char[max_key] = max_xp(char[level_key])
+        if not prefix:
+            self._refresh_stats(char)
+
+    def _roll(self, drops: List[Dict]) -> List[Tuple[str, int]]:
+        return [(drop["code"], self.rng.randint(drop["min_quantity"], drop["max_quantity"]))
+                for drop in drops if self.rng.random() < 1 / max(drop["rate"], 1)]
+
+    def _bank_list(self) -> List[Dict]:
+        return [{"code": code, "quantity": quantity} for code, quantity in self.bank.items()]
+
+    # --- Actions, each returns the response data without the character ---
+
+    def move(self, char: Dict, body: Dict) -> Dict:
+        x, y = int(body["x"]), int(body["y"])
+        if (x, y) == (char["x"], char["y"]):
+            raise MockError(490, "Character already at destination.")
+        if (x, y) not in self.maps:
+            raise MockError(404, "Map not found.")
+        distance = abs(x - char["x"]) + abs(y - char["y"])
+        char["x"], char["y"] = x, y
+        return {"cooldown": self._cooldown(char, MOVE_SECONDS_PER_TILE * distance, "movement"),
+                "destination": self.maps[(x, y)]}
+
+    def rest(self, char: Dict, body: Dict) -> Dict:
+        restored = char["max_hp"] - char["hp"]
+        char["hp"] = char["max_hp"]
+        seconds = max(math.ceil(restored / HP_PER_REST_SECOND), MIN_REST_SECONDS)
+        return {"cooldown": self._cooldown(char, seconds, "rest"), "hp_restored": restored}
+
+    def equip(self, char: Dict, body: Dict) -> Dict:
+        code, slot = body["code"], body["slot"]
+        quantity = max(int(body.get("quantity", 1)), 1)
+        item = self._item(code)
+        if slot not in SLOTS or SLOT_TYPES.get(slot, slot) != item["type"]:
+            raise MockError(491, "Equipment slot not found or not for this item.")
+        if item["level"] > char["level"]:
+            raise MockError(496, "Character level is insufficient.")
+        if char[f"{slot}_slot"]:
+            raise MockError(485, "This slot is already in use.")
+        if not slot.startswith("utility"):
+            quantity = 1
+        self._take(char, code, quantity)
+        char[f"{slot}_slot"] = code
+        if slot.startswith("utility"):
+            char[f"{slot}_slot_quantity"] = quantity
+        self._refresh_stats(char)
+        return {"cooldown": self._cooldown(char, EQUIP_SECONDS, "equip"), "slot": slot, "item": item}
+
+    def unequip(self, char: Dict, body: Dict) -> Dict:
+        slot = body["slot"]
+        code = char.get(f"{slot}_slot")
+        if not code:
+            raise MockError(491, "Slot is empty.")
+        quantity = char[f"{slot}_slot_quantity"] if slot.startswith("utility") else 1
+        self._give(char, [(code, quantity)])
+        char[f"{slot}_slot"] = ""
+        if slot.startswith("utility"):
+            char[f"{slot}_slot_quantity"] = 0
+        self._refresh_stats(char)
+        return {"cooldown": self._cooldown(char, EQUIP_SECONDS, "unequip"), "slot": slot, "item": self.items.get(code)}
+
+    def use(self, char: Dict, body: Dict) -> Dict:
+        code = body["code"]
+        quantity = max(int(body.get("quantity", 1)), 1)
+        item = self._item(code)
+        if item["type"] != "consumable":
+            raise MockError(476, "This item is not a consumable.")
+        if item["level"] > char["level"]:
+            raise MockError(496, "Character level is insufficient.")
+        self._take(char, code, quantity)
+        for effect in item["effects"]:
+            if effect["code"] == "heal":
+                char["hp"] = min(char["hp"] + effect["value"] * quantity, char["max_hp"])
+        return {"cooldown": self._cooldown(char, USE_SECONDS, "use"), "item": item}
+
+    def fight(self, char: Dict, body: Dict) -> Dict:
+        content = self._tile(char, "monster")
+        monster = self.catalog.monster(content["code"])
+        data = self.monsters[content["code"]]
+        fighter = CombatStats.from_character(SimpleNamespace(**char))
+        prediction = simulate([fighter], [monster], samples=1, rng=self.np_rng)[0]
+        won = prediction.win_probability >= 1
+        xp = gold = 0
+        drops = []
+        if won:
+            char["hp"] = max(char["hp"] - int(prediction.hp_lost), 1)
+            xp = data["level"] * 12
+            gold = self.rng.randint(data["min_gold"] or 0, data["max_gold"] or 0)
+            drops = self._roll(data["drops"])
+            # Drops that do not fit are lost, like a full inventory in game
+            try:
+                self._give(char, drops)
+            except MockError:
+                drops = []
+            char["gold"] += gold
+            self._xp(char, "", xp)
+            if char["task_type"] == "monsters" and char["task"] == data["code"]:
+                char["task_progress"] = min(char["task_progress"] + 1, char["task_total"])
+        else:
+            # Beaten characters wake up at spawn
+            char["hp"] = 1
+            char["x"], char["y"] = 0, 0
+        seconds = float(fight_cooldown(np.array(prediction.turns), np.array(char["haste"])))
+        return {
+            "cooldown": self._cooldown(char, seconds, "fight"),
+            "fight": {
+                "xp": xp, "gold": gold, "drops": [{"code": code, "quantity": quantity} for code, quantity in drops],
+                "turns": int(prediction.turns), "monster_blocked_hits": {}, "player_blocked_hits": {},
+                "logs": [], "result": "win" if won else "loss",
+            },
+        }
+
+    def gathering(self, char: Dict, body: Dict) -> Dict:
+        content = self._tile(char, "resource")
+        resource = self.resources[content["code"]]
+        if char[f"{resource['skill']}_level"] < resource["level"]:
+            raise MockError(493, "Not skill level required.")
+        items = self._roll(resource["drops"])
+        self._give(char, items)
+        xp = 10 + 5 * resource["level"]
+        self._xp(char, f"{resource['skill']}_", xp)
+        return {
+            "cooldown": self._cooldown(char, GATHER_SECONDS, "gathering"),
+            "details": {"xp": xp, "items": [{"code": code, "quantity": quantity} for code, quantity in items]},
+        }
+
+    def crafting(self, char: Dict, body: Dict) -> Dict:
+        code = body["code"]
+        quantity = max(int(body.get("quantity", 1)), 1)
+        item = self._item(code)
+        craft = item["craft"]
+        if not craft:
+            raise MockError(404, "Craft not found.")
+        self._tile(char, "workshop", craft["skill"])
+        if char[f"{craft['skill']}_level"] < craft["level"]:
+            raise MockError(493, "Not skill level required.")
+        for requirement in craft["items"]:
+            if char["_inventory"].get(requirement["code"], 0) < requirement["quantity"] * quantity:
+                raise MockError(478, "Missing item or insufficient quantity.")
+        for requirement in craft["items"]:
+            self._take(char, requirement["code"], requirement["quantity"] * quantity)
+        made = [(code, craft.get("quantity", 1) * quantity)]
+        self._give(char, made)
+        xp = (10 + 5 * craft["level"]) * quantity
+        self._xp(char, f"{craft['skill']}_", xp)
+        return {
+            "cooldown": self._cooldown(char, CRAFT_SECONDS * quantity, "crafting"),
+            "details": {"xp": xp, "items": [{"code": code, "quantity": made[0][1]}]},
+        }
+
+    def recycling(self, char: Dict, body: Dict) -> Dict:
+        code = body["code"]
+        quantity = max(int(body.get("quantity", 1)), 1)
+        item = self._item(code)
+        craft = item["craft"]
+        if not craft or item["type"] == "consumable":
+            raise MockError(473, "This item cannot be recycled.")
+        self._tile(char, "workshop", craft["skill"])
+        self._take(char, code, quantity)
+        # Roughly half the ingredients come back, at least one of something
+        items = [(requirement["code"], requirement["quantity"] * quantity // 2) for requirement in craft["items"]]
+        items = [(code, count) for code, count in items if count > 0] or [(craft["items"][0]["code"], 1)]
+        self._give(char, items)
+        return {
+            "cooldown": self._cooldown(char, CRAFT_SECONDS * quantity, "recycling"),
+            "details": {"items": [{"code": code, "quantity": count} for code, count in items]},
+        }
+
+    def bank_deposit(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "bank")
+        code = body["code"]
+        quantity = int(body.get("quantity", 1))
+        item = self._item(code)
+        if code not in self.bank and len(self.bank) >= BANK_SLOTS:
+            raise MockError(462, "Bank is full.")
+        self._take(char, code, quantity)
+        self.bank[code] = self.bank.get(code, 0) + quantity
+        return {"cooldown": self._cooldown(char, BANK_SECONDS, "deposit"), "item": item, "bank": self._bank_list()}
+
+    def bank_withdraw(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "bank")
+        code = body["code"]
+        quantity = int(body.get("quantity", 1))
+        item = self._item(code)
+        if quantity <= 0 or self.bank.get(code, 0) < quantity:
+            raise MockError(404, "Item not found.")
+        self._give(char, [(code, quantity)])
+        self.bank[code] -= quantity
+        if self.bank[code] == 0:
+            del self.bank[code]
+        return {"cooldown": self._cooldown(char, BANK_SECONDS, "withdraw"), "item": item, "bank": self._bank_list()}
+
+    def bank_deposit_gold(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "bank")
+        quantity = int(body["quantity"])
+        if quantity <= 0 or char["gold"] < quantity:
+            raise MockError(492, "Insufficient gold.")
+        char["gold"] -= quantity
+        self.bank_gold += quantity
+        return {"cooldown": self._cooldown(char, BANK_SECONDS, "deposit_gold"), "bank": {"quantity": self.bank_gold}}
+
+    def bank_withdraw_gold(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "bank")
+        quantity = int(body["quantity"])
+        if quantity <= 0 or self.bank_gold < quantity:
+            raise MockError(460, "Insufficient gold in your bank.")
+        self.bank_gold -= quantity
+        char["gold"] += quantity
+        return {"cooldown": self._cooldown(char, BANK_SECONDS, "withdraw_gold"), "bank": {"quantity": self.bank_gold}}
+
+    def task_new(self, char: Dict, body: Dict) -> Dict:
+        content = self._tile(char, "tasks_master")
+        if char["task"]:
+            raise MockError(489, "Character already has a task.")
+        if content["code"] == "monsters":
+            choices = [code for code, monster in self.monsters.items() if monster["level"] <= char["level"]]
+            total = self.rng.randint(10, 30)
+        else:
+            choices = [drop["code"] for resource in self.resources.values()
+                       if resource["level"] <= char[f"{resource['skill']}_level"] for drop in resource["drops"][:1]]
+            total = self.rng.randint(20, 50)
+        char["task"] = self.rng.choice(choices)
+        char["task_type"] = content["code"]
+        char["task_progress"] = 0
+        char["task_total"] = total
+        task = {"code": char["task"], "type": char["task_type"], "total": total,
+                "rewards": {"items": [{"code": "tasks_coin", "quantity": 1}], "gold": 0}}
+        return {"cooldown": self._cooldown(char, TASK_SECONDS, "task"), "task": task}
+
+    def task_complete(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "tasks_master")
+        if not char["task"]:
+            raise MockError(487, "Character has no task.")
+        if char["task_progress"] < char["task_total"]:
+            raise MockError(488, "Character has not completed the task.")
+        gold = 10 * char["level"]
+        self._give(char, [("tasks_coin", 1)])
+        char["gold"] += gold
+        char["task"], char["task_type"], char["task_progress"], char["task_total"] = "", "", 0, 0
+        return {"cooldown": self._cooldown(char, TASK_SECONDS, "task"),
+                "rewards": {"items": [{"code": "tasks_coin", "quantity": 1}], "gold": gold}}
+
+    def task_exchange(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "tasks_master")
+        self._take(char, "tasks_coin", TASK_EXCHANGE_COINS)
+        code = self.rng.choice([code for code, item in self.items.items()
+                                if item["type"] == "resource" and item["tradeable"]])
+        self._give(char, [(code, 1)])
+        return {"cooldown": self._cooldown(char, TASK_SECONDS, "task"),
+                "rewards": {"items": [{"code": code, "quantity": 1}], "gold": 0}}
+
+    def task_trade(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "tasks_master", "items")
+        code = body["code"]
+        quantity = int(body.get("quantity", 1))
+        if char["task_type"] != "items" or char["task"] != code:
+            raise MockError(474, "This task does not belong to your character.")
+        if char["task_progress"] + quantity > char["task_total"]:
+            raise MockError(475, "Task already completed or too many items submitted.")
+        self._take(char, code, quantity)
+        char["task_progress"] += quantity
+        return {"cooldown": self._cooldown(char, TASK_SECONDS, "task"), "trade": {"code": code, "quantity": quantity}}
+
+    def task_cancel(self, char: Dict, body: Dict) -> Dict:
+        self._tile(char, "tasks_master")
+        if not char["task"]:
+            raise MockError(487, "Character has no task.")
+        self._take(char, "tasks_coin", 1)
+        char["task"], char["task_type"], char["task_progress"], char["task_total"] = "", "", 0, 0
+        return {"cooldown": self._cooldown(char, TASK_SECONDS, "task")}
+
+    # --- Requests ---
+
+    def action(self, name: str, action: str, body: Dict) -> Dict:
+        handler = ACTIONS.get(action)
+        if handler is None:
+            raise MockError(404, f"Unknown action {action}.")
+        with self._lock:
+            char = self.character(name)
+            self._start(char)
+            data = handler(self, char, body or {})
+            data["character"] = self.render(char)
+            return {"data": data}
+
+    def get(self, path: str, query: Dict[str, List[str]]) -> Dict:
+        with self._lock:
+            return self._get(path.strip("/").split("/") if path.strip("/") else [], query)
+
+    def _get(self, parts: List[str], query: Dict[str, List[str]]) -> Dict:
+        def one(table: Dict, key) -> Dict:
+            if key not in table:
+                raise MockError(404, "Not found.")
+            return {"data": table[key]}
+
+        if not parts:
+            return {"data": {"status": "online", "version": self.version, "characters_online": len(self.characters),
+                             "server_time": iso(time.time())}}
+        match parts:
+            case ["characters", name]:
+                return {"data": self.render(self.character(name))}
+            case ["my", "characters"]:
+                return {"data": [self.render(char) for char in self.characters.values()]}
+            case ["my", "bank"]:
+                return {"data": {"slots": BANK_SLOTS, "expansions": 0, "next_expansion_cost": 4500, "gold": self.bank_gold}}
+            case ["my", "bank", "items"]:
+                code = query.get("item_code", [None])[0]
+                return paginate([entry for entry in self._bank_list() if code in (None, entry["code"])], query)
+            case ["items"]:
+                return paginate(list(self.items.values()), query)
+            case ["items", code]:
+                return one(self.items, code)
+            case ["monsters"]:
+                return paginate(list(self.monsters.values()), query)
+            case ["monsters", code]:
+                return one(self.monsters, code)
+            case ["resources"]:
+                return paginate(list(self.resources.values()), query)
+            case ["resources", code]:
+                return one(self.resources, code)
+            case ["maps"]:
+                return paginate(list(self.maps.values()), query)
+            case ["maps", x, y]:
+                return one(self.maps, (int(x), int(y)))
+        raise MockError(404, "Not found.")
+
+# Action paths, with the spellings the wrapper uses next to the openapi ones
+ACTIONS: Dict[str, Callable[[MockWorld, Dict, Dict], Dict]] = {
+    "move": MockWorld.move,
+    "rest": MockWorld.rest,
+    "equip": MockWorld.equip,
+    "unequip": MockWorld.unequip,
+    "use": MockWorld.use,
+    "fight": MockWorld.fight,
+    "gathering": MockWorld.gathering,
+    "crafting": MockWorld.crafting,
+    "recycling": MockWorld.recycling,
+    "recycle": MockWorld.recycling,
+    "bank/deposit": MockWorld.bank_deposit,
+    "bank/deposit/item": MockWorld.bank_deposit,
+    "bank/withdraw": MockWorld.bank_withdraw,
+    "bank/withdraw/item": MockWorld.bank_withdraw,
+    "bank/deposit/gold": MockWorld.bank_deposit_gold,
+    "bank/withdraw/gold": MockWorld.bank_withdraw_gold,
+    "task/new": MockWorld.task_new,
+    "task/complete": MockWorld.task_complete,
+    "task/exchange": MockWorld.task_exchange,
+    "task/trade": MockWorld.task_trade,
+    "task/cancel": MockWorld.task_cancel,
+    "tasks/new": MockWorld.task_new,
+    "tasks/complete": MockWorld.task_complete,
+    "tasks/exchange": MockWorld.task_exchange,
+    "tasks/trade": MockWorld.task_trade,
+    "tasks/cancel": MockWorld.task_cancel,
+}
+
+_ACTION_PATH = re.compile(r"^/my/([^/]+)/action/(.+?)/?$")
+
+class MockHandler(BaseHTTPRequestHandler):
+    # Keep-alive, the bots hold their connections open
+    protocol_version = "HTTP/1.1"
+    world: MockWorld = None
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        self._respond(lambda: self.world.get(parts.path, parse_qs(parts.query)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        match = _ACTION_PATH.match(urlsplit(self.path).path)
+        if match is None:
+            self._send(404, {"error": {"code": 404, "message": "Not found."}})
+            return
+        name, action = match.groups()
+        self._respond(lambda: self.world.action(name, action, json.loads(raw) if raw else {}))
+
+    def _respond(self, handler: Callable[[], Dict]):
+        try:
+            self._send(200, handler())
+        except MockError as e:
+            self._send(e.status, {"error": {"code": e.status, "message": e.message}})
+        except (KeyError, ValueError, TypeError) as e:
+            self._send(422, {"error": {"code": 422, "message": f"Invalid payload: {e!r}"}})
+
+    def _send(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_mock_server(world: MockWorld, port: int = 8000, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serves the world on a daemon thread.
+
+    Args:
+        world (MockWorld): The simulated game.
+        port (int): Port to listen on, 0 picks a free one.
+        host (str): Interface to bind.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    handler = type("BoundMockHandler", (MockHandler,), {"world": world})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-server", daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Artifacts API, for load testing the bots.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--time-scale", type=float, default=100.0, help="Cooldowns are divided by this.")
+    parser.add_argument("--db", type=str, default=DB_FILE_PATH, help="Game data cache to seed the world from.")
+    parser.add_argument("--seed", type=int, help="Random seed, for repeatable runs.")
+    parser.add_argument("--bank", type=str, help="JSON file of {code: quantity} to start the bank with.")
+    args = parser.parse_args()
+
+    world = MockWorld(args.db, args.time_scale, args.seed)
+    if args.bank:
+        with open(args.bank) as f:
+            world.bank.update(json.load(f))
+    server = start_mock_server(world, args.port, args.host)
+    print(f"Mock Artifacts API at http://{args.host}:{server.server_address[1]}, {args.time_scale}x speed")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
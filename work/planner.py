@@ -0,0 +1,194 @@
+import math
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from work.catalog import GameCatalog, get_catalog
+
+WITHDRAW = 'withdraw'
+GATHER = 'gather'
+FIGHT = 'fight'
+CRAFT = 'craft'
+
+@dataclass
+class PlanStep:
+    action: str
+    code: str
+    quantity: int
+    # Craft and gather steps: the skill and level they need
+    skill: Optional[str] = None
+    level: int = 0
+    # Craft steps: what one craft consumes
+    requirements: List[Tuple[str, int]] = field(default_factory=list)
+
+@dataclass
+class CraftPlan:
+    """
+    Everything needed to end up with `quantity` of `code`, in the order to do it.
+
+    Gather and fight steps come first, each withdraw is followed by the
+    craft it feeds, and crafts are ordered so every ingredient is made
+    before the item that uses it.
+    """
+    code: str
+    quantity: int
+    steps: List[PlanStep] = field(default_factory=list)
+    # Steps that cannot be done: task items, things only sold, or an item above our skill
+    blocked: List[PlanStep] = field(default_factory=list)
+
+    @property
+    def feasible(self) -> bool:
+        return not self.blocked
+
+    def of(self, action: str) -> List[PlanStep]:
+        return [step for step in self.steps if step.action == action]
+
+    @property
+    def ready(self) -> bool:
+        """True when the bank already holds everything, nothing to gather or fight for."""
+        return self.feasible and not self.of(GATHER) and not self.of(FIGHT)
+
+    def totals(self) -> Dict[Tuple[str, str], int]:
+        totals = defaultdict(int)
+        for step in self.steps:
+            totals[(step.action, step.code)] += step.quantity
+        return dict(totals)
+
+class CraftPlanner:
+    """
+    Expands recipe trees from the catalog into bills of materials.
+
+    Recipes and the dependency order of each tree are memoized, so planning
+    is a walk over a cached list netted against one bank snapshot.
+    """
+    def __init__(self, catalog: GameCatalog):
+        self.catalog = catalog
+        self._recipes: Dict[str, Optional[Tuple[Tuple[str, int], ...]]] = {}
+        self._orders: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def recipe(self, code: str) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """The (code, quantity) ingredients of one craft of the item, None if it is not crafted."""
+        if code not in self._recipes:
+            item = self.catalog.item(code)
+            craft = item.craft if item else None
+            self._recipes[code] = tuple(
+                (requirement['code'], requirement['quantity']) for requirement in craft.get('items', [])
+            ) if craft else None
+        return self._recipes[code]
+
+    def order(self, code: str) -> List[str]:
+        """Every item in the recipe tree, each one before all of its ingredients."""
+        with self._lock:
+            if code not in self._orders:
+                visited = set()
+                postorder = []
+                stack = [(code, False)]
+                while stack:
+                    current, expanded = stack.pop()
+                    if expanded:
+                        postorder.append(current)
+                        continue
+                    if current in visited:
+                        continue
+                    visited.add(current)
+                    stack.append((current, True))
+                    for ingredient, _ in self.recipe(current) or ():
+                        if ingredient not in visited:
+                            stack.append((ingredient, False))
+                self._orders[code] = postorder[::-1]
+            return self._orders[code]
+
+    def plan(self, code: str, quantity: int, bank: Dict[str, int], skills: Optional[Dict[str, int]] = None) -> CraftPlan:
+        """
+        Plans crafting quantity of code from what the bank holds.
+
+        Args:
+            code (str): The item to craft.
+            quantity (int): How many to end up with.
+            bank (Dict[str, int]): Bank snapshot, code to quantity.
+            skills (Dict[str, int]): Crafting skill levels, crafts above them are blocked. Skills not listed are not checked.
+
+        Returns:
+            CraftPlan: The ordered steps, with total quantities per step.
+        """
+        plan = CraftPlan(code, quantity)
+        need = defaultdict(int)
+        need[code] = quantity
+        crafts: Dict[str, int] = {}
+
+        for current in self.order(code):
+            needed = need[current]
+            if needed <= 0:
+                continue
+            # Intermediate items already banked are used as they are
+            if current != code:
+                needed -= min(bank.get(current, 0), needed)
+            if needed <= 0:
+                continue
+
+            recipe = self.recipe(current)
+            if recipe is not None:
+                item = self.catalog.item(current)
+                if current != code and self._too_high(PlanStep(CRAFT, current, needed, item.craft.get('skill'), item.craft.get('level', 0)), skills):
+                    # Someone with the skill has to make it, gathering a crafted item means crafting it
+                    plan.steps.append(PlanStep(GATHER, current, needed, item.craft.get('skill'), item.craft.get('level', 0)))
+                    continue
+                per_craft = item.craft.get('quantity', 1) or 1
+                count = math.ceil(needed / per_craft)
+                crafts[current] = count
+                for ingredient, ingredient_quantity in recipe:
+                    need[ingredient] += count * ingredient_quantity
+                continue
+
+            # Gathering and fighting can be ordered from other characters, so only crafts check skills
+            step = self._source(current, needed)
+            if step.action is None:
+                plan.blocked.append(step)
+            else:
+                plan.steps.append(step)
+
+        # Ingredients first, then each craft preceded by the withdraw it feeds on
+        for current in reversed(self.order(code)):
+            if current not in crafts:
+                continue
+            item = self.catalog.item(current)
+            step = PlanStep(CRAFT, current, crafts[current], item.craft.get('skill'), item.craft.get('level', 0),
+                            list(self.recipe(current)))
+            if self._too_high(step, skills):
+                plan.blocked.append(step)
+                continue
+            for ingredient, ingredient_quantity in step.requirements:
+                plan.steps.append(PlanStep(WITHDRAW, ingredient, ingredient_quantity * step.quantity))
+            plan.steps.append(step)
+        return plan
+
+    @staticmethod
+    def _too_high(step: PlanStep, skills: Optional[Dict[str, int]]) -> bool:
+        return bool(skills) and step.skill in skills and step.level > skills[step.skill]
+
+    def _source(self, code: str, quantity: int) -> PlanStep:
+        item = self.catalog.item(code)
+        if item is None or item.subtype == 'task':
+            return PlanStep(None, code, quantity)
+        # Checked before resources, some mob drops are labelled as resources
+        if self.catalog.monsters_dropping(code):
+            return PlanStep(FIGHT, code, quantity)
+        resources = self.catalog.resources_dropping(code)
+        if resources:
+            resource = min(resources, key=lambda resource: resource.level)
+            return PlanStep(GATHER, code, quantity, resource.skill, resource.level)
+        return PlanStep(None, code, quantity)
+
+_planner: Optional[CraftPlanner] = None
+_planner_lock = threading.Lock()
+
+def get_planner() -> CraftPlanner:
+    """Returns the process-wide planner, its recipe memo shared by every character."""
+    global _planner
+    if _planner is None:
+        with _planner_lock:
+            if _planner is None:
+                _planner = CraftPlanner(get_catalog())
+    return _planner
@@ -0,0 +1,158 @@
+import ast
+import inspect
+from operator import methodcaller
+from typing import Callable, Dict, List, Optional, Tuple
+
+import work.tasks
+
+# CharacterAPI methods a plan may call with no arguments, besides the work.tasks functions
+API_METHODS = ('eat', 'rest', 'fight_xp', 'deposit_all_inventory_to_bank')
+# What a plan can pass after the character, it has nothing but literals to pass
+LITERAL_TYPES = (str, int, bool)
+
+class PlanError(ValueError):
+    """The generated code is not a plan: not Python, or calls something not on the whitelist."""
+
+class Step:
+    """One call of a plan, resolved and argument-checked when the plan was compiled."""
+    __slots__ = ('label', 'function', 'args', 'kwargs')
+
+    def __init__(self, label: str, function: Callable, args: Tuple = (), kwargs: Optional[Dict] = None):
+        self.label = label
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def __call__(self, character):
+        return self.function(character, *self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return self.label
+
+class ActionPlan:
+    """A compiled plan, run once per cycle for as long as it stays useful."""
+    def __init__(self, steps: List[Step], source: str):
+        self.steps = steps
+        self.source = source
+        self.runs = 0
+        self.failures = 0
+
+    def run(self, character, logger=None) -> bool:
+        """
+        Runs every step in order, stopping at the first that raises.
+
+        Returns:
+            bool: True if all steps completed. Consecutive failed runs are counted in `failures`.
+        """
+        self.runs += 1
+        for step in self.steps:
+            try:
+                step(character)
+            except Exception as e:
+                self.failures += 1
+                if character.checkpoint.get('craft') is not None:
+                    # The character carries on, a restart must not resume the craft the step gave up on
+                    character.checkpoint.save(craft=None)
+                if logger is not None:
+                    logger.info(f"Plan step {step.label} failed: {e!r}")
+                return False
+        self.failures = 0
+        return True
+
+    def __repr__(self) -> str:
+        return ";".join(step.label for step in self.steps)
+
+def task_functions() -> Dict[str, Callable]:
+    """
+    The work.tasks functions a plan may call: those taking the character first
+    and otherwise only str, int or bool parameters, so literals can satisfy them.
+    """
+    functions = {}
+    for name, function in vars(work.tasks).items():
+        if name.startswith('_') or not inspect.isfunction(function) or function.__module__ != work.tasks.__name__:
+            continue
+        parameters = list(inspect.signature(function).parameters.values())
+        if not parameters or parameters[0].name != 'character':
+            continue
+        if all(parameter.annotation in LITERAL_TYPES for parameter in parameters[1:]):
+            functions[name] = function
+    return functions
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return None
+
+def _literal(node: ast.AST, where: str):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise PlanError(f"{where}: only literal arguments are allowed") from None
+
+def _strip_fences(source: str) -> str:
+    lines = [line for line in source.strip().splitlines() if not line.strip().startswith("```")]
+    return "\n".join(lines)
+
+def compile_plan(source: str, functions: Optional[Dict[str, Callable]] = None) -> ActionPlan:
+    """
+    Turns generated code into an ActionPlan without running any of it.
+
+    Each statement must be `work.tasks.<function>(self.api, <literals>)` for a
+    function that takes the character first, or `self.api.<method>()` for one
+    of API_METHODS. Arguments are bound against the function's signature here,
+    so a bad call is rejected now rather than halfway through the plan.
+
+    Raises:
+        PlanError: The source does not parse, or a statement is not an allowed call.
+    """
+    functions = task_functions() if functions is None else functions
+    source = _strip_fences(source)
+    try:
+        tree = ast.parse(source, mode='exec')
+    except SyntaxError as e:
+        raise PlanError(f"Not Python: {e.msg}") from None
+    steps = []
+    for statement in tree.body:
+        where = ast.get_source_segment(source, statement) or type(statement).__name__
+        if not isinstance(statement, ast.Expr) or not isinstance(statement.value, ast.Call):
+            raise PlanError(f"{where}: only calls are allowed")
+        call = statement.value
+        target = _dotted(call.func)
+        if target and target.startswith("work.tasks.") and target.count(".") == 2:
+            name = target.rsplit(".", 1)[1]
+            function = functions.get(name)
+            if function is None:
+                raise PlanError(f"{where}: work.tasks.{name} is not an allowed action")
+            if not call.args or _dotted(call.args[0]) != "self.api":
+                raise PlanError(f"{where}: the character, self.api, must come first")
+            args = tuple(_literal(arg, where) for arg in call.args[1:])
+            kwargs = {keyword.arg: _literal(keyword.value, where) for keyword in call.keywords if keyword.arg}
+            if len(kwargs) != len(call.keywords):
+                raise PlanError(f"{where}: ** arguments are not allowed")
+            signature = inspect.signature(function)
+            try:
+                bound = signature.bind(None, *args, **kwargs)
+            except TypeError as e:
+                raise PlanError(f"{where}: {e}") from None
+            for name, value in list(bound.arguments.items())[1:]:
+                annotation = signature.parameters[name].annotation
+                if value is not None and not isinstance(value, annotation):
+                    raise PlanError(f"{where}: {name} must be {annotation.__name__}")
+            steps.append(Step(where, function, args, kwargs))
+        elif target and target.startswith("self.api.") and target.count(".") == 2:
+            name = target.rsplit(".", 1)[1]
+            if name not in API_METHODS:
+                raise PlanError(f"{where}: self.api.{name} is not an allowed action")
+            if call.args or call.keywords:
+                raise PlanError(f"{where}: self.api.{name} takes no arguments")
+            steps.append(Step(where, methodcaller(name)))
+        else:
+            raise PlanError(f"{where}: only work.tasks functions and self.api.{'/'.join(API_METHODS)} may be called")
+    if not steps:
+        raise PlanError("Empty plan")
+    return ActionPlan(steps, source)
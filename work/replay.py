@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from work.journal import read_journal, request_path
+from work.scheduler import get_scheduler
+from work.task_queue import TASKS_DB_PATH
+
+REPLAY_TARGETS = ('fill_orders', 'gear_up', 'craft_item')
+
+logger = logging.getLogger(__name__)
+
+class ReplayMiss(Exception):
+    """The code asked for a request the journal does not hold, the run has diverged."""
+
+class RecordedResponse:
+    """Just enough of requests.Response for the wrapper."""
+    def __init__(self, entry: Dict):
+        self.status_code = entry["status"]
+        self.headers = {"content-type": "application/json"}
+        self._payload = entry["response"]
+        self.text = self._payload if isinstance(self._payload, str) else json.dumps(self._payload)
+
+    def json(self):
+        if isinstance(self._payload, str):
+            raise requests.exceptions.JSONDecodeError("Recorded response was not JSON", self._payload, 0)
+        return self._payload
+
+def _key(method: str, path: str, body) -> Tuple[str, str, str]:
+    return method.upper(), path, json.dumps(body, sort_keys=True)
+
+class ReplayRequests:
+    """
+    Stands in for the `requests` module inside the wrapper, answering from a journal.
+
+    A request gets the next recorded response for the same method, path and body.
+    Reads that run out repeat their last response, since re-reading state the
+    recording read fewer times changes nothing. An action with no recorded
+    answer raises ReplayMiss.
+    """
+    def __init__(self, entries: Iterable[Dict]):
+        self._queues: Dict[Tuple[str, str, str], Deque[Dict]] = defaultdict(deque)
+        self._last: Dict[Tuple[str, str, str], Dict] = {}
+        for entry in entries:
+            self._queues[_key(entry["method"], entry["path"], entry.get("body"))].append(entry)
+        self.served = 0
+        self.server_seconds = 0.0
+        self.cooldown_seconds = 0.0
+        self.misses: List[str] = []
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def request(self, method, url, **kwargs):
+        key = _key(method, request_path(url), kwargs.get("json"))
+        queue = self._queues.get(key)
+        if queue:
+            entry = queue.popleft()
+            self._last[key] = entry
+            self.served += 1
+            self.server_seconds += entry.get("elapsed", 0.0)
+            cooldown = entry.get("cooldown")
+            # A character read's data.cooldown is its seconds left, only actions carry a cooldown object
+            if isinstance(cooldown, dict):
+                self.cooldown_seconds += cooldown.get("total_seconds", 0)
+        elif key[0] == "GET" and key in self._last:
+            entry = self._last[key]
+        else:
+            self.misses.append(f"{key[0]} {key[1]} {key[2]}")
+            raise ReplayMiss(f"No recorded response for {key[0]} {key[1]} {key[2]}")
+        return RecordedResponse(entry)
+
+def copy_queue(source: str, directory: str):
+    """Snapshots the live order queue into directory, so a replay never claims real orders."""
+    if not os.path.exists(source):
+        return
+    with sqlite3.connect(source) as live, sqlite3.connect(os.path.join(directory, "tasks.db")) as copy:
+        live.backup(copy)
+
+def replay(journal: str, character: str, role: str, target: str, code: Optional[str] = None, quantity: int = 1,
+           since: Optional[float] = None) -> Dict:
+    """
+    Runs one decision function against a recorded journal, with no network and no cooldown waits.
+
+    The character's random choices are seeded from the journal as they were when
+    recorded, so replaying from its start makes the same choices; a replay from
+    `since` starts the generator over, so earlier draws are not repeated.
+
+    Args:
+        journal (str): A journal file, rotated .gz, or journal directory.
+        character (str): The character whose requests are replayed.
+        role (str): The role to run fill_orders as.
+        target (str): One of REPLAY_TARGETS.
+        code (str): The monster for gear_up, the item for craft_item.
+        quantity (int): How many to craft for craft_item.
+        since (float): Epoch seconds, replay only what was recorded from then on, e.g. just before a slow decision.
+
+    Returns:
+        Dict: Wall time of our own code, recorded server time and cooldowns for the
+        same requests, how many were served and the requests that were not in the journal.
+    """
+    from artifactsmmo_wrapper import artifacts, wrapper
+    from work.api import CharacterAPI
+    from work.tasks import craft_item, fill_orders, setup_tasks
+
+    if target not in REPLAY_TARGETS:
+        raise ValueError(f"Cannot replay {target}, choose one of {', '.join(REPLAY_TARGETS)}")
+    entries, seed = [], None
+    for entry in read_journal(journal):
+        if entry.get("character") not in (character, None):
+            continue
+        if "seed" in entry:
+            # The run's first start, or its last one before the replayed window, seeded its choices
+            if seed is None or (since is not None and entry["t"] < since):
+                seed = entry["seed"]
+        elif since is None or entry["t"] >= since:
+            entries.append(entry)
+    logger.info(f"Replaying {len(entries)} recorded requests for {character}, seed {seed}")
+
+    session = ReplayRequests(entries)
+    artifacts.requests = session
+    get_scheduler().realtime = False
+    wrapper.token = "replay"
+
+    api = CharacterAPI(logger, "replay", character, role, seed)
+    tasks_dir = tempfile.mkdtemp(prefix="replay-")
+    copy_queue(TASKS_DB_PATH, tasks_dir)
+    setup_tasks(logger, character, role, api, tasks_dir)
+
+    # Only the requests the target makes count, not the start-up reads
+    served, server_seconds, cooldown_seconds = session.served, session.server_seconds, session.cooldown_seconds
+    started = time.perf_counter()
+    error = None
+    try:
+        if target == 'fill_orders':
+            fill_orders(api, role)
+        elif target == 'gear_up':
+            api.gear_up(api.catalog.monster(code))
+        else:
+            craft_item(api, api.get_item(code), quantity)
+    except (Exception, SystemExit) as e:
+        error = repr(e)
+        logger.info(f"Replay of {target} stopped: {error}")
+
+    return {
+        "target": target,
+        "decision_seconds": time.perf_counter() - started,
+        "recorded_server_seconds": session.server_seconds - server_seconds,
+        "recorded_cooldown_seconds": session.cooldown_seconds - cooldown_seconds,
+        "requests_served": session.served - served,
+        "misses": session.misses,
+        "error": error,
+    }
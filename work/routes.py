@@ -0,0 +1,118 @@
+from typing import List, Optional, Sequence, Tuple
+
+from work.maps import ContentKey, MapIndex, Position
+
+# Rounds of 2-opt and stop moves, routes here are a handful of stops
+MAX_PASSES = 8
+
+def distance(a: Position, b: Position) -> int:
+    """Move cooldown grows with the Manhattan distance between tiles."""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+def route_length(start: Position, tiles: Sequence[Position], end: Optional[Position] = None) -> int:
+    length = 0
+    current = start
+    for tile in tiles:
+        length += distance(current, tile)
+        current = tile
+    if end is not None:
+        length += distance(current, end)
+    return length
+
+def best_tiles(start: Position, layers: List[List[Position]], end: Optional[List[Position]] = None) -> Tuple[int, List[Position], Optional[Position]]:
+    """
+    Picks one tile per stop for a fixed visiting order, shortest overall.
+
+    A small dynamic programme over the candidate tiles, layer by layer.
+    Returns the length, the tile for each stop and the end tile.
+    """
+    costs = {start: (0, None)}
+    history = []
+    for layer in layers + ([end] if end else []):
+        step = {}
+        for tile in layer:
+            previous, (cost, _) = min(costs.items(), key=lambda entry: entry[1][0] + distance(entry[0], tile))
+            step[tile] = (cost + distance(previous, tile), previous)
+        history.append(step)
+        costs = step
+
+    tile, (length, _) = min(costs.items(), key=lambda entry: entry[1][0])
+    tiles = []
+    for step in reversed(history):
+        tiles.append(tile)
+        tile = step[tile][1]
+    tiles.reverse()
+    end_tile = tiles.pop() if end else None
+    return length, tiles, end_tile
+
+def plan_route(start: Position, stops: List[List[Position]], end: Optional[List[Position]] = None) -> Tuple[List[Tuple[int, Position]], Optional[Position]]:
+    """
+    Orders the stops for the shortest walk, picking one tile for each.
+
+    Builds a nearest-neighbour tour, then improves the order with 2-opt and
+    single stop moves until neither helps. Every order is costed with the
+    best tiles for it, so a stop with several tiles (banks, workshops)
+    uses whichever suits its neighbours.
+
+    Args:
+        start (Position): Where the character is.
+        stops (List[List[Position]]): Candidate tiles for each stop, any one of them will do.
+        end (List[Position]): Candidate tiles to finish on, e.g. every bank. None to end at the last stop.
+
+    Returns:
+        Tuple[List[Tuple[int, Position]], Optional[Position]]: (stop index, tile) in visiting order, and the end tile.
+    """
+    remaining = {index for index, tiles in enumerate(stops) if tiles}
+    order: List[int] = []
+    current = start
+    while remaining:
+        index, tile = min(((index, tile) for index in remaining for tile in stops[index]),
+                          key=lambda pair: distance(current, pair[1]))
+        order.append(index)
+        remaining.discard(index)
+        current = tile
+
+    def cost(candidate: List[int]) -> int:
+        return best_tiles(start, [stops[index] for index in candidate], end)[0]
+
+    best = cost(order)
+    for _ in range(MAX_PASSES):
+        improved = False
+
+        # 2-opt: reverse any stretch of the tour that makes it shorter
+        for i in range(len(order) - 1):
+            for j in range(i + 1, len(order)):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                length = cost(candidate)
+                if length < best:
+                    order, best, improved = candidate, length, True
+
+        # Or-opt: move a single stop to wherever it fits best
+        for i in range(len(order)):
+            for j in range(len(order)):
+                if i == j:
+                    continue
+                candidate = order[:i] + order[i + 1:]
+                candidate.insert(j, order[i])
+                length = cost(candidate)
+                if length < best:
+                    order, best, improved = candidate, length, True
+
+        if not improved:
+            break
+
+    _, tiles, end_tile = best_tiles(start, [stops[index] for index in order], end)
+    return list(zip(order, tiles)), end_tile
+
+def route(maps: MapIndex, start: Position, stops: List[ContentKey], end: Optional[ContentKey] = None) -> List[Tuple[ContentKey, Position]]:
+    """
+    Plans a walk through map content, e.g. every workshop then back to a bank.
+
+    Stops that are not on the map are left out. The end stop, if any, is the last entry.
+    """
+    visits, end_tile = plan_route(start, [maps.locations(*key) for key in stops],
+                                  maps.locations(*end) if end else None)
+    path = [(stops[index], tile) for index, tile in visits]
+    if end_tile is not None:
+        path.append((end, end_tile))
+    return path
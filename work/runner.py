@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from work.api import CharacterAPI
+from work.log import DATE_FORMAT, LOG_FORMAT
+from work.logic import process, setup_logic
+from work.scheduler import parse_timestamp
+from work.session import install_wrapper_session
+
+logger = logging.getLogger(__name__)
+
+# Supervised restarts wait RESTART_MIN_SECONDS after the first failure, doubling up to RESTART_MAX_SECONDS
+RESTART_MIN_SECONDS = 0.05
+RESTART_MAX_SECONDS = 60.0
+# A run at least this long was healthy, the next failure starts the backoff over
+HEALTHY_RUN_SECONDS = 300
+# Log lines written out with each failure, like baz.py's last 200 lines of output
+FAILURE_LINES = 200
+
+def parse_characters(value: str, default_role: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Parses "baz:fighter,baz1:crafter" into (character, role) pairs.
+
+    Entries without a role use default_role.
+    """
+    characters = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, role = entry.partition(":")
+        role = role or default_role
+        if not role:
+            raise ValueError(f"No role given for character {name}, use {name}:<role> or --role")
+        characters.append((name, role))
+    return characters
+
+class RecentLines(logging.Handler):
+    """Keeps a character's last records, only formatted if a failure writes them out."""
+    def __init__(self, capacity: int = FAILURE_LINES):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+    def drain(self) -> List[str]:
+        lines = [self.format(record) for record in list(self.records)]
+        self.records.clear()
+        return lines
+
+def restart_delay(failures: int) -> float:
+    """Seconds before the restart after this many failures in a row."""
+    return min(RESTART_MIN_SECONDS * 2 ** (failures - 1), RESTART_MAX_SECONDS)
+
+def record_failure(directory: str, name: str, error: BaseException, lines: List[str]):
+    """Appends the failure and the character's last log lines to <directory>/<name>.txt, as baz.py does."""
+    with open(os.path.join(directory, f"{name}.txt"), "a") as file:
+        file.write(f"{time.strftime(DATE_FORMAT)} - {name} failed: {error!r}\n")
+        file.write("".join(traceback.format_exception(error)))
+        file.write(f"{time.strftime(DATE_FORMAT)} - Program output (last {len(lines)} lines):\n")
+        for line in lines:
+            file.write(f"{line}\n")
+
+def _refresh(api: CharacterAPI):
+    # The failure may have cut an action short: reread the character, its cooldown and the bank
+    api.api.get_character()
+    if api.api.char.cooldown_expiration:
+        api.scheduler.set_ready_at(api.current_character, api.scheduler.to_local(parse_timestamp(api.api.char.cooldown_expiration)))
+    api.bank.invalidate()
+
+def _drive(character_logger: logging.Logger, token: str, api: CharacterAPI, name: str, role: str, restart: bool = False):
+    # Runs on the character's own worker thread, so its logic/task state stays separate
+    if restart:
+        _refresh(api)
+    setup_logic(character_logger, token, name, role, api)
+    process()
+
+async def run_character(token: str, name: str, role: str):
+    character_logger = logging.getLogger(f"{__name__}.{name}")
+    # Build the wrapper on the loop thread: it initialises its sqlite cache
+    # connection there, and the game data lookups go through the shared
+    # catalog afterwards so the worker thread never touches it.
+    api = CharacterAPI(character_logger, token, name, role)
+    character_logger.info(f"Starting {name} as {role}")
+    try:
+        await asyncio.to_thread(_drive, character_logger, token, api, name, role)
+    except (Exception, SystemExit) as e:
+        character_logger.error(f"{name} stopped: {e!r}")
+
+async def supervise_character(token: str, name: str, role: str, failure_dir: str = "."):
+    """
+    Runs a character and restarts it whenever it stops, exit() calls included.
+
+    Restarts back off exponentially from RESTART_MIN_SECONDS, and start over
+    once a run lasts HEALTHY_RUN_SECONDS. The character, its wrapper and every
+    shared cache (game data, bank mirror, map index, planners) are kept; only
+    the character's state is reread. Each failure and the character's last
+    FAILURE_LINES log lines are appended to <failure_dir>/<name>.txt. Failing
+    to build the character, e.g. with the API unreachable, is a failure like
+    any other and is retried the same way.
+    """
+    character_logger = logging.getLogger(f"{__name__}.{name}")
+    recent = RecentLines()
+    character_logger.addHandler(recent)
+    character_logger.info(f"Supervising {name} as {role}")
+    api: Optional[CharacterAPI] = None
+    failures = 0
+    while True:
+        started = time.monotonic()
+        try:
+            restart = api is not None
+            if api is None:
+                # On the loop thread like run_character: the wrapper's sqlite cache connection
+                # was opened there. An attempt holds up the loop for as long as it takes to fail.
+                api = CharacterAPI(character_logger, token, name, role)
+            await asyncio.to_thread(_drive, character_logger, token, api, name, role, restart)
+            error: BaseException = RuntimeError(f"{name} returned from its loop")
+        except (Exception, SystemExit) as e:
+            error = e
+        if time.monotonic() - started >= HEALTHY_RUN_SECONDS:
+            failures = 0
+        failures += 1
+        delay = restart_delay(failures)
+        character_logger.error(f"{name} stopped: {error!r}, restart {failures} in {delay:.2f}s")
+        await asyncio.to_thread(record_failure, failure_dir, name, error, recent.drain())
+        await asyncio.sleep(delay)
+
+async def run_characters(token: str, characters: List[Tuple[str, str]], supervise: bool = False, failure_dir: str = "."):
+    """
+    Runs every character in one process on one event loop.
+
+    The wrapper and the task code are synchronous, so each character's loop
+    is awaited on a dedicated worker thread. The characters share the HTTP
+    connection pool, the game data catalog, the map index and the bank mirror.
+    Supervised, a character that stops is restarted in place, see supervise_character.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=len(characters), thread_name_prefix="character"))
+    install_wrapper_session()
+    if supervise:
+        await asyncio.gather(*(supervise_character(token, name, role, failure_dir) for name, role in characters))
+    else:
+        await asyncio.gather(*(run_character(token, name, role) for name, role in characters))
+
+def main_loop(token: str, characters: List[Tuple[str, str]], supervise: bool = False, failure_dir: str = "."):
+    try:
+        asyncio.run(run_characters(token, characters, supervise, failure_dir))
+    except KeyboardInterrupt:
+        logger.info("Runner stopped.")
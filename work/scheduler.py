@@ -0,0 +1,114 @@
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+def parse_timestamp(value: str) -> float:
+    """Converts an API ISO 8601 timestamp to epoch seconds."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+class CooldownScheduler:
+    """
+    Tracks when each character comes off cooldown.
+
+    Ready times come from the `cooldown.expiration` of every action response,
+    shifted by the clock offset to the server. The offset is bounded by each
+    action's `started_at` against when the request was sent and its answer
+    received, and the tightest bounds seen are kept, so round trip time is not
+    added to the ready time. A character calls
+    wait_until_ready right before its next action, so whatever it decides in
+    between runs inside the cooldown and the action goes out at expiry
+    instead of bouncing off a 499.
+    """
+    def __init__(self):
+        self._ready: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Local clock minus server clock lies between these
+        self._offset_low = -math.inf
+        self._offset_high = math.inf
+        # Off when replaying a journal: cooldowns are tracked but never slept through
+        self.realtime = True
+
+    def set_ready_at(self, name: str, ready_at: float):
+        with self._lock:
+            self._ready[name] = ready_at
+
+    @property
+    def clock_offset(self) -> float:
+        """Seconds the local clock is ahead of the server's, 0 until an action has been timed."""
+        if math.isinf(self._offset_low) or math.isinf(self._offset_high):
+            return 0.0
+        return (self._offset_low + self._offset_high) / 2
+
+    def observe_clock(self, server_time: float, sent: float, received: float):
+        """
+        Narrows the clock offset with a server timestamp taken while a request was in flight.
+
+        The server stamped it after the request left and before the answer came
+        back, so the offset is at least sent - server_time and at most
+        received - server_time.
+        """
+        with self._lock:
+            low, high = sent - server_time, received - server_time
+            if low > self._offset_high or high < self._offset_low:
+                # The clocks drifted apart from what was seen before, start over
+                self._offset_low, self._offset_high = low, high
+            else:
+                self._offset_low = max(self._offset_low, low)
+                self._offset_high = min(self._offset_high, high)
+
+    def to_local(self, server_time: float) -> float:
+        """A server timestamp, in epoch seconds, on the local clock."""
+        return server_time + self.clock_offset
+
+    def set_ready_in(self, name: str, seconds: float):
+        self.set_ready_at(name, time.time() + seconds)
+
+    def update_from_cooldown(self, name: str, cooldown: Optional[Dict], sent: Optional[float] = None,
+                             received: Optional[float] = None) -> Optional[float]:
+        """
+        Records the ready time from a CooldownSchema dict. Returns the local ready time, if any.
+
+        Args:
+            sent (float): When the action's request was sent, to time the clock offset with started_at.
+            received (float): When its answer came back, now if not given.
+        """
+        if not cooldown or not cooldown.get("expiration"):
+            return None
+        if sent is not None and cooldown.get("started_at"):
+            self.observe_clock(parse_timestamp(cooldown["started_at"]), sent, received or time.time())
+        ready_at = self.to_local(parse_timestamp(cooldown["expiration"]))
+        self.set_ready_at(name, ready_at)
+        return ready_at
+
+    def update_from_response(self, name: str, response: Optional[Dict], sent: Optional[float] = None,
+                             received: Optional[float] = None) -> Optional[float]:
+        if not isinstance(response, dict):
+            return None
+        return self.update_from_cooldown(name, response.get("data", {}).get("cooldown"), sent, received)
+
+    def ready_at(self, name: str) -> float:
+        return self._ready.get(name, 0.0)
+
+    def remaining(self, name: str) -> float:
+        return max(self.ready_at(name) - time.time(), 0.0)
+
+    def wait_until_ready(self, name: str) -> float:
+        """Sleeps until the character's cooldown expires. Returns the seconds waited."""
+        remaining = self.remaining(name)
+        if remaining > 0 and self.realtime:
+            time.sleep(remaining)
+        return remaining
+
+_scheduler: Optional[CooldownScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> CooldownScheduler:
+    """Returns the process-wide scheduler shared by every character."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = CooldownScheduler()
+    return _scheduler
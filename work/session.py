@@ -0,0 +1,268 @@
+import logging
+import os
+import random
+import struct
+import threading
+import time
+import types
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from work.journal import ActionJournal, journal_entry
+
+# Enough keep-alive connections for five characters plus the odd game data read
+POOL_SIZE = 16
+
+# The account-wide limits, requests per second: actions, and everything else
+RATE_LIMITS = {"actions": 7.0, "data": 16.0}
+# Transient failures are retried this many times, backing off with full jitter
+RETRIES = 3
+BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Answers that say an action was not carried out, so it is safe to send again
+ACTION_RETRY_STATUSES = {429, 503}
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Returns the process-wide HTTP session, one keep-alive pool shared by every character."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average, in bursts of up to `burst`.
+
+    Shared by every thread in the process.
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Takes a token if there is one and returns 0, otherwise the seconds until there will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+_STATE = struct.Struct("<dd")
+
+class FileTokenBucket(TokenBucket):
+    """
+    The same bucket kept in a small file under an OS file lock, so that
+    character processes started separately, e.g. by baz.py, share one limit.
+    """
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        super().__init__(rate, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if not os.path.exists(path):
+            with open(path, "ab"):
+                pass
+
+    def _take(self) -> float:
+        with self._lock, open(self.path, "r+b") as f:
+            _lock_file(f)
+            try:
+                raw = f.read(_STATE.size)
+                # Wall clock, monotonic clocks are not comparable across processes
+                now = time.time()
+                tokens, updated = _STATE.unpack(raw) if len(raw) == _STATE.size else (self.burst, now)
+                tokens = min(self.burst, tokens + max(now - updated, 0.0) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                f.seek(0)
+                f.write(_STATE.pack(tokens, now))
+                f.flush()
+            finally:
+                _unlock_file(f)
+        return wait
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, _STATE.size)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, _STATE.size)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+_limiters: Dict[str, TokenBucket] = {}
+_limit_dir: Optional[str] = None
+_limiters_lock = threading.Lock()
+
+def share_rate_limits(directory: Optional[str]):
+    """
+    Keeps the rate limits in files under directory, shared with every process using the same one.
+
+    None keeps them in this process only. Call before the first request.
+    """
+    global _limit_dir
+    with _limiters_lock:
+        _limit_dir = directory
+        _limiters.clear()
+
+def get_limiter(kind: str) -> TokenBucket:
+    """Returns the account-wide bucket for 'actions' or 'data' requests."""
+    limiter = _limiters.get(kind)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(kind)
+            if limiter is None:
+                rate = RATE_LIMITS[kind]
+                if _limit_dir:
+                    limiter = FileTokenBucket(os.path.join(_limit_dir, f"rate_{kind}.bucket"), rate)
+                else:
+                    limiter = TokenBucket(rate)
+                _limiters[kind] = limiter
+    return limiter
+
+def request_kind(url: str) -> str:
+    return "actions" if "/action/" in urlsplit(url).path else "data"
+
+def backoff(attempt: int) -> float:
+    """Full jitter: anywhere up to the exponential delay for this attempt."""
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * 2 ** attempt))
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    try:
+        return min(float(response.headers.get("Retry-After", "")), MAX_BACKOFF_SECONDS)
+    except ValueError:
+        return None
+
+def send(method: str, url: str, rate_limited: bool = True, **kwargs) -> requests.Response:
+    """
+    Sends a request on the shared session, within the account's rate limits.
+
+    Connection failures, timeouts and 429/5xx answers are retried up to
+    RETRIES times with jittered backoff. Anything but a GET is only resent
+    when it never connected or was answered 429/503, otherwise it may have
+    happened.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Full URL.
+        rate_limited (bool): False for servers other than the game's, e.g. a local LLM.
+        **kwargs: Passed on to requests.Session.request.
+
+    Returns:
+        requests.Response: The last response, whatever its status.
+    """
+    limiter = get_limiter(request_kind(url)) if rate_limited else None
+    retry_statuses = RETRY_STATUSES if method.upper() == "GET" else ACTION_RETRY_STATUSES
+    for attempt in range(RETRIES + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # Anything but a GET may have reached the server, unless it never connected
+            retryable = method.upper() == "GET" or isinstance(e, requests.exceptions.ConnectTimeout)
+            if attempt == RETRIES or not retryable:
+                raise
+            delay = backoff(attempt)
+            logger.info(f"{method} {url} failed ({e!r}), retry {attempt + 1} in {delay:.2f}s")
+            time.sleep(delay)
+            continue
+        if response.status_code not in retry_statuses or attempt == RETRIES:
+            return response
+        delay = _retry_after(response) or backoff(attempt)
+        logger.info(f"{method} {url} answered {response.status_code}, retry {attempt + 1} in {delay:.2f}s")
+        time.sleep(delay)
+    return response
+
+class _PooledRequests:
+    """
+    Stands in for the `requests` module inside the wrapper.
+
+    The wrapper calls `requests.request(...)`, which opens a fresh session and
+    connection per call. Routing it through send() keeps the connections alive
+    across calls and characters, within the account's rate limits. With a
+    journal set, every request and its response is also appended to it.
+    """
+    def __init__(self, journal: Optional[ActionJournal] = None):
+        self.journal = journal
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def request(self, method, url, **kwargs):
+        started = time.time()
+        response = send(method, url, **kwargs)
+        if self.journal is not None:
+            self.journal.record(journal_entry(method, url, kwargs.get("json"), response, started, time.time() - started))
+        return response
+
+def install_wrapper_session(journal: Optional[ActionJournal] = None):
+    from artifactsmmo_wrapper import artifacts
+    if not isinstance(artifacts.requests, _PooledRequests):
+        artifacts.requests = _PooledRequests(journal)
+    elif journal is not None:
+        artifacts.requests.journal = journal
+
+def current_journal() -> Optional[ActionJournal]:
+    """The journal install_wrapper_session set, if any."""
+    from artifactsmmo_wrapper import artifacts
+    return getattr(artifacts.requests, "journal", None)
+
+def request(method, url, **kwargs):
+    """
+    Sends a request the way the wrapper's are sent, pooled, journalled or replayed.
+
+    Lets the typed client share whatever install_wrapper_session or a replay put in place.
+    """
+    from artifactsmmo_wrapper import artifacts
+    if isinstance(artifacts.requests, types.ModuleType):
+        return send(method, url, **kwargs)
+    return artifacts.requests.request(method, url, **kwargs)
+
+def set_api_base_url(url: str):
+    """Points the wrapper, and so every CharacterAPI built after this, at another server."""
+    from artifactsmmo_wrapper.config import config
+    config.api_base_url = url.rstrip("/")
@@ -1,56 +1,346 @@
-import requests
+import hashlib
+import json
 import logging
+import math
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
 from work.api import CharacterAPI
-import work
-import work.tasks
+from work.log import SKILLS
+from work.plans import ActionPlan, PlanError, compile_plan, task_functions
+from work.session import send
+
+LLM_URL = "http://localhost:11434/api/generate"
+LLM_MODEL = "llama3.2"
+# The actions the model is offered, any work.tasks call compile_plan accepts is allowed though
+ACTIONS = (
+    "work.tasks.craft_gear(self.api)",
+    "work.tasks.craft_orders(self.api)",
+    "work.tasks.gather_highest(self.api)",
+    "work.tasks.do_tasks(self.api)",
+    "work.tasks.recycle(self.api)",
+    "self.api.eat()",
+    "self.api.fight_xp()",
+    "self.api.deposit_all_inventory_to_bank()",
+)
+SAMPLE = "self.api.eat();work.tasks.craft_gear(self.api);self.api.fight_xp();"
+# Validated plans kept ready ahead of need
+PLAN_BUFFER = 2
+# Plans remembered per state signature
+PLAN_CACHE_SIZE = 64
+# Cycles a plan runs before a new one is asked for, unless a trigger retires it first
+PLAN_CYCLES = 5
+# Failed cycles in a row that retire a plan
+PLAN_FAILURES = 2
+# Generations that produce no plan, the model down or answering nonsense, back off from
+# PLAN_RETRY_SECONDS up to PLAN_RETRY_MAX_SECONDS, and after PLAN_ATTEMPTS the fallback runs
+PLAN_RETRY_SECONDS = 0.5
+PLAN_RETRY_MAX_SECONDS = 30.0
+PLAN_ATTEMPTS = 5
+# What the character does while the model gives no plan
+FALLBACK_PLAN = "self.api.fight_xp();self.api.deposit_all_inventory_to_bank()"
+# How long the batch planner waits for other characters after the first request, and how many it combines
+BATCH_WINDOW_SECONDS = 0.25
+BATCH_SIZE = 8
+
+logger = logging.getLogger(__name__)
+
+def call_local_llm(prompt: str, first_plan: bool = True) -> str:
+    """
+    Streams the model's answer.
+
+    Args:
+        prompt (str): The whole prompt.
+        first_plan (bool): Stop reading at the end of the first line of code, a
+            single plan is one line so whatever the model adds after it is never waited for.
+    """
+    logger.info(prompt)
+    payload = {
+        "model": LLM_MODEL,
+        "prompt": prompt,
+        "stream": True
+    }
+    # Kept-alive on the shared session, the local model is not under the game's rate limits
+    response = send("POST", LLM_URL, rate_limited=False, json=payload, stream=True)
+    response.raise_for_status()
+    text = ""
+    try:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            text += chunk.get("response", "")
+            if first_plan:
+                complete = text.split("\n")[:-1]
+                for end, line in enumerate(complete):
+                    if ";" in line:
+                        # Whatever the model started after the plan is not part of it
+                        return "\n".join(complete[:end + 1])
+            if chunk.get("done"):
+                break
+    finally:
+        response.close()
+    return text
+
+def plan_prompt(name: str, state: str) -> str:
+    return (
+        f"Actions: {';'.join(ACTIONS)};\n"
+        "Generate tasks to perform in order to become the world's greatest knight, who must be well-rounded.\n"
+        f"The character {name} is {state}.\n"
+        "ONLY generate executable code. Do NOT include explanations, comments, or any text other than code.\n"
+        "It should generate a single line of code including ONLY the given actions. Here is an example of valid output:\n"
+        f"{SAMPLE}"
+    )
+
+def batch_prompt(states: List[Tuple[str, str]]) -> str:
+    sections = "".join(f"Character {name}: {state}\n" for name, state in states)
+    return (
+        f"Actions: {';'.join(ACTIONS)};\n"
+        "Generate tasks to perform in order for each of these characters to become the world's greatest knight, who must be well-rounded.\n"
+        f"{sections}"
+        "ONLY generate executable code. Do NOT include explanations, comments, or any text other than code.\n"
+        "Generate one line per character, the character's name, a colon, then a single line of code including ONLY the given actions. "
+        "Here is an example of a valid line:\n"
+        f"{states[0][0]}: {SAMPLE}"
+    )
+
+_BATCH_LINE = re.compile(r"^[\s*`-]*([\w-]+)[`*]*\s*:\s*(.+?)[`\s]*$")
+
+def parse_batch(text: str) -> Dict[str, str]:
+    """The code line answered for each character name, from "name: code" lines."""
+    plans = {}
+    for line in text.splitlines():
+        match = _BATCH_LINE.match(line)
+        if match and match.group(1) not in plans:
+            plans[match.group(1)] = match.group(2)
+    return plans
+
+class BatchPlanner:
+    """
+    Asks the model for every waiting character's plan in one prompt.
+
+    Requests arriving within BATCH_WINDOW_SECONDS of the first are combined,
+    so the model processes the shared instructions once per batch instead of
+    once per character. A character whose line is missing from the answer, or
+    does not compile, is asked for again on its own.
+    """
+    def __init__(self, window: float = BATCH_WINDOW_SECONDS, max_batch: int = BATCH_SIZE):
+        self.window = window
+        self.max_batch = max_batch
+        self.functions = task_functions()
+        self._requests: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="smarty-planner", daemon=True)
+        self._thread.start()
+
+    def plan(self, name: str, state: str) -> ActionPlan:
+        """
+        Waits for the character's compiled plan.
+
+        Args:
+            name (str): The character, its answer is the line starting with this name.
+            state (str): The character's section of the prompt, see Smarty.describe_state.
+
+        Raises:
+            PlanError: The model's answer for the character did not compile, even asked on its own.
+        """
+        future = Future()
+        self._requests.put((name, state, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[str, str, Future]]):
+        answers: Dict[str, str] = {}
+        if len(batch) > 1:
+            try:
+                answers = parse_batch(call_local_llm(batch_prompt([(name, state) for name, state, _ in batch]), first_plan=False))
+                logger.info(f"Batch plan for {len(batch)} characters, {len(answers)} answered")
+            except Exception as e:
+                logger.info(f"Batch planning failed, asking each character on its own: {e!r}")
+        for name, state, future in batch:
+            try:
+                future.set_result(self._compile(name, state, answers.get(name)))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _compile(self, name: str, state: str, answer: Optional[str]) -> ActionPlan:
+        if answer is not None:
+            try:
+                return compile_plan(answer, self.functions)
+            except PlanError as e:
+                logger.info(f"Batch plan for {name} rejected, asking on its own: {e}")
+        return compile_plan(call_local_llm(plan_prompt(name, state)), self.functions)
+
+_batch_planner: Optional[BatchPlanner] = None
+_batch_planner_lock = threading.Lock()
+
+def get_batch_planner() -> BatchPlanner:
+    """Returns the process-wide batch planner every Smarty asks for plans."""
+    global _batch_planner
+    if _batch_planner is None:
+        with _batch_planner_lock:
+            if _batch_planner is None:
+                _batch_planner = BatchPlanner()
+    return _batch_planner
 
 class Smarty:
+    """
+    Lets a local LLM choose what the character does next.
+
+    The model's code is compiled once into an ActionPlan, never exec'd, and
+    the plan runs for PLAN_CYCLES cycles unless the character levels up, the
+    bank runs empty or the plan keeps failing. The next plan is generated on a
+    background thread while the current one runs, so generation hides behind
+    the actions' cooldowns, and goes through the batch planner so characters
+    asking at the same time share one prompt. Compiled plans wait in a small buffer, and the plan
+    used for a state is cached under that state's signature so a repeated state
+    skips generation.
+    """
     def __init__(self, logger: logging.Logger, character: CharacterAPI):
         self.api: CharacterAPI = character
         self.logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"smarty-{character.current_character}")
+        self._pending: Optional[Future] = None
+        self._ready: Deque[ActionPlan] = deque()
+        self._cache: "OrderedDict[Tuple, ActionPlan]" = OrderedDict()
+        self.plan: Optional[ActionPlan] = None
+        self.plan_signature: Optional[Tuple] = None
+        self.plan_level = 0
+        self.cycles_left = 0
+        # Generations in a row that gave no plan
+        self.generation_failures = 0
+        self._fallback = compile_plan(FALLBACK_PLAN)
+
+    def describe_state(self) -> str:
+        """The character's section of a planning prompt: level, skills and what the bank holds."""
+        char = self.api.api.char
+        skills = ", ".join(f"{skill} {getattr(char, f'{skill}_level', 0)}" for skill in SKILLS)
+        bank = self.api.bank.snapshot()
+        return f"level {char.level}, skills {skills}, {len(bank)} kinds of item in the bank"
 
-    def call_local_llm(self, prompt):
-        self.logger.info(prompt)
-        url = "http://localhost:11434/api/generate"
-        payload = {
-            "model": "llama3.2",
-            "prompt": prompt,
-            "stream": False
-        }
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()['response']
-        
-    def generate_instructions(self) -> str:
-        actions = """work.tasks.craft_gear(self.api);work.tasks.eat(self.api);work.tasks.gear_up(self.api);work.tasks.do_tasks(self.api);work.tasks.hunt_monsters(self.api);"""
-        sample = """work.tasks.eat(self.api);work.tasks.gear_up(self.api);work.tasks.hunt_monsters(self.api);"""
-
-        prompt = (
-            f"Actions: {actions}\n"
-            "Generate tasks to perform in order to become the world's greatest knight, who must be well-rounded.\n"
-            "ONLY generate executable code. Do NOT include explanations, comments, or any text other than code.\n"
-            "It should generate a single line of code including ONLY the given actions. Here is an example of valid output:\n"
-            f"{sample}"
-        )
-    
-        response = self.call_local_llm(prompt)
-        print(f"response: {response}")
-        return response
-
-    def execute_instructions(self, instructions: str):
-        """Executes the instructions generated by the model."""
+    def _generate_plan(self) -> Optional[ActionPlan]:
+        # Runs on the planning thread, the batch planner combines it with the other characters' requests
         try:
-            # Inject `self`, `work`, and `work.tasks` into the exec environment
-            exec_globals = {
-                "self": self,  # so `self.api` works
-                "work": work,  # so `work.tasks.whatever` works
-            }
-            exec(instructions, exec_globals)
+            return get_batch_planner().plan(self.api.current_character, self.describe_state())
+        except PlanError as e:
+            self.logger.info(f"Smarty rejected plan: {e}")
         except Exception as e:
-            print(f"Error executing instructions: {e}")
+            self.logger.info(f"Smarty planning failed: {e!r}")
+        return None
+
+    def request_plan(self):
+        """Starts generating a plan in the background, unless one is on the way or the buffer is full."""
+        if self._pending is not None and not self._pending.done():
+            return
+        self._collect()
+        if len(self._ready) < PLAN_BUFFER:
+            self._pending = self._executor.submit(self._generate_plan)
+
+    def _collect(self, wait: bool = False):
+        if self._pending is None or not (wait or self._pending.done()):
+            return
+        plan = self._pending.result()
+        self._pending = None
+        if plan:
+            self._ready.append(plan)
+            self.generation_failures = 0
+        else:
+            self.generation_failures += 1
+
+    def next_plan(self) -> ActionPlan:
+        """
+        A compiled plan, from the buffer if one is ready, otherwise waiting for generation.
+
+        Failed generations are retried with backoff; after PLAN_ATTEMPTS in a row
+        FALLBACK_PLAN is returned, while generation carries on in the background.
+        """
+        while True:
+            self._collect()
+            if self._ready:
+                return self._ready.popleft()
+            if self.generation_failures >= PLAN_ATTEMPTS:
+                self.logger.info(f"Smarty got no plan in {self.generation_failures} tries, falling back to {FALLBACK_PLAN}")
+                self.request_plan()
+                return self._fallback
+            if self.generation_failures:
+                time.sleep(min(PLAN_RETRY_SECONDS * 2 ** (self.generation_failures - 1), PLAN_RETRY_MAX_SECONDS))
+            self.request_plan()
+            self._collect(wait=True)
+
+    def state_signature(self) -> Tuple:
+        """
+        Level, role and a digest of the bank, the state a plan was chosen for.
+
+        Quantities count by order of magnitude, so trickling deposits do not make every state new.
+        """
+        bank = self.api.bank.snapshot()
+        digest = hashlib.blake2b(digest_size=8)
+        for code in sorted(bank):
+            digest.update(f"{code}:{int(math.log2(bank[code])) if bank[code] > 0 else 0};".encode())
+        return self.api.api.char.level, self.api.role, digest.hexdigest()
+
+    def retire_reason(self) -> Optional[str]:
+        """Why the current plan should be replaced, or None to keep running it."""
+        if self.plan is None:
+            return "no plan"
+        if self.cycles_left <= 0:
+            return f"ran {PLAN_CYCLES} cycles"
+        if self.api.api.char.level != self.plan_level:
+            return "level up"
+        if not self.api.bank.snapshot():
+            return "empty bank"
+        if self.plan.failures >= PLAN_FAILURES:
+            return f"failed {self.plan.failures} times in a row"
+        return None
 
+    def choose_plan(self):
+        signature = self.state_signature()
+        plan = self._cache.get(signature)
+        if plan is not None and plan is not self.plan:
+            self._cache.move_to_end(signature)
+            self.logger.info(f"Smarty reusing the plan for {signature}")
+        else:
+            plan = self.next_plan()
+            # The fallback is never remembered for a state, the model gets asked again next time
+            if plan is not self._fallback:
+                self._cache[signature] = plan
+                if len(self._cache) > PLAN_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        plan.failures = 0
+        self.plan = plan
+        self.plan_signature = signature
+        self.plan_level = self.api.api.char.level
+        self.cycles_left = PLAN_CYCLES
+        # The next plan generates while this one's actions are on cooldown
+        self.request_plan()
 
     def do_something_smart(self):
-        instructions = self.generate_instructions()
-        print(f"Generated Instructions:\n{instructions}")
-        self.execute_instructions(instructions)
+        """Runs one cycle of the current plan, choosing a new plan first if it has run its course."""
+        reason = self.retire_reason()
+        if reason is not None:
+            if self.plan is not None:
+                self.logger.info(f"Smarty retiring {self.plan}: {reason}")
+                if self.plan.failures >= PLAN_FAILURES:
+                    # Never reuse a plan that does not work
+                    self._cache.pop(self.plan_signature, None)
+            self.choose_plan()
+            self.logger.info(f"Smarty plan for {PLAN_CYCLES} cycles: {self.plan}")
+        self.cycles_left -= 1
+        self.plan.run(self.api, self.logger)
@@ -1,12 +1,41 @@
 import os
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
 
 # Define the file path
 TASKS_FILE_PATH = "C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\tasks.json"
+TASKS_DB_PATH = os.path.splitext(TASKS_FILE_PATH)[0] + ".db"
+
+def is_order(task) -> bool:
+    """Orders are {role, code, quantity} dicts, other entries are kept as they are."""
+    return isinstance(task, dict) and 'role' in task and 'code' in task
+
+def merge_order(tasks: List, task, front: bool = False):
+    """Adds task to the list, folding an order into the existing one for its role and code."""
+    if is_order(task):
+        quantity = task.get('quantity', 1)
+        for existing in tasks:
+            if is_order(existing) and existing['role'] == task['role'] and existing['code'] == task['code']:
+                existing['quantity'] = existing.get('quantity', 1) + quantity
+                return
+        task = {**task, 'quantity': quantity}
+    if front:
+        tasks.insert(0, task)
+    else:
+        tasks.append(task)
 
 class TaskQueue:
+    # Characters in the same process share one lock per file
+    _locks = {}
+    _locks_guard = threading.Lock()
+
     def __init__(self, file_path=TASKS_FILE_PATH):
         self.file_path = file_path
+        with TaskQueue._locks_guard:
+            self._lock = TaskQueue._locks.setdefault(os.path.abspath(file_path), threading.RLock())
         # Ensure the file exists
         if not os.path.exists(self.file_path):
             with open(self.file_path, "w") as file:
@@ -27,51 +56,315 @@ class TaskQueue:
             json.dump(tasks, file, indent=4)  # Serialize list of dictionaries to JSON
 
     def create_task(self, task):
-        tasks = self._read_tasks()
-        tasks.append(task)
-        self._write_tasks(tasks)
+        with self._lock:
+            tasks = self._read_tasks()
+            merge_order(tasks, task)
+            self._write_tasks(tasks)
         print(f"Task added: {task}")
 
+    def create_tasks(self, new_tasks: List, front: bool = False):
+        """Add several tasks with one write, at the end or the front of the queue."""
+        if not new_tasks:
+            return
+        with self._lock:
+            tasks = self._read_tasks()
+            for task in (reversed(new_tasks) if front else new_tasks):
+                merge_order(tasks, task, front)
+            self._write_tasks(tasks)
+        print(f"{len(new_tasks)} tasks added")
+
     def read_tasks(self):
         """Read and return all tasks in the queue."""
-        tasks = self._read_tasks()
+        with self._lock:
+            tasks = self._read_tasks()
         return tasks
 
     def update_task(self, task_index, new_task):
         """Update a task at a specific index."""
         if not isinstance(new_task, dict):
             raise ValueError("Task must be a dictionary.")
-        tasks = self._read_tasks()
-        if 0 < task_index <= len(tasks):
-            tasks[task_index - 1] = new_task
-            self._write_tasks(tasks)
+        with self._lock:
+            tasks = self._read_tasks()
+            if 0 < task_index <= len(tasks):
+                tasks[task_index - 1] = new_task
+                self._write_tasks(tasks)
+                print(f"Task {task_index} updated to: {json.dumps(new_task, indent=4)}")
+            else:
+                print(f"Invalid task index: {task_index}")
+
+    def delete_task(self, task_index):
+        """Delete a task at a specific index."""
+        with self._lock:
+            tasks = self._read_tasks()
+            if 0 < task_index <= len(tasks):
+                deleted_task = tasks.pop(task_index - 1)
+                self._write_tasks(tasks)
+                print(f"Task deleted: {json.dumps(deleted_task, indent=4)}")
+            else:
+                print(f"Invalid task index: {task_index}")
+
+    def delete_tasks(self, task_indexes: Iterable[int]):
+        """Delete the tasks at several indexes with one write."""
+        with self._lock:
+            tasks = self._read_tasks()
+            doomed = {index - 1 for index in task_indexes if 0 < index <= len(tasks)}
+            if doomed:
+                self._write_tasks([task for i, task in enumerate(tasks) if i not in doomed])
+                print(f"{len(doomed)} tasks deleted")
+
+    def delete_orders(self, role: str, code: str):
+        """Delete every task for the role and code."""
+        with self._lock:
+            tasks = self._read_tasks()
+            self._write_tasks([task for task in tasks if not (task.get('role') == role and task.get('code') == code)])
+
+    def claim_tasks(self, limit: int, roles: Optional[List[str]] = None, excluded_codes: Iterable[str] = (), first_role: Optional[str] = None) -> List[Dict]:
+        """
+        Takes up to limit units of one code off the queue.
+
+        The code is the one of the first order for any of the roles (any role
+        if roles is None) not in excluded_codes. Orders for first_role go
+        ahead of the others. Then units of that code are taken whatever their
+        role, partly filled orders keep the rest of their quantity.
+
+        Returns:
+            List[Dict]: The claimed orders, each with the quantity taken from it.
+        """
+        with self._lock:
+            tasks = self._read_tasks()
+            ranked = sorted((task for task in tasks if is_order(task)), key=lambda task: task['role'] != first_role)
+            excluded = set(excluded_codes)
+            code = next((task['code'] for task in ranked
+                         if task['code'] not in excluded and (roles is None or task['role'] in roles)), None)
+            if code is None:
+                return []
+            claimed = []
+            for task in ranked:
+                if task['code'] != code or limit <= 0:
+                    continue
+                taken = min(task.get('quantity', 1), limit)
+                claimed.append({**task, 'quantity': taken})
+                task['quantity'] = task.get('quantity', 1) - taken
+                limit -= taken
+            self._write_tasks([task for task in tasks if not is_order(task) or task['quantity'] > 0])
+        return claimed
+
+    def delete_entry(self, entry):
+        """Delete a specific entry."""
+        with self._lock:
+            tasks = self._read_tasks()
+            for i in range(len(tasks)):
+                if tasks[i] == entry:
+                    deleted_task = tasks.pop(i)
+                    self._write_tasks(tasks)
+                    print(f"Task deleted: {json.dumps(deleted_task, indent=4)}")
+                    return
+
+    def clear_tasks(self):
+        """Clear all tasks from the queue."""
+        with self._lock:
+            self._write_tasks([])
+        print("All tasks have been cleared.")
+
+class SqliteTaskQueue:
+    """
+    TaskQueue on a SQLite database instead of a JSON file.
+
+    The database runs in WAL mode so the character processes can read while
+    one writes, and every change is a short transaction on the rows it
+    touches instead of a rewrite of the whole file. Entries keep their
+    insertion order, so the 1-based indexes mean the same as in TaskQueue.
+    Orders are one row per role and code carrying a quantity.
+    """
+    def __init__(self, db_path=TASKS_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        created = not os.path.exists(db_path)
+        self._connection = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                role TEXT,
+                code TEXT,
+                quantity INTEGER NOT NULL DEFAULT 1,
+                entry TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS tasks_code ON tasks (code);
+        """)
+        self._merge_unit_rows()
+        json_path = os.path.splitext(db_path)[0] + ".json"
+        if created and os.path.exists(json_path):
+            # Carry over whatever was queued in the JSON file
+            self.create_tasks(TaskQueue(json_path).read_tasks())
+
+    def _merge_unit_rows(self):
+        # Databases from before quantities held one row per unit
+        with self._transaction() as connection:
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(tasks)")]
+            if 'quantity' not in columns:
+                connection.execute("ALTER TABLE tasks ADD COLUMN quantity INTEGER NOT NULL DEFAULT 1")
+                connection.execute("""
+                    UPDATE tasks SET quantity = (
+                        SELECT COUNT(*) FROM tasks AS unit WHERE unit.role = tasks.role AND unit.code = tasks.code)
+                    WHERE role IS NOT NULL""")
+                connection.execute("""
+                    DELETE FROM tasks WHERE role IS NOT NULL AND id NOT IN (
+                        SELECT MIN(id) FROM tasks WHERE role IS NOT NULL GROUP BY role, code)""")
+                connection.execute("DROP INDEX IF EXISTS tasks_role_code")
+            connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS tasks_role_code_unique ON tasks (role, code)")
+
+    @staticmethod
+    def _row(task):
+        if is_order(task):
+            entry = {key: value for key, value in task.items() if key != 'quantity'}
+            return task['role'], task['code'], task.get('quantity', 1), json.dumps(entry)
+        if isinstance(task, dict):
+            return None, task.get('code'), 1, json.dumps(task)
+        return None, task, 1, json.dumps(task)
+
+    @staticmethod
+    def _task(role, quantity, entry):
+        task = json.loads(entry)
+        if role is not None:
+            task['quantity'] = quantity
+        return task
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so a read-then-write
+        # cannot interleave with another process doing the same
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _id_at(self, task_index) -> Optional[int]:
+        if task_index < 1:
+            return None
+        row = self._connection.execute("SELECT id FROM tasks ORDER BY id LIMIT 1 OFFSET ?", (task_index - 1,)).fetchone()
+        return row[0] if row else None
+
+    def create_task(self, task):
+        self.create_tasks([task])
+        print(f"Task added: {task}")
+
+    def create_tasks(self, tasks: List, front: bool = False):
+        """
+        Add several tasks in one transaction, at the end or the front of the queue.
+
+        An order for a role and code already queued adds to its quantity and keeps its place.
+        """
+        if not tasks:
+            return
+        upsert = " ON CONFLICT (role, code) DO UPDATE SET quantity = quantity + excluded.quantity"
+        with self._transaction() as connection:
+            if front:
+                # Ids below the current first one, in the order given
+                first = connection.execute("SELECT COALESCE(MIN(id), 1) FROM tasks").fetchone()[0]
+                connection.executemany("INSERT INTO tasks (id, role, code, quantity, entry) VALUES (?, ?, ?, ?, ?)" + upsert,
+                                       [(first - len(tasks) + i, *self._row(task)) for i, task in enumerate(tasks)])
+            else:
+                connection.executemany("INSERT INTO tasks (role, code, quantity, entry) VALUES (?, ?, ?, ?)" + upsert,
+                                       [self._row(task) for task in tasks])
+
+    def read_tasks(self):
+        """Read and return all tasks in the queue."""
+        with self._lock:
+            return [self._task(*row) for row in self._connection.execute("SELECT role, quantity, entry FROM tasks ORDER BY id")]
+
+    def update_task(self, task_index, new_task):
+        """Update a task at a specific index."""
+        if not isinstance(new_task, dict):
+            raise ValueError("Task must be a dictionary.")
+        with self._transaction() as connection:
+            task_id = self._id_at(task_index)
+            if task_id is not None:
+                connection.execute("UPDATE tasks SET role = ?, code = ?, quantity = ?, entry = ? WHERE id = ?", (*self._row(new_task), task_id))
+        if task_id is not None:
             print(f"Task {task_index} updated to: {json.dumps(new_task, indent=4)}")
         else:
             print(f"Invalid task index: {task_index}")
 
     def delete_task(self, task_index):
         """Delete a task at a specific index."""
-        tasks = self._read_tasks()
-        if 0 < task_index <= len(tasks):
-            deleted_task = tasks.pop(task_index - 1)
-            self._write_tasks(tasks)
-            print(f"Task deleted: {json.dumps(deleted_task, indent=4)}")
-        else:
-            print(f"Invalid task index: {task_index}")
+        self.delete_tasks([task_index])
+
+    def delete_tasks(self, task_indexes: Iterable[int]):
+        """Delete the tasks at several indexes in one transaction."""
+        indexes = sorted(set(task_indexes))
+        with self._transaction() as connection:
+            ids = [row[0] for row in connection.execute("SELECT id FROM tasks ORDER BY id")]
+            doomed = [(ids[index - 1],) for index in indexes if 0 < index <= len(ids)]
+            connection.executemany("DELETE FROM tasks WHERE id = ?", doomed)
+        print(f"{len(doomed)} tasks deleted")
+
+    def delete_orders(self, role: str, code: str):
+        """Delete the order for the role and code, whatever its quantity."""
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM tasks WHERE role = ? AND code = ?", (role, code))
+
+    def claim_tasks(self, limit: int, roles: Optional[List[str]] = None, excluded_codes: Iterable[str] = (), first_role: Optional[str] = None) -> List[Dict]:
+        """
+        Takes up to limit units of one code off the queue, atomically.
+
+        Same choice as TaskQueue.claim_tasks. Two characters claiming at
+        once never get the same units.
+        """
+        excluded = list(excluded_codes)
+        query = "SELECT code FROM tasks WHERE role IS NOT NULL"
+        parameters = []
+        if roles is not None:
+            query += f" AND role IN ({','.join('?' * len(roles))})"
+            parameters.extend(roles)
+        if excluded:
+            query += f" AND code NOT IN ({','.join('?' * len(excluded))})"
+            parameters.extend(excluded)
+        query += " ORDER BY role IS NOT ?, id LIMIT 1"
+        parameters.append(first_role)
+
+        claimed = []
+        with self._transaction() as connection:
+            row = connection.execute(query, parameters).fetchone()
+            if row is None:
+                return []
+            for task_id, role, quantity, entry in connection.execute(
+                    "SELECT id, role, quantity, entry FROM tasks WHERE role IS NOT NULL AND code = ? ORDER BY role IS NOT ?, id",
+                    (row[0], first_role)).fetchall():
+                if limit <= 0:
+                    break
+                taken = min(quantity, limit)
+                claimed.append(self._task(role, taken, entry))
+                limit -= taken
+                if taken < quantity:
+                    connection.execute("UPDATE tasks SET quantity = ? WHERE id = ?", (quantity - taken, task_id))
+                else:
+                    connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        return claimed
 
     def delete_entry(self, entry):
-        """Delete a specific entry."""
-        tasks = self._read_tasks()
-        for i in range(len(tasks)):
-            if tasks[i] == entry:
-                deleted_task = tasks.pop(i)
-                self._write_tasks(tasks)
-                print(f"Task deleted: {json.dumps(deleted_task, indent=4)}")
-                return
+        """Delete a specific entry. For an order, take its quantity off the queued one."""
+        with self._transaction() as connection:
+            if is_order(entry):
+                connection.execute("UPDATE tasks SET quantity = quantity - ? WHERE role = ? AND code = ?",
+                                   (entry.get('quantity', 1), entry['role'], entry['code']))
+                deleted = connection.execute("DELETE FROM tasks WHERE role = ? AND code = ? AND quantity <= 0",
+                                             (entry['role'], entry['code'])).rowcount
+            else:
+                deleted = connection.execute(
+                    "DELETE FROM tasks WHERE id = (SELECT id FROM tasks WHERE entry = ? ORDER BY id LIMIT 1)", (json.dumps(entry),)).rowcount
+        if deleted:
+            print(f"Task deleted: {json.dumps(entry, indent=4)}")
 
     def clear_tasks(self):
         """Clear all tasks from the queue."""
-        self._write_tasks([])
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM tasks")
         print("All tasks have been cleared.")
 
 # Example usage
@@ -1,71 +1,80 @@
-import random
+import os
 from time import sleep
 from typing import Dict, List
 from work.api import CharacterAPI
 from artifactsmmo_wrapper.subclasses import Item, Monster, Resource
-from work.task_queue import TaskQueue
-
-logger = None
-api = CharacterAPI
-character: str
-resources: List[Dict]
-task_queue: TaskQueue
-m_role: str
-current_orders = TaskQueue
-banned_orders = TaskQueue
-
-def setup_tasks(m_logger, m_character, role, m_api):
-    global logger, api, character, task_queue, m_role, current_orders, banned_orders
-    logger = m_logger
-    character = m_character
-    m_role = role
-    api = m_api
-    task_queue = TaskQueue()
-    current_orders = TaskQueue(f"C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\current_orders_{m_character}.json")
-    banned_orders = TaskQueue(f"C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\banned_orders_{m_character}.json")
-    current_orders.clear_tasks()
-    banned_orders.clear_tasks()
+from work.task_queue import SqliteTaskQueue, TaskQueue
+from work.checkpoint import Checkpoint
+from work.local import Bound, CharacterLocal
+from work.log import REQUIREMENTS
+from work.planner import CRAFT, FIGHT, GATHER, CraftPlan, PlanStep
+
+CRAFT_SKILLS = ['weaponcrafting', 'gearcrafting', 'jewelrycrafting', 'cooking', 'alchemy', 'mining', 'woodcutting']
+
+# Each character thread binds its own logger and queues in setup_tasks
+_local = CharacterLocal()
+logger = Bound(_local, 'logger')
+task_queue: SqliteTaskQueue = Bound(_local, 'task_queue')
+current_orders: TaskQueue = Bound(_local, 'current_orders')
+banned_orders: TaskQueue = Bound(_local, 'banned_orders')
+checkpoint: Checkpoint = Bound(_local, 'checkpoint')
+
+def setup_tasks(m_logger, m_character, role, m_api, tasks_dir: str = None):
+    _local.logger = m_logger
+    _local.character = m_character
+    _local.m_role = role
+    _local.api = m_api
+    _local.ordered_item_task = False
+    _local.craft_depth = 0
+    if tasks_dir:
+        # A separate queue and order files, e.g. for a journal replay
+        _local.task_queue = SqliteTaskQueue(os.path.join(tasks_dir, "tasks.db"))
+        _local.current_orders = TaskQueue(os.path.join(tasks_dir, f"current_orders_{m_character}.json"))
+        _local.banned_orders = TaskQueue(os.path.join(tasks_dir, f"banned_orders_{m_character}.json"))
+        _local.checkpoint = Checkpoint(os.path.join(tasks_dir, f"checkpoint_{m_character}.json"))
+    else:
+        _local.task_queue = SqliteTaskQueue()
+        _local.current_orders = TaskQueue(f"C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\current_orders_{m_character}.json")
+        _local.banned_orders = TaskQueue(f"C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\banned_orders_{m_character}.json")
+        _local.checkpoint = Checkpoint(f"C:\\Users\\sarah\\Desktop\\code\\artifacts\\work\\tasks\\checkpoint_{m_character}.json")
+    m_api.checkpoint = _local.checkpoint
+    if not checkpoint.warm:
+        # A cold start: the orders and bans are from a run too long ago to pick up
+        current_orders.clear_tasks()
+        banned_orders.clear_tasks()
+
+def resume(character: CharacterAPI):
+    """
+    Picks up what the checkpoint says the character was doing when it stopped.
+
+    Claimed orders go back to the front of the queue, it is not known how far
+    filling them got, and an interrupted craft is started again without
+    ordering its materials a second time.
+    """
+    claims = checkpoint.get('claims')
+    if claims:
+        logger.info(f"resume: returning claimed orders {claims}")
+        task_queue.create_tasks(claims, front=True)
+        checkpoint.save(claims=None)
+    craft = checkpoint.get('craft')
+    if craft:
+        checkpoint.save(craft=None)
+        logger.info(f"resume: crafting {craft['quantity']} {craft['code']}")
+        craft_item(character, character.get_item(craft['code']), craft['quantity'], ordered=True)
 
 def fill_orders(character: CharacterAPI, role: str):
     character.unequip('weapon')
     character.deposit_all_inventory_to_bank()
-    tasks = task_queue.read_tasks()
     logger.info(f"Fill orders for {role}")
-    
-    # Sort tasks so that 'crafter' roles come first. This will unlock crafters faster
-    sorted_tasks = sorted(tasks, key=lambda x: x.get('role') == 'crafter', reverse=True)
 
-    chosen_tasks = []
-    chosen_code = None
-    tasks_to_delete = []  # Track indices to remove after processing
+    # Claim as many units of one code as the inventory holds, 'crafter' orders first. This will unlock crafters faster
     banned_tasks = banned_orders.read_tasks()
-
-    for index, task in enumerate(sorted_tasks, start=1):
-        task_role = task.get('role', None)
-        task_code = task.get('code', '')
-
-        if not chosen_tasks:
-            # First matching task — lock in the code and role
-            if task_code in banned_tasks:
-                continue
-            match = role == task_role
-            if match or role == 'forager' or role == 'tasker' or role == 'crafter' or role == 'support':
-                logger.info(f'first banned tasks: {banned_tasks}, code {task_code}')
-                chosen_tasks.append(task)
-                chosen_code = task_code
-                tasks_to_delete.append(index)
-        else:
-            # Only collect tasks with the same role+code
-            if task_code == chosen_code:
-                chosen_tasks.append(task)
-                tasks_to_delete.append(index)
-
-        if len(chosen_tasks) >= 10:
-            break
-
-    # Delete tasks after iteration, in **reverse order** so indexes remain valid
-    for index in reversed(tasks_to_delete):
-        task_queue.delete_task(index)
+    roles = None if role in ('forager', 'tasker', 'crafter', 'support') else [role]
+    space = max(character.api.char.get_inventory_space(), 1)
+    chosen_tasks = task_queue.claim_tasks(space, roles, banned_tasks, first_role='crafter')
+    chosen_code = chosen_tasks[0].get('code') if chosen_tasks else None
+    if chosen_tasks:
+        checkpoint.save(claims=chosen_tasks)
 
     if not chosen_tasks:
         # Fallback behavior if no tasks found
@@ -102,29 +111,33 @@ def fill_orders(character: CharacterAPI, role: str):
             craft_support(character)
     else:
         # Perform the gathered tasks
-        task_count = len(chosen_tasks)
-        logger.info(f"Filling order for {chosen_code} - {task_count} tasks")
+        task_count = sum(task.get('quantity', 1) for task in chosen_tasks)
+        logger.info(f"Filling order for {chosen_code} - {task_count} units")
         if not gather(character, chosen_code, task_count):
             logger.info(f'cannot gather {chosen_code}!, re-insert tasks')
             banned_orders.create_task(chosen_code)
             logger.info(f'banned tasks after add: {banned_orders.read_tasks()}')
-            for task in chosen_tasks:
-                task_queue.create_task(task)
+            task_queue.create_tasks(chosen_tasks)
+        checkpoint.save(claims=None)
     return True
 
 def craft_support(character: CharacterAPI):
     # TODO: choose items based on baz level, but our crafters are not high enough level!
     items = ['earth_boost_potion','air_boost_potion','fire_boost_potion','water_boost_potion','minor_health_potion']
-    item = character.get_item(random.choice(items))
+    item = character.get_item(character.rng.choice(items))
     craft_item(character, item, 10)
 
 def hunt(character: CharacterAPI, monster_code: str):
-    x,y = character.find_closest_content('monster',monster_code)
-    monster = character.api.monsters.get(monster_code)
+    monster = character.catalog.monster(monster_code)
     character.gear_up(monster)
+    path = character.plan_route([('monster', monster_code)], ('bank','bank'))
+    if not path or path[0][0] != ('monster', monster_code):
+        logger.info(f"hunt cannot find {monster_code} on the map")
+        return
+    _, (x,y) = path[0]
     character.move_character(x,y)
     character.fight(25)
-    x,y = character.find_closest_content('bank','bank')
+    _, (x,y) = path[-1]
     character.move_character(x,y)
 
 def recycle(character: CharacterAPI):
@@ -132,7 +145,7 @@ def recycle(character: CharacterAPI):
     x,y = character.find_closest_content('bank','bank')
     character.move_character(x,y)
     contents = character.get_bank_contents()
-    found_something = False
+    pending = []
     for bankitem in contents:
         existing_quantity = bankitem.get('quantity',1)
         if existing_quantity <= 5:
@@ -148,18 +161,34 @@ def recycle(character: CharacterAPI):
         skills = ['weaponcrafting', 'gearcrafting', 'jewelrycrafting']
         if skill not in skills:
             continue
+        pending.append((item.code, skill))
 
-        quantity = character.withdraw_all_but_5(item.code, contents)
-        if quantity == 0:
-            logger.info(f"{character.api.char.name} got {quantity} {item.code} to recycle, skipping")
-            continue
-        else:
-            logger.info(f"{character.api.char.name} got {quantity} {item.code} to recycle")
-        shop_x,shop_y = character.find_closest_content('workshop',skill)
-        character.move_character(shop_x,shop_y)
-        character.recycle(item.code,quantity)
-        x,y = character.find_closest_content('bank','bank')
-        character.move_character(x,y)
+    found_something = False
+    while pending:
+        # Take out as much as fits, then recycle it all in one walk through the workshops
+        taken = {}
+        while pending:
+            code, skill = pending[0]
+            quantity = character.withdraw_all_but_5(code)
+            if quantity == 0 and taken:
+                break
+            pending.pop(0)
+            if quantity == 0:
+                logger.info(f"{character.api.char.name} got {quantity} {code} to recycle, skipping")
+                continue
+            logger.info(f"{character.api.char.name} got {quantity} {code} to recycle")
+            taken[code] = (skill, quantity)
+        if not taken:
+            break
+
+        workshops = sorted({skill for skill, _ in taken.values()})
+        for (content_type, content_code), (x, y) in character.plan_route([('workshop', skill) for skill in workshops], ('bank','bank')):
+            character.move_character(x,y)
+            if content_type != 'workshop':
+                continue
+            for code, (skill, quantity) in taken.items():
+                if skill == content_code:
+                    character.recycle(code,quantity)
         character.deposit_all_inventory_to_bank()
         found_something = True
     if not found_something:
@@ -170,7 +199,7 @@ def gather_highest(character: CharacterAPI, skill: str = None):
     skills = ['mining', 'woodcutting', 'fishing','alchemy']
     quantity = 10
     if not skill:
-        skill = random.choice(skills)
+        skill = character.rng.choice(skills)
     else:
         quantity = 50
 
@@ -209,8 +238,6 @@ def gather_highest(character: CharacterAPI, skill: str = None):
     character.deposit_all_inventory_to_bank()
 
 def craft_available(character: CharacterAPI, skill: str):
-    contents = character.get_bank_contents()
-
     item = choose_lowest_item(character, skill, 1)
     if not item:
         logger.info(f"craft_available cannot craft anything for {skill}, we are done")
@@ -224,7 +251,7 @@ def craft_available(character: CharacterAPI, skill: str):
 
     batch_size = int(space / space_per_item)
 
-    if has_requirements(character, item.code,  item.craft['items'], ordered=True, quantity=batch_size, contents=contents) != 0:
+    if not plan_craft(character, item, batch_size).ready:
         logger.info(f"{character.api.char.name} cannot get stuff to craft {batch_size} {item.code} currently, try later")
         return False
     
@@ -248,7 +275,7 @@ def craft_gear(character: CharacterAPI, skill: str = None, top: bool = False):
         quantity = 1
         if top:
             skills = ['weaponcrafting', 'gearcrafting', 'jewelrycrafting']
-            lowest_skill = random.choice(skills)
+            lowest_skill = character.rng.choice(skills)
             skill_level = character.get_skill_level(lowest_skill)
             lowest_choice_level = (skill_level // 5) * 5
             logger.info(f"craft_gear skill {lowest_skill} level {skill_level}, top craft level {lowest_choice_level}")
@@ -287,17 +314,15 @@ def craft_gear(character: CharacterAPI, skill: str = None, top: bool = False):
 
 def craft_orders(character: CharacterAPI, top: bool = False):
     orders = current_orders.read_tasks()
-    contents = character.get_bank_contents()
     for code in orders:
         item = character.get_item(code)
         logger.info(f"craft_orders craft order {item}")
-        if item and item.craft and has_requirements(character, item.code, item.craft['items'], ordered=True, contents=contents) == 0:
+        if item and item.craft and has_requirements(character, item.code, item.craft['items'], ordered=True) == 0:
             logger.info(f"craft_orders enough to go craft order {code}")
             logger.info(f"craft_orders requirements met, go craft {code}")
             skill = item.craft['skill']
             shop_x,shop_y = character.find_closest_content('workshop',skill)
             character.move_character(shop_x, shop_y)
-            character.move_character(shop_x,shop_y)
             xp = character.craft(item.code,1)
             logger.info(f"craft_orders craft item result {xp}")
             x,y = character.find_closest_content('bank','bank')
@@ -309,6 +334,21 @@ def craft_orders(character: CharacterAPI, top: bool = False):
     recycle(character)
 
 def craft_item(character: CharacterAPI, item: Item, quantity: int = 1, ordered: bool = False, return_to_bank: bool = True):
+    # Only the outermost craft is checkpointed, resuming it redoes whatever it needed crafted.
+    # A craft that raises stays in the checkpoint for a restart, unless the caller carries on, see ActionPlan.run
+    depth = _local.craft_depth
+    if depth == 0:
+        checkpoint.save(craft={'code': item.code, 'quantity': quantity})
+    _local.craft_depth = depth + 1
+    try:
+        result = _craft_item(character, item, quantity, ordered, return_to_bank)
+    finally:
+        _local.craft_depth = depth
+    if depth == 0:
+        checkpoint.save(craft=None)
+    return result
+
+def _craft_item(character: CharacterAPI, item: Item, quantity: int, ordered: bool, return_to_bank: bool):
     logger.info(f"craft_item craft {quantity} {item}")
     code = item.code
     craft = item.craft
@@ -322,50 +362,81 @@ def craft_item(character: CharacterAPI, item: Item, quantity: int = 1, ordered:
         logger.info(f"craft_item {item.code} is too high level {item_level} for me at {skill_level}")
         return False
 
-    requirements = craft.get('items',{})
     bank_x,bank_y=character.find_closest_content('bank','bank')
     character.move_character(bank_x,bank_y)
     character.deposit_all_inventory_to_bank()
 
-    need_something = has_requirements(character,item.code, requirements, ordered, quantity)
-    if need_something == 2:
-        logger.info(f"craft_item Cannot craft {code}, bailing")
+    plan = plan_craft(character, item, quantity)
+    if not plan.feasible:
+        logger.info(f"craft_item Cannot craft {code}, blocked on {plan.blocked}, bailing")
         return False
-
-    logger.info(f"craft_item Need something to craft {code}: {need_something}")
-
-    while need_something != 0:
-        fill_orders(character, m_role)
-        need_something = has_requirements(character, item.code,requirements, True, quantity)
-        logger.info(f"craft_item Still need something to craft {code}: {need_something}")
+    logger.info(f"craft_item plan for {quantity} {code}: {plan.totals()}")
+
+    if not plan.ready and not ordered:
+        for step in plan.of(GATHER) + plan.of(FIGHT):
+            role = 'fighter' if step.action == FIGHT else _local.m_role
+            if character.get_item(step.code).craft:
+                # Above our skill, a forager crafts it when filling the order
+                role = 'forager'
+            task_queue.create_task({"role": role, "code": step.code, "quantity": step.quantity})
+
+    while not plan.ready:
+        fill_orders(character, _local.m_role)
+        plan = plan_craft(character, item, quantity)
+        if not plan.feasible:
+            logger.info(f"craft_item Cannot craft {code} any more, blocked on {plan.blocked}")
+            return False
+        logger.info(f"craft_item Still need something to craft {code}: {plan.of(GATHER) + plan.of(FIGHT)}")
 
     logger.info(f"craft_item requirements met, go craft {code}")
-    skill = craft['skill']
-    shop_x,shop_y = character.find_closest_content('workshop',skill)
-    character.move_character(shop_x, shop_y)
-    character.move_character(shop_x,shop_y)
-    xp = character.craft(item.code,quantity)
+    xp = 0
+    for step in plan.of(CRAFT):
+        xp = craft_step(character, step, return_to_bank or step.code != code)
+        if xp == -1:
+            break
     logger.info(f"craft_item craft item result {xp}")
-    if return_to_bank:
-        character.move_character(bank_x,bank_y)
-        character.deposit_to_bank(item.code, quantity)
     return xp != -1
 
-def has_requirements(character: CharacterAPI, item_code: str, requirements, ordered: bool, quantity: int = 1, contents: List[Dict] = None):
+def plan_craft(character: CharacterAPI, item: Item, quantity: int) -> CraftPlan:
+    """Plans crafting quantity of item against the bank, with this character's crafting skills."""
+    character.get_bank_contents()
+    skills = {skill: character.get_skill_level(skill) for skill in CRAFT_SKILLS}
+    return character.planner.plan(item.code, quantity, character.bank.snapshot(), skills)
+
+def craft_step(character: CharacterAPI, step: PlanStep, return_to_bank: bool = True):
+    """Withdraws, crafts and deposits one craft step, in batches that fit the inventory."""
+    space_per_craft = sum(quantity for _, quantity in step.requirements)
+    remaining = step.quantity
+    xp = 0
+    while remaining > 0:
+        space = character.api.char.get_inventory_space()
+        batch_size = max(min(space // space_per_craft, remaining), 1)
+        bank_x,bank_y = character.find_closest_content('bank','bank')
+        character.move_character(bank_x,bank_y)
+        for code, quantity in step.requirements:
+            if not character.withdraw_from_bank(code, quantity * batch_size):
+                logger.info(f"craft_step not enough {code} to craft {step.code}")
+                return -1
+        shop_x,shop_y = character.find_closest_content('workshop',step.skill)
+        character.move_character(shop_x, shop_y)
+        xp = character.craft(step.code,batch_size)
+        if xp == -1:
+            return -1
+        remaining -= batch_size
+        if return_to_bank or remaining > 0:
+            character.move_character(bank_x,bank_y)
+            character.deposit_all_inventory_to_bank()
+    return xp
+
+def has_requirements(character: CharacterAPI, item_code: str, requirements, ordered: bool, quantity: int = 1):
     need_something = 0
-    if contents:
-        bank_contents = contents
-    else:
-        bank_contents = character.get_bank_contents()
     for requirement in requirements:
         required_quantity = requirement['quantity'] * quantity
-        logger.info(f"has_requirements check for {required_quantity} {requirement['code']}")
-        found = False
-        for item in bank_contents:
-            if requirement['code'] == item['code'] and item['quantity'] >= required_quantity:
-                logger.info(f"has_requirements Already have {required_quantity} enough {requirement['code']} to craft {item_code}")
-                found = True
-        if not found:
+        logger.info("has_requirements check for %s %s", required_quantity, requirement['code'], extra=REQUIREMENTS)
+        found = character.bank_quantity(requirement['code']) >= required_quantity
+        if found:
+            logger.info("has_requirements Already have %s enough %s to craft %s", required_quantity, requirement['code'], item_code, extra=REQUIREMENTS)
+        else:
             logger.info(f"has_requirements not enough {requirement['code']}")
             need_something = 1
             if not ordered:
@@ -379,7 +450,7 @@ def has_requirements(character: CharacterAPI, item_code: str, requirements, orde
         for requirement in requirements:
             required_quantity = requirement['quantity'] * quantity
             if (character.withdraw_from_bank(requirement['code'],required_quantity)):
-                logger.info(f"has_requirements Withdrew {required_quantity} {requirement['code']} to craft")
+                logger.info("has_requirements Withdrew %s %s to craft", required_quantity, requirement['code'], extra=REQUIREMENTS)
             else:
                 logger.info(f"has_requirements not enough {requirement['code']}")
                 need_something = 1
@@ -404,8 +475,7 @@ def order_items(character: CharacterAPI, item_code: str, quantity: int):
     
     # raw wolf meat is mislabeled!
     if subtype == 'mob' or item_code == 'raw_wolf_meat' or item_code == 'milk_bucket' or item_code == 'raw_beef':
-        for index in range(quantity):
-            task_queue.create_task({"role":"fighter","code": item_code})
+        task_queue.create_task({"role":"fighter","code": item_code, "quantity": quantity})
         return True
     
     if item.craft is not None:
@@ -424,8 +494,7 @@ def order_items(character: CharacterAPI, item_code: str, quantity: int):
             
             if not craft_item(character, item, current_batch):
                 logger.info(f"order_items cannot craft {item_code}")
-                for _ in range(quantity):  
-                    task_queue.create_task({"role": "forager", "code": item_code})
+                task_queue.create_task({"role": "forager", "code": item_code, "quantity": quantity})
                 return False
             
             quantity -= current_batch
@@ -433,8 +502,7 @@ def order_items(character: CharacterAPI, item_code: str, quantity: int):
         logger.info(f"Successfully crafted the full requested amount of {item_code}")
         return True
 
-    for index in range(quantity):
-        task_queue.create_task({"role":m_role,"code": item_code})
+    task_queue.create_task({"role":_local.m_role,"code": item_code, "quantity": quantity})
     return True
 
 def choose_lowest_item(character: CharacterAPI, skill: str, lowest_skill: int = 1) -> Item:
@@ -445,29 +513,25 @@ def choose_lowest_item(character: CharacterAPI, skill: str, lowest_skill: int =
     
     # Get all craftable items at or below the character's skill level
     craftable_items = []
-    items = character.all_items()
+    items = character.catalog.craftable_with(skill)
     banned_tasks = banned_orders.read_tasks()
 
-    logger.info(f"there are {len(items)} items in total")
+    logger.info(f"there are {len(items)} {skill} items in total")
     for item in items:
         item: Item
-        craft = item.craft
-
-        if craft:
-            if craft.get("skill") == skill:
-                item_level = craft.get("level")
-                if item_level > skill_level:
-                    continue
+        item_level = item.craft.get("level")
+        if item_level > skill_level:
+            continue
 
-                if item_level < lowest_skill:
-                    continue
+        if item_level < lowest_skill:
+            continue
 
-                if item.code in banned_tasks:
-                    logger.info(f"skip {item.code}, banned")
-                    continue
+        if item.code in banned_tasks:
+            logger.info(f"skip {item.code}, banned")
+            continue
 
-                logger.info(f"craft item {item.code} level {item_level}, my skill level {skill_level}")
-                craftable_items.append(item)
+        logger.info(f"craft item {item.code} level {item_level}, my skill level {skill_level}")
+        craftable_items.append(item)
 
     if not craftable_items:
         logger.info(f'choose_lowest_item cannot craft anything for {skill}')
@@ -475,10 +539,12 @@ def choose_lowest_item(character: CharacterAPI, skill: str, lowest_skill: int =
         return None
 
     # Exclude items already in current_orders
+    ordered_codes = set(current_orders.read_tasks())
+    banned_codes = set(banned_tasks)
     valid_items = [
         item for item in craftable_items
-        if item.code not in current_orders.read_tasks()
-        and item.code not in banned_orders.read_tasks()
+        if item.code not in ordered_codes
+        and item.code not in banned_codes
         and item.code not in ['wooden_stick']
     ]
 
@@ -486,7 +552,7 @@ def choose_lowest_item(character: CharacterAPI, skill: str, lowest_skill: int =
         logger.warning(f"No valid items to craft for {skill} after filtering")
         return None
 
-    chosen_item = random.choice(valid_items)
+    chosen_item = character.rng.choice(valid_items)
 
     if chosen_item:
         current_orders.create_task(chosen_item.code)
@@ -568,16 +634,17 @@ def gather(character: CharacterAPI, item_code: str, quantity: int, return_to_ban
             logger.info(f"{character} cannot withdrew rod, do not equip")
 
     logger.info(f"find resource drop for {item_code}")
-    x,y,success = find_resource_drop(character,item_code)
-    if not success:
+    path = find_resource_drop(character, item_code, return_to_bank)
+    if not path:
         logger.info(f"cannot find {item_code}")
         banned_orders.create_task(item_code)
         return False
 
+    _, (x,y) = path[0]
     character.move_character(x,y)
     result = character.gather(quantity)
     if return_to_bank:
-        x,y = character.find_closest_content('bank','bank')
+        _, (x,y) = path[-1]
         character.move_character(x,y)
         character.unequip('weapon')
         character.deposit_all_inventory_to_bank()
@@ -585,7 +652,7 @@ def gather(character: CharacterAPI, item_code: str, quantity: int, return_to_ban
 
 def choose_random_resource(character: CharacterAPI, skill: str, skill_level: int):
     # Find all resources matching the skill
-    skill_resources = character.api.resources.get(skill=skill)
+    skill_resources = character.catalog.resources_for_skill(skill)
     logger.info(f"choose_random_resource skill resources {skill_resources}, my skill {skill_level}")
 
     # Find all resources below the skill level
@@ -604,47 +671,53 @@ def choose_random_resource(character: CharacterAPI, skill: str, skill_level: int
     logger.info(f"choose_random_resource closest resources {closest_resources}")
 
     # Randomly choose from the closest resources
-    chosen_resource = random.choice(closest_resources)
+    chosen_resource = character.rng.choice(closest_resources)
 
     logger.info(f"choose_random_resource heading down to the ol {chosen_resource.code}, level {chosen_resource.level}")
     return character.find_closest_content('resource', chosen_resource.code)
 
-def find_resource_drop(character: CharacterAPI, item_code: str):
-    resources = character.api.resources.get(drop=item_code)
+def find_resource_drop(character: CharacterAPI, item_code: str, return_to_bank: bool = False):
+    """Plans the walk to a resource dropping item_code, and on to a bank if returning there."""
+    resources = character.catalog.resources_dropping(item_code)
     if resources and len(resources) > 0:
         resource = resources[0]
         logger.info(f"resource {resource.code} drops {item_code}")
-        x,y = character.find_closest_content('resource',resource.code)
-        return x,y,True
-    return None, None, False
+        path = character.plan_route([('resource', resource.code)], ('bank','bank') if return_to_bank else None)
+        if path and path[0][0] == ('resource', resource.code):
+            return path
+    return []
 
 def hunt_for_items(character, item_code, quantity):
-    monsters = character.api.monsters.get(drop=item_code)
-    for monster in monsters:
-        monster: Monster
+    monsters = []
+    for monster in character.catalog.monsters_dropping(item_code):
         x,y = character.find_closest_content('monster',monster.code)
         if (x, y) != (None, None):
             logger.info(f"monster {monster.code} is on the map")
+            monsters.append(monster)
         else:
             logger.info(f"monster {monster.code} is not on the map")
+    if not monsters:
+        logger.info(f"no monster on the map drops {item_code}")
+        return False
+
+    # Predict every candidate up front, losing fights are not worth the walk
+    predictions = character.predict_fights(monsters)
+    for monster, prediction in sorted(zip(monsters, predictions), key=lambda pair: -pair[1].win_probability):
+        monster: Monster
+        if not prediction.winnable:
+            logger.info(f"cannot beat {monster.code} to get {item_code}: {prediction}")
             continue
 
-        drops = monster.drops
-        if drops:
-            for drop in drops:
-                if drop.code == item_code:
-                    character.gear_up(monster)
-                    x,y = character.find_closest_content('monster',monster.code)
-                    if (x, y) != (None, None):
-                        character.move_character(x,y)
-                        character.rest()
-                        if not character.fight_drop(quantity, item_code):
-                            logger.info(f"cannot fight to get {item_code}")
-                            return False
-                        return True
-                    else:
-                        logger.info(f"cannot find monster on map")
-                        return False
+        if not character.gear_up(monster).winnable:
+            logger.info(f"cannot fight to get {item_code}, {monster.code} still looks like a loss")
+            continue
+        x,y = character.find_closest_content('monster',monster.code)
+        character.move_character(x,y)
+        character.rest()
+        if not character.fight_drop(quantity, item_code):
+            logger.info(f"cannot fight to get {item_code}")
+            return False
+        return True
     return False
 
 def do_tasks(character: CharacterAPI, fight_tasker: bool = False):
@@ -666,7 +739,7 @@ def handle_monsters_task(character: CharacterAPI, task_data: Dict):
     while combats > 0:
         x,y = character.find_closest_content('bank','bank')
         character.move_character(x,y)
-        monster = character.api.monsters.get(code=task_data['code'])
+        monster = character.catalog.monster(task_data['code'])
         character.gear_up(monster)
 
         # Find the closest monster and move to its location
@@ -680,9 +753,7 @@ def handle_monsters_task(character: CharacterAPI, task_data: Dict):
     character.move_character(x, y)
     character.complete_task()
 
-ordered_item_task = False
 def handle_items_task(character: CharacterAPI, task_data: Dict):
-    global ordered_item_task
     logger.info(f"Handling items task: {task_data}")
     
     # Check if 'progress' key exists in task_data
@@ -703,10 +774,10 @@ def handle_items_task(character: CharacterAPI, task_data: Dict):
             logger.info(f"Got {current_batch} from the bank, go exchange")
         else:
             if not gather(character, task_data['code'], current_batch, return_to_bank=False):
-                if not ordered_item_task:
+                if not _local.ordered_item_task:
                     logger.info(f"handle_items_task cannot gather {task_data['code']}, ordering")
                     order_items(character, task_data['code'], quantity)
-                    ordered_item_task = True
+                    _local.ordered_item_task = True
                 return
         
         x, y = character.find_closest_content('tasks_master','items')
@@ -715,7 +786,7 @@ def handle_items_task(character: CharacterAPI, task_data: Dict):
         
         quantity -= current_batch
 
-    ordered_item_task = False
+    _local.ordered_item_task = False
     x, y = character.find_closest_content('tasks_master','items')
     character.move_character(x, y)
     character.complete_task()
@@ -728,13 +799,14 @@ def trade_coins(character: CharacterAPI):
     character.deposit_all_inventory_to_bank()
     quantity = character.withdraw_all('tasks_coin')
     if quantity > 6:
-        x, y = character.find_closest_content('tasks_master','items')
+        path = character.plan_route([('tasks_master','items')], ('bank','bank'))
+        _, (x, y) = path[0]
         character.move_character(x, y)
         while quantity >= 6:
             character.exchange_task_coins()
             quantity -= 6
-    x,y = character.find_closest_content('bank','bank')
-    character.move_character(x,y)
+        _, (x, y) = path[-1]
+        character.move_character(x,y)
     character.deposit_all_inventory_to_bank()
     
 
@@ -1,13 +1,18 @@
 import json
 import os
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from collections import defaultdict
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# The order queue lives in SQLite, reuse the bot's own access to it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from work.task_queue import SqliteTaskQueue
+
 # File paths
-TASKS_FILE = "tasks.json"
+TASKS_FILE = "tasks.db"
 BANNED_ORDER_FILES = [
     "banned_orders_baz.json",
     "banned_orders_baz1.json",
@@ -68,14 +73,63 @@ class AddTaskDialog(tk.Toplevel):
             self.app.add_task(role, code)
             self.destroy()
 
+# How long to wait for the writes to settle before refreshing
+REFRESH_DEBOUNCE_MS = 250
+
+def file_signature(file):
+    """(mtime, size) of the file, and of its WAL for the SQLite queue. None if missing."""
+    signature = []
+    for path in (file, file + "-wal") if file.endswith(".db") else (file,):
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+def order_rows(orders):
+    """Treeview rows for a list of orders: iid to values, duplicates numbered."""
+    rows = {}
+    for order in orders:
+        order_text = order if isinstance(order, str) else json.dumps(order)
+        iid = order_text
+        count = 1
+        while iid in rows:
+            count += 1
+            iid = f"{order_text}#{count}"
+        rows[iid] = (order_text,)
+    return rows
+
+def sync_tree(tree, rendered, rows):
+    """
+    Brings a Treeview from the rows it shows to the new ones (iid to values, in order).
+
+    Only rows that appeared, vanished or changed are touched, and the order is
+    fixed with a single call, so a 10k row list that changed by one order
+    costs a couple of Tk calls rather than a rebuild.
+    """
+    gone = [iid for iid in rendered if iid not in rows]
+    if gone:
+        tree.delete(*gone)
+    for iid, values in rows.items():
+        if iid not in rendered:
+            tree.insert("", tk.END, iid=iid, values=values)
+        elif rendered[iid] != values:
+            tree.item(iid, values=values)
+    # New rows went in at the end, reorder only if that is not where they belong
+    children = [iid for iid in rendered if iid in rows] + [iid for iid in rows if iid not in rendered]
+    if children != list(rows):
+        tree.set_children("", *rows)
+
 # File watcher to refresh UI on file changes
 class FileWatcher(FileSystemEventHandler):
     def __init__(self, app):
         self.app = app
 
     def on_modified(self, event):
-        if event.src_path.endswith(".json"):
-            self.app.refresh_data()
+        # Runs on the watchdog thread: only note the file, the Tk thread does the rest
+        if event.src_path.endswith((".json", ".db", ".db-wal")):
+            self.app.mark_dirty(os.path.basename(event.src_path))
 
 # Main Application
 class TaskManagerApp:
@@ -87,19 +141,27 @@ class TaskManagerApp:
         # Bind the closing event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # Store frame references
-        self.banned_frame = None
-        self.current_frame = None
+        # Files changed since the last refresh, filled from the watchdog thread
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._refresh_pending = False
+        self._signatures = {}
 
         # Load data
-        self.tasks = load_json(TASKS_FILE)
-        self.banned_orders = {file: load_json(file) for file in BANNED_ORDER_FILES}
-        self.current_orders = {file: load_json(file) for file in CURRENT_ORDER_FILES}
+        self.task_queue = SqliteTaskQueue(TASKS_FILE)
+        self.tasks = []
+        self.banned_orders = {file: [] for file in BANNED_ORDER_FILES}
+        self.current_orders = {file: [] for file in CURRENT_ORDER_FILES}
+        self.order_trees = {}
+        # Rows each tree shows, to diff the next refresh against
+        self.rendered = {}
 
         # Create sections
         self.create_tasks_section()
         self.create_banned_orders_section()
         self.create_current_orders_section()
+        for file in [TASKS_FILE] + BANNED_ORDER_FILES + CURRENT_ORDER_FILES:
+            self.reload_file(file)
 
         # Start file watcher
         self.event_handler = FileWatcher(self)
@@ -114,214 +176,141 @@ class TaskManagerApp:
         # Close the application
         self.root.destroy()
 
+    def mark_dirty(self, file):
+        if file.endswith("-wal"):
+            file = file[:-len("-wal")]
+        with self._dirty_lock:
+            self._dirty.add(file)
+            if self._refresh_pending:
+                return
+            self._refresh_pending = True
+        # A burst of writes becomes one refresh once it has settled
+        self.root.after(REFRESH_DEBOUNCE_MS, self.refresh_data)
+
+    def create_tree(self, parent, columns, height=10):
+        frame = ttk.Frame(parent)
+        frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        tree = ttk.Treeview(frame, columns=columns, show="headings", height=height)
+        for column in columns:
+            tree.heading(column, text=column.capitalize())
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return tree
+
     def create_tasks_section(self):
         # Frame for tasks
         tasks_frame = ttk.LabelFrame(self.root, text="Tasks", padding="10")
         tasks_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        # Add Task button (moved to the left)
-        add_button = ttk.Button(tasks_frame, text="Add Task", command=self.show_add_task_dialog)
-        add_button.pack(side=tk.LEFT, padx=5, pady=5)
-
-        # Canvas and scrollbar for tasks
-        self.tasks_canvas = tk.Canvas(tasks_frame)
-        self.tasks_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(tasks_frame, orient=tk.VERTICAL, command=self.tasks_canvas.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.tasks_canvas.configure(yscrollcommand=scrollbar.set)
-        self.tasks_canvas.bind("<Configure>", lambda e: self.tasks_canvas.configure(scrollregion=self.tasks_canvas.bbox("all")))
+        # Add and remove buttons on the left
+        buttons = ttk.Frame(tasks_frame)
+        buttons.pack(side=tk.LEFT, padx=5, pady=5)
+        ttk.Button(buttons, text="Add Task", command=self.show_add_task_dialog).pack(fill=tk.X)
+        ttk.Button(buttons, text="Remove", command=self.remove_selected_tasks).pack(fill=tk.X, pady=5)
 
-        # Frame inside canvas
-        self.tasks_inner_frame = ttk.Frame(self.tasks_canvas)
-        self.tasks_canvas.create_window((0, 0), window=self.tasks_inner_frame, anchor=tk.NW)
+        self.tasks_tree = self.create_tree(tasks_frame, ("role", "code", "quantity"))
 
-        # Render tasks
-        self.render_tasks()
+    def create_orders_section(self, title, files, remove):
+        frame = ttk.LabelFrame(self.root, text=title, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-    def create_banned_orders_section(self):
-        # Destroy the existing frame if it exists
-        if self.banned_frame is not None:
-            self.banned_frame.destroy()
-        
-        # Frame for banned orders
-        self.banned_frame = ttk.LabelFrame(self.root, text="Banned Orders", padding="10")
-        self.banned_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        # Create a horizontal panel for banned orders files
-        banned_panel = ttk.PanedWindow(self.banned_frame, orient=tk.HORIZONTAL)
-        banned_panel.pack(fill=tk.BOTH, expand=True)
-
-        for file, orders in self.banned_orders.items():
-            file_frame = ttk.Frame(banned_panel)
-            banned_panel.add(file_frame, weight=1)
-
-            # Label for file name
-            ttk.Label(file_frame, text=file).pack(pady=5)
-
-            # Canvas and scrollbar for banned orders
-            canvas = tk.Canvas(file_frame)
-            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Create a horizontal panel, one list per file
+        panel = ttk.PanedWindow(frame, orient=tk.HORIZONTAL)
+        panel.pack(fill=tk.BOTH, expand=True)
 
-            scrollbar = ttk.Scrollbar(file_frame, orient=tk.VERTICAL, command=canvas.yview)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for file in files:
+            file_frame = ttk.Frame(panel)
+            panel.add(file_frame, weight=1)
 
-            canvas.configure(yscrollcommand=scrollbar.set)
-            canvas.bind("<Configure>", lambda e, canvas=canvas: canvas.configure(scrollregion=canvas.bbox("all")))
+            # Label for file name, remove button for the selection
+            header = ttk.Frame(file_frame)
+            header.pack(fill=tk.X)
+            ttk.Label(header, text=file).pack(side=tk.LEFT, pady=5)
+            ttk.Button(header, text="−", width=3, command=lambda f=file: remove(f)).pack(side=tk.RIGHT)
 
-            # Frame inside canvas
-            inner_frame = ttk.Frame(canvas)
-            canvas.create_window((0, 0), window=inner_frame, anchor=tk.NW)
+            self.order_trees[file] = self.create_tree(file_frame, ("order",))
 
-            # Add orders with remove buttons
-            for order in orders:
-                frame = ttk.Frame(inner_frame)
-                frame.pack(fill=tk.X, pady=2)
-
-                # Order text (handle both string and dict types)
-                order_text = order if isinstance(order, str) else json.dumps(order)
-                ttk.Label(frame, text=order_text).pack(side=tk.LEFT, padx=5)
-
-                # Remove button
-                remove_button = ttk.Button(frame, text="−", command=lambda o=order, f=file: self.remove_banned_order(o, f))
-                remove_button.pack(side=tk.RIGHT)
+    def create_banned_orders_section(self):
+        self.create_orders_section("Banned Orders", BANNED_ORDER_FILES, self.remove_banned_orders)
 
     def create_current_orders_section(self):
-        # Destroy the existing frame if it exists
-        if self.current_frame is not None:
-            self.current_frame.destroy()
-                
-        # Frame for current orders
-        self.current_frame = ttk.LabelFrame(self.root, text="Current Orders", padding="10")
-        self.current_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        # Create a horizontal panel for current orders files
-        current_panel = ttk.PanedWindow(self.current_frame, orient=tk.HORIZONTAL)
-        current_panel.pack(fill=tk.BOTH, expand=True)
-
-        for file, orders in self.current_orders.items():
-            file_frame = ttk.Frame(current_panel)
-            current_panel.add(file_frame, weight=1)
-
-            # Label for file name
-            ttk.Label(file_frame, text=file).pack(pady=5)
-
-            # Canvas and scrollbar for current orders
-            canvas = tk.Canvas(file_frame)
-            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-            scrollbar = ttk.Scrollbar(file_frame, orient=tk.VERTICAL, command=canvas.yview)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-            canvas.configure(yscrollcommand=scrollbar.set)
-            canvas.bind("<Configure>", lambda e, canvas=canvas: canvas.configure(scrollregion=canvas.bbox("all")))
-
-            # Frame inside canvas
-            inner_frame = ttk.Frame(canvas)
-            canvas.create_window((0, 0), window=inner_frame, anchor=tk.NW)
-
-            # Add orders with remove buttons (like banned orders section)
-            for order in orders:
-                frame = ttk.Frame(inner_frame)
-                frame.pack(fill=tk.X, pady=2)
-
-                # Order text (handle both string and dict types)
-                order_text = order if isinstance(order, str) else json.dumps(order)
-                ttk.Label(frame, text=order_text).pack(side=tk.LEFT, padx=5)
-
-                # Remove button
-                remove_button = ttk.Button(frame, text="−", command=lambda o=order, f=file: self.remove_current_order(o, f))
-                remove_button.pack(side=tk.RIGHT)
+        self.create_orders_section("Current Orders", CURRENT_ORDER_FILES, self.remove_current_orders)
 
     def render_tasks(self):
-        # Clear existing tasks
-        for widget in self.tasks_inner_frame.winfo_children():
-            widget.destroy()
-
-        # Collapse duplicate tasks
-        task_counts = defaultdict(int)
-        for task in self.tasks:
-            key = f"{task['role']} - {task['code']}"
-            task_counts[key] += 1
-
-        # Add tasks to the inner frame
-        for task, count in task_counts.items():
-            frame = ttk.Frame(self.tasks_inner_frame)
-            frame.pack(fill=tk.X, pady=2)
+        # One row per order
+        rows = {}
+        for order in self.tasks:
+            rows[f"{order['role']} - {order['code']}"] = (order['role'], order['code'], str(order.get('quantity', 1)))
+        self.sync(self.tasks_tree, rows)
 
-            # Task text
-            task_text = f"{task} ({count})" if count > 1 else task
-            ttk.Label(frame, text=task_text).pack(side=tk.LEFT, padx=5)
+    def render_orders(self, file, orders):
+        self.sync(self.order_trees[file], order_rows(orders))
 
-            # Remove button
-            remove_button = ttk.Button(frame, text="−", command=lambda t=task: self.remove_task(t))
-            remove_button.pack(side=tk.RIGHT)
+    def sync(self, tree, rows):
+        sync_tree(tree, self.rendered.get(tree, {}), rows)
+        self.rendered[tree] = rows
 
     def show_add_task_dialog(self):
         AddTaskDialog(self.root, self)
 
     def add_task(self, role, code):
-        self.tasks.insert(0, {"role": role, "code": code})  # Add to top
-        self.render_tasks()
-        save_json(TASKS_FILE, self.tasks)
+        self.task_queue.create_tasks([{"role": role, "code": code, "quantity": 1}], front=True)  # Add to top
+        self.reload_file(TASKS_FILE)
 
     def remove_task(self, task):
         # Extract role and code from the task string
         role, code = task.split(" - ")
-        self.tasks = [t for t in self.tasks if not (t["role"] == role and t["code"] == code)]
-        self.render_tasks()
-        save_json(TASKS_FILE, self.tasks)
-
-    def remove_banned_order(self, order, file):
-        try:
-            # Remove the order from the list
-            self.banned_orders[file].remove(order)
-            # Save the updated list to the file
-            save_json(file, self.banned_orders[file])
-        except ValueError:
-            # Handle case where item might be represented differently (e.g., string vs dict)
-            order_str = json.dumps(order) if not isinstance(order, str) else order
-            for item in self.banned_orders[file]:
-                item_str = json.dumps(item) if not isinstance(item, str) else item
-                if item_str == order_str:
-                    self.banned_orders[file].remove(item)
-                    save_json(file, self.banned_orders[file])
-                    break
-        # Re-render the banned orders section
-        self.create_banned_orders_section()
-
-    def remove_current_order(self, order, file):
-        try:
-            # Remove the order from the list
-            self.current_orders[file].remove(order)
-            # Save the updated list to the file
-            save_json(file, self.current_orders[file])
-        except ValueError:
-            # Handle case where item might be represented differently (e.g., string vs dict)
-            order_str = json.dumps(order) if not isinstance(order, str) else order
-            for item in self.current_orders[file]:
-                item_str = json.dumps(item) if not isinstance(item, str) else item
-                if item_str == order_str:
-                    self.current_orders[file].remove(item)
-                    save_json(file, self.current_orders[file])
-                    break
-        # Re-render the current orders section
-        self.create_current_orders_section()
+        self.task_queue.delete_orders(role, code)
+
+    def remove_selected_tasks(self):
+        for task in self.tasks_tree.selection():
+            self.remove_task(task)
+        self.reload_file(TASKS_FILE)
+
+    def remove_orders(self, file, orders):
+        selected = self.order_trees[file].selection()
+        rows = order_rows(orders)
+        # Drop the selected rows, keeping the order and the duplicates of the rest
+        kept = [order for iid, order in zip(rows, orders) if iid not in selected]
+        if len(kept) != len(orders):
+            save_json(file, kept)
+        self.reload_file(file)
+
+    def remove_banned_orders(self, file):
+        self.remove_orders(file, self.banned_orders[file])
+
+    def remove_current_orders(self, file):
+        self.remove_orders(file, self.current_orders[file])
+
+    def reload_file(self, file):
+        """Re-reads one file if its mtime or size moved, and updates its list."""
+        signature = file_signature(file)
+        if self._signatures.get(file) == signature:
+            return
+        self._signatures[file] = signature
+
+        if file == TASKS_FILE:
+            self.tasks = self.task_queue.read_tasks()
+            self.render_tasks()
+        elif file in self.banned_orders:
+            self.banned_orders[file] = load_json(file)
+            self.render_orders(file, self.banned_orders[file])
+        elif file in self.current_orders:
+            self.current_orders[file] = load_json(file)
+            self.render_orders(file, self.current_orders[file])
 
     def refresh_data(self):
-        # Reload data from files
-        self.tasks = load_json(TASKS_FILE)
-        self.banned_orders = {file: load_json(file) for file in BANNED_ORDER_FILES}
-        self.current_orders = {file: load_json(file) for file in CURRENT_ORDER_FILES}
-
-        # Re-render UI
-        self.render_tasks()
-        self.create_banned_orders_section()
-        self.create_current_orders_section()
+        # Reload only the files written to since the last refresh
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+            self._refresh_pending = False
+        for file in dirty:
+            self.reload_file(file)
 
 # Run the application
 if __name__ == "__main__":
     root = tk.Tk()
     app = TaskManagerApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()